@@ -0,0 +1,66 @@
+import argparse
+import json
+import sys
+
+from models.batch_analyzer import BatchAnalyzer
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Find the best move of every position in a file of FEN lines."
+    )
+    parser.add_argument("depth", type=int, help="search depth in plies")
+    parser.add_argument(
+        "input",
+        nargs="?",
+        type=argparse.FileType("r"),
+        default=sys.stdin,
+        help="file with one FEN per line (default: stdin)",
+    )
+    parser.add_argument(
+        "-t", "--time-limit", type=float, help="seconds to search each position"
+    )
+    parser.add_argument(
+        "-n", "--node-limit", type=int, help="nodes to search each position"
+    )
+    parser.add_argument(
+        "-w", "--workers", type=int, default=1, help="worker processes (default: 1)"
+    )
+    parser.add_argument(
+        "-u",
+        "--unordered",
+        action="store_true",
+        help="print results as soon as they are done instead of in input order",
+    )
+    parser.add_argument(
+        "--json", action="store_true", help="print results as JSON lines"
+    )
+    args = parser.parse_args()
+
+    batch_analyzer = BatchAnalyzer(
+        args.depth,
+        args.time_limit,
+        args.node_limit,
+        args.workers,
+        is_ordered=not args.unordered,
+    )
+    for analysis in batch_analyzer.analyze(args.input):
+        if args.json:
+            print(json.dumps(analysis.to_dict()), flush=True)
+        elif analysis.error is not None:
+            print(
+                f"{analysis.index}: {analysis.fen}\n  error: {analysis.error}",
+                flush=True,
+            )
+        else:
+            print(
+                f"{analysis.index}: {analysis.fen}\n"
+                f"  move: {analysis.best_move}, score: {analysis.score:.2f}, "
+                f"depth: {analysis.depth}, nodes: {analysis.nodes}, "
+                f"time: {analysis.seconds:.3f}s",
+                flush=True,
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+import argparse
+import json
+import os
+
+from enums.parallel_mode import ParallelMode
+from models.perft import PERFT_POSITIONS
+from models.search_benchmark import SearchBenchmark
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Time a fixed depth search with different worker counts."
+    )
+    parser.add_argument("depth", type=int, help="search depth in plies")
+    parser.add_argument(
+        "-p",
+        "--position",
+        choices=list(PERFT_POSITIONS),
+        action="append",
+        help="position to run (repeatable, default: all)",
+    )
+    parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        action="append",
+        help="worker count to run (repeatable, default: 1 and the CPU count)",
+    )
+    parser.add_argument(
+        "-m",
+        "--mode",
+        choices=[mode.name.lower() for mode in ParallelMode],
+        default=ParallelMode.ROOT_SPLIT.name.lower(),
+        help="how workers share the search (default: root_split)",
+    )
+    parser.add_argument(
+        "-s",
+        "--stats",
+        action="store_true",
+        help="collect search statistics (cutoffs, table hits, branching factor)",
+    )
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    args = parser.parse_args()
+
+    worker_counts = args.workers or sorted({1, os.cpu_count() or 1})
+    parallel_mode = ParallelMode[args.mode.upper()]
+    results = [
+        SearchBenchmark.run(
+            position, args.depth, worker_counts, parallel_mode, args.stats
+        )
+        for position in args.position or PERFT_POSITIONS
+    ]
+
+    if args.json:
+        print(
+            json.dumps(
+                [
+                    result.to_dict()
+                    for position_results in results
+                    for result in position_results
+                ],
+                indent=2,
+            )
+        )
+        return
+
+    for position_results in results:
+        print(f"{position_results[0].position} (depth {position_results[0].depth})")
+        for result in position_results:
+            print(
+                f"  workers: {result.worker_count}, move: {result.best_move}, "
+                f"nodes: {result.nodes}, time: {result.seconds:.3f}s, "
+                f"speedup: {result.speedup:.2f}x"
+            )
+            depth_seconds = ", ".join(
+                f"{depth}: {seconds:.3f}s"
+                for depth, seconds in enumerate(result.depth_seconds, 1)
+            )
+            print(f"    time to depth: {depth_seconds}")
+            if result.stats is not None:
+                print(f"    stats: {json.dumps(result.stats)}")
+
+
+if __name__ == "__main__":
+    main()
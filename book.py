@@ -0,0 +1,75 @@
+import argparse
+
+from models.board import Board
+from models.opening_book import OpeningBook, OpeningBookBuilder
+from utils.move_utils import format_move
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Build an opening book or look up a position in one."
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    build_parser = subparsers.add_parser(
+        "build", help="build a book from PGN files and move lines"
+    )
+    build_parser.add_argument("output", help="book file to write")
+    build_parser.add_argument(
+        "--pgn",
+        action="append",
+        type=argparse.FileType("r"),
+        default=[],
+        help='PGN file with "rcrc" moves (repeatable)',
+    )
+    build_parser.add_argument(
+        "--lines",
+        action="append",
+        type=argparse.FileType("r"),
+        default=[],
+        help='file with one line of "rcrc" moves from the initial position per '
+        "line (repeatable)",
+    )
+    build_parser.add_argument(
+        "--max-plies",
+        type=int,
+        default=16,
+        help="plies of each game to add (default: 16)",
+    )
+    build_parser.add_argument(
+        "--min-weight",
+        type=int,
+        default=1,
+        help="times a move must be played to be kept (default: 1)",
+    )
+
+    probe_parser = subparsers.add_parser("probe", help="list the book moves of a FEN")
+    probe_parser.add_argument("book", help="book file to read")
+    probe_parser.add_argument("fen", help="position to look up")
+    args = parser.parse_args()
+
+    if args.command == "build":
+        builder = OpeningBookBuilder(args.max_plies)
+        game_count = 0
+        for file in args.pgn:
+            game_count += builder.add_pgn(file.read())
+        for file in args.lines:
+            for line in file:
+                if line.strip():
+                    builder.add_line(line.split())
+                    game_count += 1
+        record_count = builder.write(args.output, args.min_weight)
+        print(f"{record_count} moves from {game_count} games written")
+        return
+
+    board, color = Board.from_fen(args.fen)
+    with OpeningBook(args.book) as book:
+        entries = book.probe(board.get_position_key(color))
+    if not entries:
+        print("not in book")
+    for move, weight in entries:
+        print(f"{format_move(move)} {weight}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,2 +1,5 @@
 BOARD_SIZE = 8
 BOARD_LEN = 64
+FULL_MASK = (1 << BOARD_LEN) - 1
+FIRST_ROW_MASK = (1 << BOARD_SIZE) - 1
+LAST_ROW_MASK = FIRST_ROW_MASK << (BOARD_LEN - BOARD_SIZE)
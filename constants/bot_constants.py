@@ -1,2 +1,14 @@
 MIN_BOT_DEPTH = 1
 MAX_BOT_DEPTH = 5
+# Seconds per move the player can give the AI; the depth still caps the search.
+BOT_TIME_LIMITS = (1, 3, 10)
+TRANSPOSITION_TABLE_SIZE_MB = 16
+CHECKMATE_SCORE = 1_000_000
+# Tablebase wins score below checkmates found by the search, less the plies to
+# mate so faster wins are preferred.
+TABLEBASE_WIN_SCORE = CHECKMATE_SCORE - 1000
+# Opening book the game uses if it exists, built with book.py.
+OPENING_BOOK_PATH = "opening_book.bin"
+# Directory of endgame tables the game uses if it exists, built with
+# tablebase.py.
+TABLEBASE_DIRECTORY = "tablebases"
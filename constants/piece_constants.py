@@ -1 +1,11 @@
-PIECE_TYPE_COUNT = 12
\ No newline at end of file
+PIECE_TYPE_COUNT = 12
+COLOR_PIECE_TYPE_COUNT = 6
+# Stands for an empty square or a missing piece wherever pieces are indexed.
+NO_PIECE_INDEX = PIECE_TYPE_COUNT
+
+PAWN_INDEX = 0
+KNIGHT_INDEX = 1
+BISHOP_INDEX = 2
+ROOK_INDEX = 3
+QUEEN_INDEX = 4
+KING_INDEX = 5
@@ -12,6 +12,7 @@ from models.move_validator import MoveValidator
 from models.piece import Bishop, Knight, Queen, Rook
 from models.rules import Rules
 from utils.board_utils import get_mask
+from utils.move_utils import decode_move
 from views.board_view import BoardView
 from views.game_view import GameView
 
@@ -22,15 +23,19 @@ class GameController:
         self._bot_factory = bot_factory
         self._game_mode = GameMode.VS_PLAYER
         self._bot_depth = 0
+        self._bot_time_limit = None
         self._player_color = Color.WHITE
         self._bot = None
+        self._is_pondering = False
 
     def configure(self) -> None:
         self._game_mode = GameView.prompt_game_mode()
         if self._game_mode == GameMode.VS_BOT:
             self._bot_depth = GameView.prompt_bot_depth()
+            self._bot_time_limit = GameView.prompt_bot_time_limit()
             self._player_color = GameView.prompt_player_color()
-            self._bot = self._bot_factory.get_bot(self._bot_depth)
+            self._is_pondering = GameView.prompt_pondering()
+            self._bot = self._bot_factory.get_bot(self._bot_depth, self._bot_time_limit)
 
     def play(self) -> None:
         while self._game.status == GameStatus.ACTIVE:
@@ -61,6 +66,8 @@ class GameController:
 
             self._game._current_color = self._game._current_color.opposite
 
+        if self._bot is not None:
+            self._bot.stop_pondering()
         display_color = (
             self._game._current_color
             if self._game_mode == GameMode.VS_PLAYER
@@ -141,9 +148,16 @@ class GameController:
 
     def _take_bot_turn(self) -> None:
         assert isinstance(self._bot, Bot)
-        move = self._bot.calculate_best_move(
-            self._player_color.opposite, self._game._board
+        move = decode_move(
+            self._bot.calculate_best_move(
+                self._player_color.opposite, self._game._board
+            )
         )
         self._game.make_move(move)
         if Rules.can_promote(move):
             self._game._board._set_piece(Queen(move.color), move.to_square_mask)
+
+        # Search the player's likely reply while they think. If they play it,
+        # the next bot move is ready sooner; if not, the search is discarded.
+        if self._is_pondering:
+            self._bot.start_pondering(self._player_color, self._game._board)
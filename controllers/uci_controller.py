@@ -0,0 +1,244 @@
+import sys
+import threading
+from typing import TextIO
+
+from constants.bot_constants import CHECKMATE_SCORE, TABLEBASE_WIN_SCORE
+from enums.color import Color
+from models.board import Board
+from models.bot import Bot
+from models.rules import Rules
+from models.search_iteration import SearchIteration
+from models.tablebase import MAX_DISTANCE
+from utils.move_utils import format_uci_move
+
+_ENGINE_NAME = "AI Chess"
+_ENGINE_AUTHOR = "the AI Chess authors"
+
+# Depth of searches limited only by time, nodes or the stop command.
+_MAX_DEPTH = 64
+# Moves the remaining clock time is spread over when the GUI does not say.
+_DEFAULT_MOVES_TO_GO = 30
+# Most of the remaining clock time a single move may use.
+_MAX_TIME_FRACTION = 0.5
+# How often a stop is repeated until the search thread has finished.
+_STOP_POLL_SECONDS = 0.01
+
+_GO_OPTIONS = {
+    "depth",
+    "movetime",
+    "wtime",
+    "btime",
+    "winc",
+    "binc",
+    "movestogo",
+    "nodes",
+}
+
+
+class UciController:
+    """Play the bot over the UCI protocol, so GUIs and match runners such as
+    cutechess can drive it. Searches run in a background thread, so commands
+    like stop and isready are answered while one is in progress.
+
+    Moves use UCI notation, but the rules are still the engine's: a position
+    command stops at the first move they do not allow (such as castling or a
+    double pawn push) and reports it in an info string."""
+
+    def __init__(
+        self,
+        bot: Bot,
+        input_stream: TextIO = sys.stdin,
+        output_stream: TextIO = sys.stdout,
+    ) -> None:
+        self._bot = bot
+        self._input_stream = input_stream
+        self._output_stream = output_stream
+        self._output_lock = threading.Lock()
+        self._board = Board()
+        self._board.set_up_pieces()
+        self._color = Color.WHITE
+        self._search_thread: threading.Thread | None = None
+        # Set once an infinite search may report its best move.
+        self._stop_event = threading.Event()
+
+    def run(self) -> None:
+        """Handle commands until quit or the end of the input."""
+        self._bot.start_workers()
+        for line in self._input_stream:
+            if not self.handle_command(line):
+                break
+        self._stop_search()
+
+    def handle_command(self, line: str) -> bool:
+        """Handle one command and return False if it was quit. Unknown commands
+        are ignored, as the protocol asks."""
+        tokens = line.split()
+        if not tokens:
+            return True
+
+        command, arguments = tokens[0], tokens[1:]
+        match command:
+            case "uci":
+                self._send(f"id name {_ENGINE_NAME}")
+                self._send(f"id author {_ENGINE_AUTHOR}")
+                self._send("uciok")
+            case "isready":
+                self._send("readyok")
+            case "ucinewgame":
+                self._stop_search()
+                self._bot.new_game()
+            case "position":
+                self._stop_search()
+                self._set_position(arguments)
+            case "go":
+                self._stop_search()
+                self._go(arguments)
+            case "stop":
+                self._stop_search()
+            case "quit":
+                self._stop_search()
+                return False
+        return True
+
+    def _send(self, line: str) -> None:
+        with self._output_lock:
+            self._output_stream.write(line + "\n")
+            self._output_stream.flush()
+
+    def _set_position(self, arguments: list[str]) -> None:
+        if "moves" in arguments:
+            moves_index = arguments.index("moves")
+            position_arguments = arguments[:moves_index]
+            move_texts = arguments[moves_index + 1 :]
+        else:
+            position_arguments = arguments
+            move_texts = []
+
+        if position_arguments[:1] == ["startpos"]:
+            board = Board()
+            board.set_up_pieces()
+            color = Color.WHITE
+        elif position_arguments[:1] == ["fen"]:
+            try:
+                board, color = Board.from_fen(" ".join(position_arguments[1:]))
+            except ValueError as error:
+                self._send(f"info string {error}")
+                return
+        else:
+            return
+
+        for move_text in move_texts:
+            legal_moves = {
+                format_uci_move(move): move
+                for move in Rules.generate_legal_moves(color, board)
+            }
+            move = legal_moves.get(move_text)
+            if move is None:
+                self._send(f"info string Illegal move: {move_text}")
+                break
+
+            board.make_packed_move(move)
+            color = color.opposite
+        self._board = board
+        self._color = color
+
+    def _go(self, arguments: list[str]) -> None:
+        options = {}
+        for index, token in enumerate(arguments[:-1]):
+            if token in _GO_OPTIONS:
+                try:
+                    options[token] = int(arguments[index + 1])
+                except ValueError:
+                    pass
+        is_infinite = "infinite" in arguments
+
+        time_limit = None
+        if "movetime" in options:
+            time_limit = options["movetime"] / 1000
+        elif not is_infinite:
+            time_key, increment_key = (
+                ("wtime", "winc") if self._color == Color.WHITE else ("btime", "binc")
+            )
+            if time_key in options:
+                time_limit = self._get_time_limit(
+                    options[time_key],
+                    options.get(increment_key, 0),
+                    options.get("movestogo", _DEFAULT_MOVES_TO_GO),
+                )
+        self._bot.set_limits(
+            options.get("depth", _MAX_DEPTH), time_limit, options.get("nodes")
+        )
+
+        if not any(Rules.generate_legal_moves(self._color, self._board)):
+            self._send("bestmove 0000")
+            return
+
+        self._stop_event.clear()
+        self._search_thread = threading.Thread(
+            target=self._search,
+            args=(self._color, self._board, is_infinite),
+            daemon=True,
+        )
+        self._search_thread.start()
+
+    def _search(self, color: Color, board: Board, is_infinite: bool) -> None:
+        best_move = self._bot.calculate_best_move(
+            color, board, lambda iteration: self._send_info(color, iteration)
+        )
+        # An infinite search only reports its move once it is stopped.
+        if is_infinite:
+            self._stop_event.wait()
+        self._send(f"bestmove {format_uci_move(best_move)}")
+
+    def _stop_search(self) -> None:
+        """Stop the search, if any, and wait for its best move to be sent."""
+        if self._search_thread is None:
+            return
+
+        self._stop_event.set()
+        # A stop sent before the search thread started searching is reset by
+        # it, so it is repeated until the thread is done.
+        while self._search_thread.is_alive():
+            self._bot.stop()
+            self._search_thread.join(_STOP_POLL_SECONDS)
+        self._search_thread = None
+
+    def _send_info(self, color: Color, iteration: SearchIteration) -> None:
+        nodes = iteration.nodes + iteration.quiescence_nodes
+        nodes_per_second = int(nodes / iteration.seconds) if iteration.seconds else 0
+        score = iteration.score if color == Color.WHITE else -iteration.score
+        principal_variation = " ".join(
+            map(format_uci_move, iteration.principal_variation)
+        )
+        self._send(
+            f"info depth {iteration.depth} "
+            f"score {self._format_score(score, len(iteration.principal_variation))} "
+            f"nodes {nodes} nps {nodes_per_second} "
+            f"time {int(iteration.seconds * 1000)} pv {principal_variation}"
+        )
+
+    @staticmethod
+    def _format_score(score: float, principal_variation_length: int) -> str:
+        """Return a score for the color to move in UCI form: centipawns, or
+        moves to mate (negative if mated). Checkmates found by the search do not
+        carry a distance, so it is counted along the principal variation.
+        Tablebase wins carry the plies to mate from the position probed, where
+        the principal variation ends."""
+        if abs(score) >= CHECKMATE_SCORE:
+            plies_to_mate = principal_variation_length
+        elif abs(score) >= TABLEBASE_WIN_SCORE - MAX_DISTANCE:
+            plies_to_mate = principal_variation_length + round(
+                TABLEBASE_WIN_SCORE - abs(score)
+            )
+        else:
+            return f"cp {round(score * 100)}"
+        moves_to_mate = (plies_to_mate + 1) // 2
+        return f"mate {moves_to_mate if score > 0 else -moves_to_mate}"
+
+    @staticmethod
+    def _get_time_limit(
+        time_milliseconds: int, increment_milliseconds: int, moves_to_go: int
+    ) -> float:
+        """Return the seconds to spend on a move given the clock."""
+        time_limit = time_milliseconds / max(1, moves_to_go) + increment_milliseconds
+        return max(0, min(time_limit, time_milliseconds * _MAX_TIME_FRACTION)) / 1000
@@ -0,0 +1,7 @@
+from enum import Enum, auto
+
+
+class Bound(Enum):
+    EXACT = auto()
+    LOWER = auto()
+    UPPER = auto()
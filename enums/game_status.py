@@ -5,3 +5,5 @@ class GameStatus(Enum):
     ACTIVE = auto()
     CHECKMATE = auto()
     STALEMATE = auto()
+    REPETITION = auto()
+    MOVE_LIMIT = auto()
@@ -0,0 +1,6 @@
+from enum import Enum, auto
+
+
+class ParallelMode(Enum):
+    ROOT_SPLIT = auto()
+    LAZY_SMP = auto()
@@ -0,0 +1,7 @@
+from enum import Enum, auto
+
+
+class SearchFeature(Enum):
+    NULL_MOVE_PRUNING = auto()
+    LATE_MOVE_REDUCTIONS = auto()
+    FUTILITY_PRUNING = auto()
@@ -0,0 +1,7 @@
+from enum import Enum, auto
+
+
+class Wdl(Enum):
+    WIN = auto()
+    DRAW = auto()
+    LOSS = auto()
@@ -1,14 +1,30 @@
+import os
+import sys
+
+from constants.bot_constants import OPENING_BOOK_PATH, TABLEBASE_DIRECTORY
 from controllers.game_controller import GameController
 from models.board import Board
 from models.bot_factory import BotFactory
 from models.game import Game
+from models.opening_book import OpeningBook
+from models.tablebase import Tablebase
 
 
 def main() -> None:
-    board = Board()
-    board.set_up_pieces()
-    game = Game(board)
-    bot_factory = BotFactory()
+    # An optional FEN argument continues from that position.
+    if len(sys.argv) > 1:
+        game = Game.from_fen(" ".join(sys.argv[1:]))
+    else:
+        board = Board()
+        board.set_up_pieces()
+        game = Game(board)
+    opening_book = None
+    if os.path.exists(OPENING_BOOK_PATH):
+        opening_book = OpeningBook(OPENING_BOOK_PATH)
+    tablebase = None
+    if os.path.isdir(TABLEBASE_DIRECTORY):
+        tablebase = Tablebase(TABLEBASE_DIRECTORY)
+    bot_factory = BotFactory(opening_book, tablebase)
     game_controller = GameController(game, bot_factory)
     game_controller.configure()
     game_controller.play()
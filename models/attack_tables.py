@@ -0,0 +1,154 @@
+from constants.board_constants import BOARD_LEN, BOARD_SIZE
+from utils.board_utils import get_mask, is_index_in_bounds
+
+_ORTHOGONAL_DIRECTIONS = ((1, 0), (-1, 0), (0, 1), (0, -1))
+_DIAGONAL_DIRECTIONS = ((1, 1), (1, -1), (-1, 1), (-1, -1))
+_KNIGHT_DELTAS = (
+    (1, 2),
+    (-1, 2),
+    (1, -2),
+    (-1, -2),
+    (2, 1),
+    (-2, 1),
+    (2, -1),
+    (-2, -1),
+)
+_KING_DELTAS = _ORTHOGONAL_DIRECTIONS + _DIAGONAL_DIRECTIONS
+_WHITE_PAWN_CAPTURE_DELTAS = ((1, -1), (1, 1))
+_BLACK_PAWN_CAPTURE_DELTAS = ((-1, -1), (-1, 1))
+
+
+def get_bishop_attacks_mask(square_shift: int, occupancy_mask: int) -> int:
+    """Return a mask of all squares a bishop on the square attacks, stopping at
+    (and including) the first occupied square in each direction."""
+    return BISHOP_ATTACK_TABLES[square_shift][
+        occupancy_mask & BISHOP_OCCUPANCY_MASKS[square_shift]
+    ]
+
+
+def get_rook_attacks_mask(square_shift: int, occupancy_mask: int) -> int:
+    """Return a mask of all squares a rook on the square attacks, stopping at
+    (and including) the first occupied square in each direction."""
+    return ROOK_ATTACK_TABLES[square_shift][
+        occupancy_mask & ROOK_OCCUPANCY_MASKS[square_shift]
+    ]
+
+
+def get_queen_attacks_mask(square_shift: int, occupancy_mask: int) -> int:
+    return get_bishop_attacks_mask(
+        square_shift, occupancy_mask
+    ) | get_rook_attacks_mask(square_shift, occupancy_mask)
+
+
+def _calculate_pattern_attacks_mask(
+    square_shift: int, deltas: tuple[tuple[int, int], ...]
+) -> int:
+    from_row_index, from_column_index = divmod(square_shift, BOARD_SIZE)
+    attacks_mask = 0
+    for row_delta, column_delta in deltas:
+        row_index = from_row_index + row_delta
+        column_index = from_column_index + column_delta
+        if is_index_in_bounds(row_index) and is_index_in_bounds(column_index):
+            attacks_mask |= get_mask(row_index, column_index)
+    return attacks_mask
+
+
+def _build_pattern_table(deltas: tuple[tuple[int, int], ...]) -> list[int]:
+    """Return the attacks mask of a piece on every square."""
+    return [
+        _calculate_pattern_attacks_mask(square_shift, deltas)
+        for square_shift in range(BOARD_LEN)
+    ]
+
+
+def _build_between_table() -> list[list[int]]:
+    """Return, for every pair of squares on a shared orthogonal or diagonal line,
+    a mask of the squares strictly between them (0 for unaligned pairs)."""
+    between_masks = [[0] * BOARD_LEN for _ in range(BOARD_LEN)]
+    for from_square_shift in range(BOARD_LEN):
+        from_row_index, from_column_index = divmod(from_square_shift, BOARD_SIZE)
+        for row_delta, column_delta in _KING_DELTAS:
+            row_index = from_row_index + row_delta
+            column_index = from_column_index + column_delta
+            between_mask = 0
+            while is_index_in_bounds(row_index) and is_index_in_bounds(column_index):
+                to_square_shift = BOARD_SIZE * row_index + column_index
+                between_masks[from_square_shift][to_square_shift] = between_mask
+                between_mask |= 1 << to_square_shift
+                row_index += row_delta
+                column_index += column_delta
+    return between_masks
+
+
+def _calculate_ray_attacks_mask(
+    square_shift: int, occupancy_mask: int, directions: tuple[tuple[int, int], ...]
+) -> int:
+    from_row_index, from_column_index = divmod(square_shift, BOARD_SIZE)
+    attacks_mask = 0
+    for row_delta, column_delta in directions:
+        row_index = from_row_index + row_delta
+        column_index = from_column_index + column_delta
+        while is_index_in_bounds(row_index) and is_index_in_bounds(column_index):
+            square_mask = get_mask(row_index, column_index)
+            attacks_mask |= square_mask
+            if occupancy_mask & square_mask:
+                break
+            row_index += row_delta
+            column_index += column_delta
+    return attacks_mask
+
+
+def _calculate_occupancy_mask(
+    square_shift: int, directions: tuple[tuple[int, int], ...]
+) -> int:
+    """Return a mask of the squares whose occupancy can change the attacks from
+    the square. The last square of each ray is excluded because it is attacked
+    whether or not it is occupied."""
+    from_row_index, from_column_index = divmod(square_shift, BOARD_SIZE)
+    occupancy_mask = 0
+    for row_delta, column_delta in directions:
+        row_index = from_row_index + row_delta
+        column_index = from_column_index + column_delta
+        while is_index_in_bounds(row_index + row_delta) and is_index_in_bounds(
+            column_index + column_delta
+        ):
+            occupancy_mask |= get_mask(row_index, column_index)
+            row_index += row_delta
+            column_index += column_delta
+    return occupancy_mask
+
+
+def _build_slider_tables(
+    directions: tuple[tuple[int, int], ...],
+) -> tuple[list[int], list[dict[int, int]]]:
+    """Return the relevant occupancy mask of every square and, for every square,
+    a table mapping each subset of that mask to the resulting attacks mask."""
+    occupancy_masks = []
+    attack_tables = []
+    for square_shift in range(BOARD_LEN):
+        occupancy_mask = _calculate_occupancy_mask(square_shift, directions)
+        attack_table = {}
+        # Enumerate every subset of the occupancy mask (Carry-Rippler trick).
+        subset_mask = 0
+        while True:
+            attack_table[subset_mask] = _calculate_ray_attacks_mask(
+                square_shift, subset_mask, directions
+            )
+            subset_mask = (subset_mask - occupancy_mask) & occupancy_mask
+            if subset_mask == 0:
+                break
+        occupancy_masks.append(occupancy_mask)
+        attack_tables.append(attack_table)
+    return occupancy_masks, attack_tables
+
+
+BISHOP_OCCUPANCY_MASKS, BISHOP_ATTACK_TABLES = _build_slider_tables(
+    _DIAGONAL_DIRECTIONS
+)
+ROOK_OCCUPANCY_MASKS, ROOK_ATTACK_TABLES = _build_slider_tables(_ORTHOGONAL_DIRECTIONS)
+
+KNIGHT_ATTACK_MASKS = _build_pattern_table(_KNIGHT_DELTAS)
+KING_ATTACK_MASKS = _build_pattern_table(_KING_DELTAS)
+WHITE_PAWN_ATTACK_MASKS = _build_pattern_table(_WHITE_PAWN_CAPTURE_DELTAS)
+BLACK_PAWN_ATTACK_MASKS = _build_pattern_table(_BLACK_PAWN_CAPTURE_DELTAS)
+BETWEEN_MASKS = _build_between_table()
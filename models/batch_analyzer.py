@@ -0,0 +1,168 @@
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Generator, Iterable
+
+from constants.bot_constants import CHECKMATE_SCORE
+from enums.color import Color
+from models.board import Board
+from models.bot import Bot
+from models.engine import Engine
+from models.rules import Rules
+from utils.move_utils import format_move
+
+# The bot a worker process analyzes positions with, kept between positions so
+# it is only created once.
+_worker_bot: Bot | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class PositionAnalysis:
+    """Search result of one position. Scores are from white's point of view and
+    the best move is None if the game is over. If the FEN could not be read,
+    error says why and the other results are zero."""
+
+    index: int
+    fen: str
+    best_move: str | None
+    score: float
+    static_score: float
+    depth: int
+    nodes: int
+    seconds: float
+    error: str | None = None
+
+    def to_dict(self) -> dict:
+        return {
+            "index": self.index,
+            "fen": self.fen,
+            "best_move": self.best_move,
+            "score": self.score,
+            "static_score": self.static_score,
+            "depth": self.depth,
+            "nodes": self.nodes,
+            "seconds": self.seconds,
+            "error": self.error,
+        }
+
+
+class BatchAnalyzer:
+    def __init__(
+        self,
+        depth: int,
+        time_limit: float | None = None,
+        node_limit: int | None = None,
+        worker_count: int = 1,
+        is_ordered: bool = True,
+        max_pending: int | None = None,
+    ) -> None:
+        """Create an analyzer that searches each position like a bot with the
+        limits would. With more than one worker, positions are spread over a
+        pool of processes with at most max_pending (default twice the worker
+        count) positions queued at a time."""
+        self._bot_args = (depth, time_limit, node_limit)
+        self._worker_count = worker_count
+        self._is_ordered = is_ordered
+        self._max_pending = max_pending or 2 * worker_count
+
+    def analyze(self, fens: Iterable[str]) -> Generator[PositionAnalysis]:
+        """Analyze FEN positions, skipping blank lines and reporting malformed
+        ones in the error of their analysis. Input is read lazily, so it can be
+        a file or any other stream. Results come in input order unless the
+        analyzer is unordered, in which case they come as soon as they are
+        done."""
+        positions = (
+            (index, fen.strip()) for index, fen in enumerate(fens) if fen.strip()
+        )
+        if self._worker_count == 1:
+            bot = Bot(*self._bot_args)
+            for index, fen in positions:
+                yield _analyze_position_with(bot, index, fen)
+            return
+
+        executor = ProcessPoolExecutor(
+            self._worker_count,
+            initializer=_initialize_worker,
+            initargs=self._bot_args,
+        )
+        try:
+            if self._is_ordered:
+                yield from self._collect_in_order(executor, positions)
+            else:
+                yield from self._collect_as_completed(executor, positions)
+        finally:
+            executor.shutdown(cancel_futures=True)
+
+    def _collect_in_order(
+        self,
+        executor: ProcessPoolExecutor,
+        positions: Iterable[tuple[int, str]],
+    ) -> Generator[PositionAnalysis]:
+        pending_futures: deque[Future] = deque()
+        for index, fen in positions:
+            pending_futures.append(executor.submit(_analyze_position, index, fen))
+            if len(pending_futures) >= self._max_pending:
+                yield pending_futures.popleft().result()
+        while pending_futures:
+            yield pending_futures.popleft().result()
+
+    def _collect_as_completed(
+        self,
+        executor: ProcessPoolExecutor,
+        positions: Iterable[tuple[int, str]],
+    ) -> Generator[PositionAnalysis]:
+        pending_futures: set[Future] = set()
+        for index, fen in positions:
+            pending_futures.add(executor.submit(_analyze_position, index, fen))
+            if len(pending_futures) >= self._max_pending:
+                done_futures, pending_futures = wait(
+                    pending_futures, return_when=FIRST_COMPLETED
+                )
+                for future in done_futures:
+                    yield future.result()
+        while pending_futures:
+            done_futures, pending_futures = wait(
+                pending_futures, return_when=FIRST_COMPLETED
+            )
+            for future in done_futures:
+                yield future.result()
+
+
+def _initialize_worker(
+    depth: int, time_limit: float | None, node_limit: int | None
+) -> None:
+    global _worker_bot
+    _worker_bot = Bot(depth, time_limit, node_limit)
+
+
+def _analyze_position(index: int, fen: str) -> PositionAnalysis:
+    return _analyze_position_with(_worker_bot, index, fen)
+
+
+def _analyze_position_with(bot: Bot, index: int, fen: str) -> PositionAnalysis:
+    try:
+        board, color = Board.from_fen(fen)
+    except ValueError as error:
+        return PositionAnalysis(index, fen, None, 0, 0, 0, 0, 0.0, str(error))
+    static_score = Engine.evaluate(board)
+
+    if Rules.is_in_checkmate(color, board):
+        score = -CHECKMATE_SCORE if color == Color.WHITE else CHECKMATE_SCORE
+        return PositionAnalysis(index, fen, None, score, static_score, 0, 0, 0.0)
+    if Rules.is_in_stalemate(color, board):
+        return PositionAnalysis(index, fen, None, 0, static_score, 0, 0, 0.0)
+
+    start_time = time.perf_counter()
+    best_move = bot.calculate_best_move(color, board)
+    iteration = bot.iterations[-1]
+    return PositionAnalysis(
+        index,
+        fen,
+        format_move(best_move),
+        iteration.score,
+        static_score,
+        iteration.depth,
+        iteration.nodes + iteration.quiescence_nodes,
+        time.perf_counter() - start_time,
+    )
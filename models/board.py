@@ -1,13 +1,43 @@
 import random
 
-from constants.board_constants import BOARD_LEN, BOARD_SIZE
-from constants.piece_constants import PIECE_TYPE_COUNT
+from constants.board_constants import (
+    BOARD_LEN,
+    BOARD_SIZE,
+    FIRST_ROW_MASK,
+    LAST_ROW_MASK,
+)
+from constants.engine_constants import (
+    PLACEMENT_SCORES_BISHOP,
+    PLACEMENT_SCORES_KING_ENDGAME,
+    PLACEMENT_SCORES_KING_MIDDLEGAME,
+    PLACEMENT_SCORES_KNIGHT,
+    PLACEMENT_SCORES_PAWN,
+    PLACEMENT_SCORES_QUEEN,
+    PLACEMENT_SCORES_ROOK,
+)
+from constants.piece_constants import (
+    COLOR_PIECE_TYPE_COUNT,
+    NO_PIECE_INDEX,
+    PIECE_TYPE_COUNT,
+)
 from enums.color import Color
 from models.coordinate import Coordinate
 from models.move import Move
-from models.piece import Bishop, King, Knight, Pawn, Piece, Queen, Rook
+from models.piece import (
+    PIECE_INDEXES,
+    PIECES,
+    Bishop,
+    King,
+    Knight,
+    Pawn,
+    Piece,
+    Queen,
+    Rook,
+)
 from utils.bit_utils import get_shift, intersects
 from utils.board_utils import enumerate_mask, get_mask
+from utils.fen_utils import format_fen, parse_fen
+from utils.move_utils import unpack_move
 
 # fmt: off
 _WHITE_PAWN_INITIAL_BITBOARD = 0b00000000_00000000_00000000_00000000_00000000_00000000_11111111_00000000
@@ -23,82 +53,149 @@ _BLACK_KNIGHT_INITIAL_BITBOARD = 0b01000010_00000000_00000000_00000000_00000000_
 _BLACK_BISHOP_INITIAL_BITBOARD = 0b00100100_00000000_00000000_00000000_00000000_00000000_00000000_00000000
 _BLACK_QUEEN_INITIAL_BITBOARD = 0b00001000_00000000_00000000_00000000_00000000_00000000_00000000_00000000
 _BLACK_KING_INITIAL_BITBOARD = 0b00010000_00000000_00000000_00000000_00000000_00000000_00000000_00000000
-
-_FIRST_ROW_MASK = 0b00000000_00000000_00000000_00000000_00000000_00000000_00000000_11111111
-_LAST_ROW_MASK = 0b11111111_00000000_00000000_00000000_00000000_00000000_00000000_00000000
 # fmt: on
 
-_WHITE_PAWN = Pawn(Color.WHITE)
-_WHITE_KNIGHT = Knight(Color.WHITE)
-_WHITE_BISHOP = Bishop(Color.WHITE)
-_WHITE_ROOK = Rook(Color.WHITE)
-_WHITE_QUEEN = Queen(Color.WHITE)
-_WHITE_KING = King(Color.WHITE)
-
-_BLACK_PAWN = Pawn(Color.BLACK)
-_BLACK_KNIGHT = Knight(Color.BLACK)
-_BLACK_BISHOP = Bishop(Color.BLACK)
-_BLACK_ROOK = Rook(Color.BLACK)
-_BLACK_QUEEN = Queen(Color.BLACK)
-_BLACK_KING = King(Color.BLACK)
-
-_ZOBRIST_INDEX_WHITE_PAWN = 0
-_ZOBRIST_INDEX_WHITE_KNIGHT = 1
-_ZOBRIST_INDEX_WHITE_BISHOP = 2
-_ZOBRIST_INDEX_WHITE_ROOK = 3
-_ZOBRIST_INDEX_WHITE_QUEEN = 4
-_ZOBRIST_INDEX_WHITE_KING = 5
-
-_ZOBRIST_INDEX_BLACK_PAWN = 6
-_ZOBRIST_INDEX_BLACK_KNIGHT = 7
-_ZOBRIST_INDEX_BLACK_BISHOP = 8
-_ZOBRIST_INDEX_BLACK_ROOK = 9
-_ZOBRIST_INDEX_BLACK_QUEEN = 10
-_ZOBRIST_INDEX_BLACK_KING = 11
+# Bitboards are stored in PIECES order, so white pieces come first.
+_BLACK_OFFSET = COLOR_PIECE_TYPE_COUNT
 
 _ZOBRIST_HASH_BITS = 64
 
+# Zobrist keys are seeded so every process, and every run, hashes positions the
+# same way. Shared transposition tables and opening books rely on this.
+_ZOBRIST_SEED = 0x5EED
+_zobrist_random = random.Random(_ZOBRIST_SEED)
+
+_EMPTY_MAILBOX = [NO_PIECE_INDEX] * BOARD_LEN
+
+# Indexing with NO_PIECE_INDEX (an empty mailbox square) gives None.
+_PIECES_OR_NONE = PIECES + (None,)
+
+_INITIAL_BITBOARDS = (
+    _WHITE_PAWN_INITIAL_BITBOARD,
+    _WHITE_KNIGHT_INITIAL_BITBOARD,
+    _WHITE_BISHOP_INITIAL_BITBOARD,
+    _WHITE_ROOK_INITIAL_BITBOARD,
+    _WHITE_QUEEN_INITIAL_BITBOARD,
+    _WHITE_KING_INITIAL_BITBOARD,
+    _BLACK_PAWN_INITIAL_BITBOARD,
+    _BLACK_KNIGHT_INITIAL_BITBOARD,
+    _BLACK_BISHOP_INITIAL_BITBOARD,
+    _BLACK_ROOK_INITIAL_BITBOARD,
+    _BLACK_QUEEN_INITIAL_BITBOARD,
+    _BLACK_KING_INITIAL_BITBOARD,
+)
+
+
+def _build_placement_matrix(
+    king_placement_scores: tuple[int, ...],
+) -> list[list[int]]:
+    """Return the placement score of every piece on every square, negated for
+    black pieces. The tables are written from white's side of the board."""
+    placement_scores_by_type = {
+        Pawn: PLACEMENT_SCORES_PAWN,
+        Knight: PLACEMENT_SCORES_KNIGHT,
+        Bishop: PLACEMENT_SCORES_BISHOP,
+        Rook: PLACEMENT_SCORES_ROOK,
+        Queen: PLACEMENT_SCORES_QUEEN,
+        King: king_placement_scores,
+    }
+    placement_matrix = []
+    for square_shift in range(BOARD_LEN):
+        placement_row = []
+        for piece in PIECES:
+            placement_scores = placement_scores_by_type[type(piece)]
+            if piece.color == Color.WHITE:
+                placement_row.append(placement_scores[BOARD_LEN - 1 - square_shift])
+            else:
+                placement_row.append(-placement_scores[square_shift])
+        placement_matrix.append(placement_row)
+    return placement_matrix
+
+
+_MATERIAL_SCORES = [
+    piece.VALUE if piece.color == Color.WHITE else -piece.VALUE for piece in PIECES
+]
+_MIDDLEGAME_PLACEMENT_MATRIX = _build_placement_matrix(PLACEMENT_SCORES_KING_MIDDLEGAME)
+_ENDGAME_PLACEMENT_MATRIX = _build_placement_matrix(PLACEMENT_SCORES_KING_ENDGAME)
+
 
 class Board:
+    __slots__ = (
+        "_bitboards",
+        "_mailbox",
+        "_white_mask",
+        "_black_mask",
+        "_occupied_mask",
+        "_zobrist_hash",
+        "_material_score",
+        "_middlegame_placement_score",
+        "_endgame_placement_score",
+        "_debug",
+    )
+
     SIZE = BOARD_SIZE
     LEN = BOARD_LEN
     _ZOBRIST_MATRIX = [
-        [random.getrandbits(_ZOBRIST_HASH_BITS) for _ in range(PIECE_TYPE_COUNT)]
+        [
+            _zobrist_random.getrandbits(_ZOBRIST_HASH_BITS)
+            for _ in range(PIECE_TYPE_COUNT)
+        ]
         for _ in range(BOARD_LEN)
     ]
-
-    def __init__(self) -> None:
-        self._white_pawn_bitboard = 0
-        self._white_knight_bitboard = 0
-        self._white_bishop_bitboard = 0
-        self._white_rook_bitboard = 0
-        self._white_queen_bitboard = 0
-        self._white_king_bitboard = 0
-
-        self._black_pawn_bitboard = 0
-        self._black_knight_bitboard = 0
-        self._black_bishop_bitboard = 0
-        self._black_rook_bitboard = 0
-        self._black_queen_bitboard = 0
-        self._black_king_bitboard = 0
+    _ZOBRIST_BLACK_TO_MOVE = _zobrist_random.getrandbits(_ZOBRIST_HASH_BITS)
+
+    def __init__(self, debug: bool = False) -> None:
+        """Create an empty board. In debug mode, every hash is checked against a
+        full recompute."""
+        # One bitboard per piece, indexed like PIECES.
+        self._bitboards = [0] * PIECE_TYPE_COUNT
+        # The piece index on every square, for O(1) lookups by square.
+        self._mailbox = [NO_PIECE_INDEX] * BOARD_LEN
+        self._white_mask = 0
+        self._black_mask = 0
+        self._occupied_mask = 0
+
+        self._zobrist_hash = 0
+        # Evaluation terms (white minus black), updated as pieces are placed.
+        # Only the king tables differ between middlegame and endgame.
+        self._material_score = 0
+        self._middlegame_placement_score = 0
+        self._endgame_placement_score = 0
+        self._debug = debug
 
     def __hash__(self) -> int:
-        return self._calculate_zobrist_hash()
+        return self.zobrist_key
+
+    @classmethod
+    def from_fen(cls, fen: str, debug: bool = False) -> tuple[Board, Color]:
+        """Return a board set up from a FEN string and the color to move."""
+        bitboards, color = parse_fen(fen)
+        board = cls(debug)
+        board._set_bitboards(bitboards)
+        return board, color
+
+    def to_fen(self, color: Color) -> str:
+        """Return the FEN string of the board with the color to move. The engine
+        has no castling or en passant, so those fields are always empty."""
+        return format_fen(self._mailbox, color)
+
+    @property
+    def zobrist_key(self) -> int:
+        """Return the full 64-bit Zobrist key (hash() truncates it)."""
+        if self._debug:
+            assert self._zobrist_hash == self._calculate_zobrist_hash(), (
+                "Incremental Zobrist hash is out of sync with the board."
+            )
+        return self._zobrist_hash
+
+    def get_position_key(self, color: Color) -> int:
+        """Return the Zobrist key of the position with the color to move."""
+        if color == Color.BLACK:
+            return self.zobrist_key ^ self._ZOBRIST_BLACK_TO_MOVE
+        return self.zobrist_key
 
     def set_up_pieces(self) -> None:
-        self._white_pawn_bitboard = _WHITE_PAWN_INITIAL_BITBOARD
-        self._white_knight_bitboard = _WHITE_KNIGHT_INITIAL_BITBOARD
-        self._white_bishop_bitboard = _WHITE_BISHOP_INITIAL_BITBOARD
-        self._white_rook_bitboard = _WHITE_ROOK_INITIAL_BITBOARD
-        self._white_queen_bitboard = _WHITE_QUEEN_INITIAL_BITBOARD
-        self._white_king_bitboard = _WHITE_KING_INITIAL_BITBOARD
-
-        self._black_pawn_bitboard = _BLACK_PAWN_INITIAL_BITBOARD
-        self._black_rook_bitboard = _BLACK_ROOK_INITIAL_BITBOARD
-        self._black_knight_bitboard = _BLACK_KNIGHT_INITIAL_BITBOARD
-        self._black_bishop_bitboard = _BLACK_BISHOP_INITIAL_BITBOARD
-        self._black_queen_bitboard = _BLACK_QUEEN_INITIAL_BITBOARD
-        self._black_king_bitboard = _BLACK_KING_INITIAL_BITBOARD
+        self._set_bitboards(_INITIAL_BITBOARDS)
 
     def get_piece(self, coordinate: Coordinate) -> Piece | None:
         square_mask = get_mask(coordinate.row_index, coordinate.column_index)
@@ -108,46 +205,31 @@ class Board:
         square_mask = get_mask(coordinate.row_index, coordinate.column_index)
         return self._set_piece(piece, square_mask)
 
-    def is_occupied(self, square_mask: int, color: Color | None = None) -> bool:
-        """Return whether the square is occupied by the color. Check both colors
-        if not specified."""
-        is_occupied_by_white = intersects(square_mask, self.get_mask(Color.WHITE))
-        is_occupied_by_black = intersects(square_mask, self.get_mask(Color.BLACK))
+    def get_bitboard(self, piece: Piece) -> int:
+        """Return a mask with all squares the piece is on."""
+        return self._bitboards[PIECE_INDEXES[piece]]
 
+    def get_bitboards(self, color: Color) -> list[int]:
+        """Return the bitboards of the color, indexed by piece type (see
+        piece_constants)."""
         if color == Color.WHITE:
-            return is_occupied_by_white
-
-        if color == Color.BLACK:
-            return is_occupied_by_black
+            return self._bitboards[:_BLACK_OFFSET]
+        return self._bitboards[_BLACK_OFFSET:]
 
-        return is_occupied_by_white or is_occupied_by_black
+    def is_occupied(self, square_mask: int, color: Color | None = None) -> bool:
+        """Return whether the square is occupied by the color. Check both colors
+        if not specified."""
+        return intersects(square_mask, self.get_mask(color))
 
     def get_mask(self, color: Color | None = None):
         """Return a mask with all pieces of the color. Check both colors if not
         specified."""
-        white_mask = (
-            self._white_pawn_bitboard
-            | self._white_knight_bitboard
-            | self._white_bishop_bitboard
-            | self._white_rook_bitboard
-            | self._white_queen_bitboard
-            | self._white_king_bitboard
-        )
-        black_mask = (
-            self._black_pawn_bitboard
-            | self._black_knight_bitboard
-            | self._black_bishop_bitboard
-            | self._black_rook_bitboard
-            | self._black_queen_bitboard
-            | self._black_king_bitboard
-        )
-
         if color == Color.WHITE:
-            return white_mask
+            return self._white_mask
         elif color == Color.BLACK:
-            return black_mask
+            return self._black_mask
         else:
-            return white_mask | black_mask
+            return self._occupied_mask
 
     def make_move(self, move: Move) -> None:
         self._set_piece(None, move.from_square_mask)
@@ -160,126 +242,143 @@ class Board:
     @staticmethod
     def moving_to_final_row(move: Move) -> bool:
         final_row_mask = (
-            _LAST_ROW_MASK if move.color == Color.WHITE else _FIRST_ROW_MASK
+            LAST_ROW_MASK if move.color == Color.WHITE else FIRST_ROW_MASK
         )
         return intersects(move.to_square_mask, final_row_mask)
 
     def _get_piece(self, square_mask: int) -> Piece | None:
-        if intersects(self._white_pawn_bitboard, square_mask):
-            return _WHITE_PAWN
-        elif intersects(self._white_knight_bitboard, square_mask):
-            return _WHITE_KNIGHT
-        elif intersects(self._white_bishop_bitboard, square_mask):
-            return _WHITE_BISHOP
-        elif intersects(self._white_rook_bitboard, square_mask):
-            return _WHITE_ROOK
-        elif intersects(self._white_queen_bitboard, square_mask):
-            return _WHITE_QUEEN
-        elif intersects(self._white_king_bitboard, square_mask):
-            return _WHITE_KING
-
-        elif intersects(self._black_pawn_bitboard, square_mask):
-            return _BLACK_PAWN
-        elif intersects(self._black_knight_bitboard, square_mask):
-            return _BLACK_KNIGHT
-        elif intersects(self._black_bishop_bitboard, square_mask):
-            return _BLACK_BISHOP
-        elif intersects(self._black_rook_bitboard, square_mask):
-            return _BLACK_ROOK
-        elif intersects(self._black_queen_bitboard, square_mask):
-            return _BLACK_QUEEN
-        elif intersects(self._black_king_bitboard, square_mask):
-            return _BLACK_KING
-
-        return None
+        return _PIECES_OR_NONE[self._mailbox[get_shift(square_mask)]]
+
+    def make_packed_move(self, packed_move: int) -> None:
+        """Make the packed move, including its promotion."""
+        (
+            from_square_shift,
+            to_square_shift,
+            moved_piece_index,
+            captured_piece_index,
+            promotion_piece_index,
+        ) = unpack_move(packed_move)
+        self._remove_piece(moved_piece_index, from_square_shift)
+        if captured_piece_index != NO_PIECE_INDEX:
+            self._remove_piece(captured_piece_index, to_square_shift)
+        if promotion_piece_index != NO_PIECE_INDEX:
+            self._add_piece(promotion_piece_index, to_square_shift)
+        else:
+            self._add_piece(moved_piece_index, to_square_shift)
+
+    def undo_packed_move(self, packed_move: int) -> None:
+        (
+            from_square_shift,
+            to_square_shift,
+            moved_piece_index,
+            captured_piece_index,
+            promotion_piece_index,
+        ) = unpack_move(packed_move)
+        if promotion_piece_index != NO_PIECE_INDEX:
+            self._remove_piece(promotion_piece_index, to_square_shift)
+        else:
+            self._remove_piece(moved_piece_index, to_square_shift)
+        if captured_piece_index != NO_PIECE_INDEX:
+            self._add_piece(captured_piece_index, to_square_shift)
+        self._add_piece(moved_piece_index, from_square_shift)
 
     def _set_piece(self, piece: Piece | None, square_mask: int) -> None:
-        self._clear_square(square_mask)
+        """Place the piece on the square, replacing any piece already there."""
+        square_shift = get_shift(square_mask)
+        piece_index = self._mailbox[square_shift]
+        if piece_index != NO_PIECE_INDEX:
+            self._remove_piece(piece_index, square_shift)
 
         if piece is None:
             return
 
-        match piece:
-            case Pawn():
-                if piece.color == Color.WHITE:
-                    self._white_pawn_bitboard |= square_mask
-                else:
-                    self._black_pawn_bitboard |= square_mask
-            case Knight():
-                if piece.color == Color.WHITE:
-                    self._white_knight_bitboard |= square_mask
-                else:
-                    self._black_knight_bitboard |= square_mask
-            case Bishop():
-                if piece.color == Color.WHITE:
-                    self._white_bishop_bitboard |= square_mask
-                else:
-                    self._black_bishop_bitboard |= square_mask
-            case Rook():
-                if piece.color == Color.WHITE:
-                    self._white_rook_bitboard |= square_mask
-                else:
-                    self._black_rook_bitboard |= square_mask
-            case Queen():
-                if piece.color == Color.WHITE:
-                    self._white_queen_bitboard |= square_mask
-                else:
-                    self._black_queen_bitboard |= square_mask
-            case King():
-                if piece.color == Color.WHITE:
-                    self._white_king_bitboard |= square_mask
-                else:
-                    self._black_king_bitboard |= square_mask
-            case _:
-                raise ValueError(f"Invalid piece type: {piece}")
-
-    def _clear_square(self, square_mask: int) -> None:
-        self._white_pawn_bitboard &= ~square_mask
-        self._white_knight_bitboard &= ~square_mask
-        self._white_bishop_bitboard &= ~square_mask
-        self._white_rook_bitboard &= ~square_mask
-        self._white_queen_bitboard &= ~square_mask
-        self._white_king_bitboard &= ~square_mask
-
-        self._black_pawn_bitboard &= ~square_mask
-        self._black_knight_bitboard &= ~square_mask
-        self._black_bishop_bitboard &= ~square_mask
-        self._black_rook_bitboard &= ~square_mask
-        self._black_queen_bitboard &= ~square_mask
-        self._black_king_bitboard &= ~square_mask
-        self._black_rook_bitboard &= ~square_mask
-        self._black_queen_bitboard &= ~square_mask
-        self._black_king_bitboard &= ~square_mask
-        self._black_king_bitboard &= ~square_mask
+        try:
+            piece_index = PIECE_INDEXES[piece]
+        except KeyError:
+            raise ValueError(f"Invalid piece type: {piece}") from None
+        self._add_piece(piece_index, square_shift)
+
+    def _add_piece(self, piece_index: int, square_shift: int) -> None:
+        """Put the piece on the empty square, updating the occupancy, the
+        Zobrist hash and the evaluation scores."""
+        square_mask = 1 << square_shift
+        self._bitboards[piece_index] |= square_mask
+        if piece_index < _BLACK_OFFSET:
+            self._white_mask |= square_mask
+        else:
+            self._black_mask |= square_mask
+        self._occupied_mask |= square_mask
+        self._mailbox[square_shift] = piece_index
+
+        self._zobrist_hash ^= self._ZOBRIST_MATRIX[square_shift][piece_index]
+        self._material_score += _MATERIAL_SCORES[piece_index]
+        self._middlegame_placement_score += _MIDDLEGAME_PLACEMENT_MATRIX[
+            square_shift
+        ][piece_index]
+        self._endgame_placement_score += _ENDGAME_PLACEMENT_MATRIX[square_shift][
+            piece_index
+        ]
+
+    def _remove_piece(self, piece_index: int, square_shift: int) -> None:
+        """Take the piece off its square; the reverse of _add_piece."""
+        square_mask = 1 << square_shift
+        self._bitboards[piece_index] &= ~square_mask
+        if piece_index < _BLACK_OFFSET:
+            self._white_mask &= ~square_mask
+        else:
+            self._black_mask &= ~square_mask
+        self._occupied_mask &= ~square_mask
+        self._mailbox[square_shift] = NO_PIECE_INDEX
+
+        self._zobrist_hash ^= self._ZOBRIST_MATRIX[square_shift][piece_index]
+        self._material_score -= _MATERIAL_SCORES[piece_index]
+        self._middlegame_placement_score -= _MIDDLEGAME_PLACEMENT_MATRIX[
+            square_shift
+        ][piece_index]
+        self._endgame_placement_score -= _ENDGAME_PLACEMENT_MATRIX[square_shift][
+            piece_index
+        ]
+
+    def _set_bitboards(self, bitboards: list[int]) -> None:
+        """Replace every piece on the board with the bitboards, given in PIECES
+        order, recomputing everything derived from them in one pass."""
+        self._bitboards[:] = bitboards
+        mailbox = self._mailbox
+        mailbox[:] = _EMPTY_MAILBOX
+        zobrist_hash = 0
+        material_score = 0
+        middlegame_placement_score = 0
+        endgame_placement_score = 0
+        for piece_index, bitboard in enumerate(bitboards):
+            while bitboard:
+                square_mask = bitboard & -bitboard
+                bitboard ^= square_mask
+                square_shift = square_mask.bit_length() - 1
+                mailbox[square_shift] = piece_index
+                zobrist_hash ^= self._ZOBRIST_MATRIX[square_shift][piece_index]
+                material_score += _MATERIAL_SCORES[piece_index]
+                middlegame_placement_score += _MIDDLEGAME_PLACEMENT_MATRIX[
+                    square_shift
+                ][piece_index]
+                endgame_placement_score += _ENDGAME_PLACEMENT_MATRIX[square_shift][
+                    piece_index
+                ]
+
+        self._white_mask = 0
+        for bitboard in bitboards[:_BLACK_OFFSET]:
+            self._white_mask |= bitboard
+        self._black_mask = 0
+        for bitboard in bitboards[_BLACK_OFFSET:]:
+            self._black_mask |= bitboard
+        self._occupied_mask = self._white_mask | self._black_mask
+        self._zobrist_hash = zobrist_hash
+        self._material_score = material_score
+        self._middlegame_placement_score = middlegame_placement_score
+        self._endgame_placement_score = endgame_placement_score
 
     def _calculate_zobrist_hash(self) -> int:
         value = 0
-        for square_mask in enumerate_mask(self.get_mask()):
-            shift = get_shift(square_mask)
-
-            if intersects(square_mask, self._white_pawn_bitboard):
-                value ^= self._ZOBRIST_MATRIX[shift][_ZOBRIST_INDEX_WHITE_PAWN]
-            elif intersects(square_mask, self._white_knight_bitboard):
-                value ^= self._ZOBRIST_MATRIX[shift][_ZOBRIST_INDEX_WHITE_KNIGHT]
-            elif intersects(square_mask, self._white_bishop_bitboard):
-                value ^= self._ZOBRIST_MATRIX[shift][_ZOBRIST_INDEX_WHITE_BISHOP]
-            elif intersects(square_mask, self._white_rook_bitboard):
-                value ^= self._ZOBRIST_MATRIX[shift][_ZOBRIST_INDEX_WHITE_ROOK]
-            elif intersects(square_mask, self._white_queen_bitboard):
-                value ^= self._ZOBRIST_MATRIX[shift][_ZOBRIST_INDEX_WHITE_QUEEN]
-            elif intersects(square_mask, self._white_king_bitboard):
-                value ^= self._ZOBRIST_MATRIX[shift][_ZOBRIST_INDEX_WHITE_KING]
-
-            elif intersects(square_mask, self._black_pawn_bitboard):
-                value ^= self._ZOBRIST_MATRIX[shift][_ZOBRIST_INDEX_BLACK_PAWN]
-            elif intersects(square_mask, self._black_knight_bitboard):
-                value ^= self._ZOBRIST_MATRIX[shift][_ZOBRIST_INDEX_BLACK_KNIGHT]
-            elif intersects(square_mask, self._black_bishop_bitboard):
-                value ^= self._ZOBRIST_MATRIX[shift][_ZOBRIST_INDEX_BLACK_BISHOP]
-            elif intersects(square_mask, self._black_rook_bitboard):
-                value ^= self._ZOBRIST_MATRIX[shift][_ZOBRIST_INDEX_BLACK_ROOK]
-            elif intersects(square_mask, self._black_queen_bitboard):
-                value ^= self._ZOBRIST_MATRIX[shift][_ZOBRIST_INDEX_BLACK_QUEEN]
-            elif intersects(square_mask, self._black_king_bitboard):
-                value ^= self._ZOBRIST_MATRIX[shift][_ZOBRIST_INDEX_BLACK_KING]
+        for piece_index, bitboard in enumerate(self._bitboards):
+            for square_mask in enumerate_mask(bitboard):
+                value ^= self._ZOBRIST_MATRIX[get_shift(square_mask)][piece_index]
         return value
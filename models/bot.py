@@ -1,90 +1,971 @@
-from collections import defaultdict
+import multiprocessing
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Callable
 
+from constants.bot_constants import (
+    CHECKMATE_SCORE,
+    TABLEBASE_WIN_SCORE,
+    TRANSPOSITION_TABLE_SIZE_MB,
+)
+from constants.engine_constants import POSITIONAL_SCORE_WEIGHT
+from constants.piece_constants import KING_INDEX, KNIGHT_INDEX
+from enums.bound import Bound
 from enums.color import Color
+from enums.parallel_mode import ParallelMode
+from enums.search_feature import SearchFeature
+from enums.wdl import Wdl
 from models.board import Board
 from models.engine import Engine
-from models.move import Move
-from models.piece import Queen
+from models.move_picker import MovePicker
+from models.opening_book import OpeningBook
+from models.piece import PIECES, Pawn, Queen
 from models.rules import Rules
+from models.search_iteration import SearchIteration
+from models.search_stats import (
+    CountingMovePicker,
+    CountingTranspositionTable,
+    SearchStats,
+)
+from models.shared_transposition_table import SharedTranspositionTable
+from models.tablebase import Tablebase
+from models.transposition_table import TranspositionTable
+from utils.move_utils import (
+    get_captured_piece_index,
+    get_from_square_shift,
+    get_moved_piece_index,
+    get_to_square_shift,
+    is_capture,
+    is_promotion,
+)
 
-_MAX_SCORE = 1_000_000
-_MIN_SCORE = -1_000_000
+_MAX_SCORE = CHECKMATE_SCORE
+_MIN_SCORE = -CHECKMATE_SCORE
+
+# Scores are floats, so a null window is this narrow rather than one unit wide.
+_NULL_WINDOW = 1e-6
+
+# Half the width of the first aspiration window around the previous iteration's
+# score, and how much it grows each time the score falls outside it.
+_ASPIRATION_WINDOW = 0.5
+_ASPIRATION_WINDOW_GROWTH = 4
+
+# A null move is searched this many plies shallower than a real one, and only
+# with at least this much depth left.
+_NULL_MOVE_REDUCTION = 2
+_NULL_MOVE_MIN_DEPTH = 3
+
+# Quiet moves after the first few are searched a ply shallower first, with at
+# least this much depth left.
+_LATE_MOVE_INDEX = 3
+_LATE_MOVE_REDUCTION = 1
+_LATE_MOVE_MIN_DEPTH = 3
+
+# Quiet moves one ply from the horizon are skipped if the static evaluation is
+# this far below alpha.
+_FUTILITY_MARGIN = 2
+
+# The clock is only read every this many nodes since it is relatively slow.
+_TIME_CHECK_INTERVAL = 256
+
+# Captures that cannot raise the score to alpha even with this much positional
+# gain on top of the captured material are skipped in quiescence search.
+_DELTA_MARGIN = 2
+
+# The bot a worker process searches root moves with, kept between tasks so its
+# transposition table and move ordering carry over.
+_worker_bot: Bot | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class _RootMoveResult:
+    move: int
+    score: float
+    is_exact: bool
+    nodes: int
+    quiescence_nodes: int
+    principal_variation: tuple[int, ...]
+    is_stopped: bool
 
 
 class Bot:
-    def __init__(self, depth: int) -> None:
+    def __init__(
+        self,
+        depth: int,
+        time_limit: float | None = None,
+        node_limit: int | None = None,
+        transposition_table_size_mb: int = TRANSPOSITION_TABLE_SIZE_MB,
+        worker_count: int = 1,
+        parallel_mode: ParallelMode = ParallelMode.ROOT_SPLIT,
+        positional_score_weight: float = POSITIONAL_SCORE_WEIGHT,
+        collects_stats: bool = False,
+        opening_book: OpeningBook | None = None,
+        tablebase: Tablebase | None = None,
+        search_features: frozenset[SearchFeature] = frozenset(),
+    ) -> None:
+        """Create a bot that searches up to the depth, stopping early once the
+        time limit (in seconds) or node limit is reached. With more than one
+        worker, the search is spread over a pool of processes, either by
+        splitting the root moves or by running helper searches that share the
+        transposition table (Lazy SMP). The positional score weight tunes the
+        evaluation (see Engine.evaluate). Positions in the opening book are
+        played from it without searching, and positions with few enough pieces
+        are looked up in the tablebase instead of searched (by this process
+        only, not its workers). The search features turn on selective search,
+        which reaches deeper in the same time at the risk of missing moves."""
         self._depth = depth
-        self._cache = {}
+        self._time_limit = time_limit
+        self._node_limit = node_limit
+        self._transposition_table_size_mb = transposition_table_size_mb
+        self._worker_count = worker_count
+        self._parallel_mode = parallel_mode
+        self._positional_score_weight = positional_score_weight
+        self._opening_book = opening_book
+        self._tablebase = tablebase
+        self._search_features = search_features
+        self._uses_null_move_pruning = (
+            SearchFeature.NULL_MOVE_PRUNING in search_features
+        )
+        self._uses_late_move_reductions = (
+            SearchFeature.LATE_MOVE_REDUCTIONS in search_features
+        )
+        self._uses_futility_pruning = SearchFeature.FUTILITY_PRUNING in search_features
+        self._executor: ProcessPoolExecutor | None = None
+        self._shared_bound = None
+        self._shared_stop_flag = None
+        self._shared_transposition_table = None
+        if worker_count > 1 and parallel_mode == ParallelMode.LAZY_SMP:
+            self._shared_transposition_table = SharedTranspositionTable(
+                transposition_table_size_mb
+            )
+            self._transposition_table = self._shared_transposition_table
+        else:
+            self._transposition_table = TranspositionTable(transposition_table_size_mb)
+        # Lookups outside the search, such as following the principal
+        # variation, use the table directly so statistics only count the search.
+        self._uncounted_transposition_table = self._transposition_table
+        self._move_picker = MovePicker()
+
+        # Statistics are counted by wrappers of the transposition table and
+        # move picker, so the search itself has no extra work when disabled.
+        self._stats = None
+        if collects_stats:
+            self._stats = SearchStats()
+            self._transposition_table = CountingTranspositionTable(
+                self._transposition_table, self._stats
+            )
+            self._move_picker = CountingMovePicker(self._stats)
+        self._iterations: list[SearchIteration] = []
+        self._nodes = 0
+        self._quiescence_nodes = 0
+        self._start_time = 0.0
+        # When the time limit started counting, which for a pondering search is
+        # when its move is played.
+        self._limit_start_time = 0.0
+        self._is_stopped = False
+        self._on_iteration: Callable[[SearchIteration], None] | None = None
+
+        self._is_pondering = False
+        self._ponder_thread: threading.Thread | None = None
+        self._ponder_key: int | None = None
+        self._ponder_move: int | None = None
+
+    @property
+    def iterations(self) -> list[SearchIteration]:
+        """Return the completed iterations of the last search."""
+        return self._iterations
+
+    @property
+    def stats(self) -> SearchStats | None:
+        """Return the statistics of the last search, or None if the bot does not
+        collect them. Only nodes searched in this process are counted."""
+        return self._stats
+
+    @property
+    def node_count(self) -> int:
+        """Return the number of nodes the last search visited, including
+        quiescence nodes and any unfinished iteration."""
+        return self._nodes + self._quiescence_nodes
+
+    def close(self) -> None:
+        """Stop pondering, shut down the worker processes, if any were started,
+        and free the shared transposition table."""
+        self.stop_pondering()
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
+        if self._shared_transposition_table is not None:
+            self._shared_transposition_table.close()
+
+    def set_limits(
+        self,
+        depth: int,
+        time_limit: float | None = None,
+        node_limit: int | None = None,
+    ) -> None:
+        """Change the limits of the next searches, keeping what the bot learned
+        from earlier ones."""
+        self._depth = depth
+        self._time_limit = time_limit
+        self._node_limit = node_limit
+
+    def new_game(self) -> None:
+        """Stop pondering and forget what earlier searches learned."""
+        self.stop_pondering()
+        self._transposition_table.clear()
+
+    def stop(self) -> None:
+        """Stop a search running in another thread. It then returns the best
+        move of its last completed iteration."""
+        self._is_stopped = True
+        if self._shared_stop_flag is not None:
+            self._shared_stop_flag.value = True
+
+    def start_workers(self) -> None:
+        """Start the worker processes now instead of on the first search that
+        needs them. Processes started while another thread is blocked reading
+        stdin hang, so front ends that read commands during searches start them
+        up front."""
+        if self._worker_count > 1:
+            self._start_workers()
+            # The pool only starts its processes once it is given work.
+            self._executor.submit(int).result()
+
+    def calculate_best_move(
+        self,
+        color: Color,
+        board: Board,
+        on_iteration: Callable[[SearchIteration], None] | None = None,
+    ) -> int:
+        """Search with iterative deepening and return the best move of the last
+        completed iteration as a packed move, calling on_iteration with each
+        iteration as it completes. Book and tablebase moves are returned without
+        any iterations."""
+        self._on_iteration = on_iteration
+        best_move = self._calculate_best_move(color, board)
+        self._on_iteration = None
+        if self._stats is not None:
+            self._stats.nodes = self.node_count
+            self._stats.leaf_evaluations = self._quiescence_nodes
+            self._stats.record_iterations(self._iterations)
+        return best_move
+
+    def start_pondering(self, color: Color, board: Board) -> int | None:
+        """Guess the color's reply from the last search and search the position
+        after it in a background thread until the next call to
+        calculate_best_move, which serves or continues that search if the guess
+        was played. Return the guessed move, or None if there is nothing to
+        ponder. Pondering searches in this process only, without workers."""
+        self.stop_pondering()
+        legal_moves = list(Rules.generate_legal_moves(color, board))
+        move = None
+        if self._iterations and len(self._iterations[-1].principal_variation) > 1:
+            move = self._iterations[-1].principal_variation[1]
+        if move not in legal_moves:
+            entry = self._uncounted_transposition_table.probe(
+                board.get_position_key(color)
+            )
+            move = entry[3] if entry is not None else None
+        if move not in legal_moves:
+            return None
+
+        ponder_board = Board()
+        ponder_board._set_bitboards(board._bitboards.copy())
+        ponder_board.make_packed_move(move)
+        ponder_color = color.opposite
+        if (
+            self._opening_book is not None
+            and self._opening_book.choose_move(ponder_color, ponder_board) is not None
+        ) or (
+            self._tablebase is not None
+            and self._tablebase.choose_move(ponder_color, ponder_board) is not None
+        ):
+            return None
+        moves = list(Rules.generate_legal_moves(ponder_color, ponder_board))
+        if not moves:
+            return None
+
+        self._reset_search()
+        if self._shared_stop_flag is not None:
+            self._shared_stop_flag.value = False
+        self._is_pondering = True
+        self._ponder_key = ponder_board.get_position_key(ponder_color)
+        self._ponder_thread = threading.Thread(
+            target=self._ponder, args=(ponder_color, moves, ponder_board), daemon=True
+        )
+        self._ponder_thread.start()
+        return move
+
+    def stop_pondering(self) -> None:
+        """Stop the background search, if any, and discard its result. The
+        transposition table keeps what it found."""
+        if self._ponder_thread is None:
+            return
+        self._is_stopped = True
+        self._ponder_thread.join()
+        self._ponder_thread = None
+        self._is_pondering = False
+
+    def _ponder(self, color: Color, moves: list[int], board: Board) -> None:
+        self._ponder_move = self._search_iteratively(color, moves, board)
+
+    def _finish_pondering(self) -> int:
+        """Let the background search run to its limits, counting time from now,
+        and return its best move."""
+        self._limit_start_time = time.perf_counter()
+        self._is_pondering = False
+        self._ponder_thread.join()
+        self._ponder_thread = None
+        return self._ponder_move
+
+    def _calculate_best_move(self, color: Color, board: Board) -> int:
+        if self._ponder_thread is not None:
+            if board.get_position_key(color) == self._ponder_key:
+                return self._finish_pondering()
+            self.stop_pondering()
+
+        self._reset_search()
+        if self._opening_book is not None:
+            book_move = self._opening_book.choose_move(color, board)
+            if book_move is not None:
+                return book_move
+        if self._tablebase is not None:
+            tablebase_move = self._tablebase.choose_move(color, board)
+            if tablebase_move is not None:
+                return tablebase_move
 
-    def calculate_best_move(self, color: Color, board: Board) -> Move:
         moves = list(Rules.generate_legal_moves(color, board))
-        scores = self._calculate_move_scores(moves, board)
-        best_score = max(scores) if color == Color.WHITE else min(scores)
-        best_index = scores.index(best_score)
-        best_move = moves[best_index]
+        if self._worker_count == 1 or len(moves) == 1:
+            return self._search_iteratively(color, moves, board)
+
+        self._start_workers()
+        if self._parallel_mode == ParallelMode.ROOT_SPLIT:
+            return self._search_iteratively(color, moves, board, is_root_split=True)
+
+        # The helpers only fill the shared transposition table; the result is
+        # the one of the main search in this process. Half of the helpers stay a
+        # ply ahead of it so they search different nodes.
+        bitboards = board._bitboards.copy()
+        helper_futures = [
+            self._executor.submit(
+                _search_as_helper, bitboards, color, self._depth, index % 2
+            )
+            for index in range(1, self._worker_count)
+        ]
+        try:
+            return self._search_iteratively(color, moves, board)
+        finally:
+            self._shared_stop_flag.value = True
+            for future in helper_futures:
+                future.result()
+
+    def _reset_search(self) -> None:
+        if self._stats is not None:
+            self._stats.reset()
+        self._transposition_table.new_search()
+        self._move_picker.clear()
+        self._iterations = []
+        self._nodes = 0
+        self._quiescence_nodes = 0
+        self._start_time = time.perf_counter()
+        self._limit_start_time = self._start_time
+        self._is_stopped = False
+
+    def _search_iteratively(
+        self,
+        color: Color,
+        moves: list[int],
+        board: Board,
+        is_root_split: bool = False,
+        first_depth: int = 1,
+    ) -> int:
+        """Search one more ply per iteration and return the best move of the
+        last completed one. Scores are from the color's point of view here and
+        from white's in the iterations."""
+        best_move = moves[0]
+        best_score = None
+        for depth in range(first_depth, self._depth + 1):
+            # Search the previous iteration's best move first.
+            moves.sort(key=lambda move: move != best_move)
+            if is_root_split:
+                current_best_score, current_best_move, principal_variation = (
+                    self._search_root_in_parallel(color, depth, moves, board)
+                )
+            else:
+                current_best_score, current_best_move = (
+                    self._search_root_with_aspiration(
+                        color, depth, moves, board, best_score
+                    )
+                )
+                principal_variation = None
+            if self._is_stopped:
+                break
+
+            best_score = current_best_score
+            best_move = current_best_move
+            if principal_variation is None:
+                principal_variation = self._get_principal_variation(color, depth, board)
+            iteration = SearchIteration(
+                depth,
+                best_score if color == Color.WHITE else -best_score,
+                self._nodes,
+                self._quiescence_nodes,
+                time.perf_counter() - self._start_time,
+                principal_variation,
+            )
+            self._iterations.append(iteration)
+            if self._on_iteration is not None:
+                self._on_iteration(iteration)
+
+            if best_score == _MAX_SCORE:
+                break
+
+            # Workers only report their nodes once a root move is done, so the
+            # node limit is enforced between iterations.
+            nodes = self._nodes + self._quiescence_nodes
+            if (
+                self._node_limit is not None
+                and nodes >= self._node_limit
+                and not self._is_pondering
+            ):
+                break
         return best_move
 
-    def _calculate_move_scores(self, moves: list[Move], board: Board) -> list[int]:
-        scores = []
-        for move in moves:
-            board.make_move(move)
-            score = self._minimax(
-                move.color.opposite, self._depth - 1, _MIN_SCORE, _MAX_SCORE, board
+    def _search_root_with_aspiration(
+        self,
+        color: Color,
+        depth: int,
+        moves: list[int],
+        board: Board,
+        previous_score: float | None,
+    ) -> tuple[float, int]:
+        """Search the root in a window around the previous iteration's score,
+        widening the side the score falls out of until it lands inside."""
+        if previous_score is None:
+            return self._search_root(color, depth, moves, board, _MIN_SCORE, _MAX_SCORE)
+
+        window = _ASPIRATION_WINDOW
+        alpha = max(_MIN_SCORE, previous_score - window)
+        beta = min(_MAX_SCORE, previous_score + window)
+        while True:
+            best_score, best_move = self._search_root(
+                color, depth, moves, board, alpha, beta
+            )
+            if self._is_stopped:
+                return best_score, best_move
+
+            window *= _ASPIRATION_WINDOW_GROWTH
+            if best_score <= alpha and alpha > _MIN_SCORE:
+                alpha = max(_MIN_SCORE, alpha - window)
+            elif best_score >= beta and beta < _MAX_SCORE:
+                beta = min(_MAX_SCORE, beta + window)
+                # The move that failed high is searched first next time.
+                moves.sort(key=lambda move: move != best_move)
+            else:
+                return best_score, best_move
+
+    def _search_root(
+        self,
+        color: Color,
+        depth: int,
+        moves: list[int],
+        board: Board,
+        alpha: float,
+        beta: float,
+    ) -> tuple[float, int]:
+        original_alpha = alpha
+        best_score = _MIN_SCORE
+        best_move = moves[0]
+        for index, move in enumerate(moves):
+            board.make_packed_move(move)
+            score = self._search_move(color, depth, 1, alpha, beta, board, index == 0)
+            board.undo_packed_move(move)
+
+            if self._is_stopped:
+                break
+
+            if index == 0 or score > best_score:
+                best_score = score
+                best_move = move
+            alpha = max(alpha, best_score)
+            if alpha >= beta:
+                break
+
+        if not self._is_stopped:
+            self._transposition_table.store(
+                board.get_position_key(color),
+                depth,
+                _get_bound(best_score, original_alpha, beta),
+                best_score,
+                best_move,
+            )
+        return best_score, best_move
+
+    def _search_move(
+        self,
+        color: Color,
+        depth: int,
+        ply: int,
+        alpha: float,
+        beta: float,
+        board: Board,
+        is_first_move: bool,
+        reduction: int = 0,
+    ) -> float:
+        """Return the score for the color of the move just made (principal
+        variation search). Only the first move gets the full window; the rest
+        are searched with a null window that just tests whether they beat
+        alpha, and searched again with the full window if they do. A reduced
+        move is tested at the reduced depth first."""
+        if is_first_move:
+            return -self._negamax(color.opposite, depth - 1, ply, -beta, -alpha, board)
+
+        if reduction:
+            score = -self._negamax(
+                color.opposite,
+                depth - 1 - reduction,
+                ply,
+                -alpha - _NULL_WINDOW,
+                -alpha,
+                board,
+            )
+            if score <= alpha or self._is_stopped:
+                return score
+
+        score = -self._negamax(
+            color.opposite, depth - 1, ply, -alpha - _NULL_WINDOW, -alpha, board
+        )
+        if alpha < score < beta and not self._is_stopped:
+            score = -self._negamax(color.opposite, depth - 1, ply, -beta, -alpha, board)
+        return score
+
+    def _start_workers(self) -> None:
+        if self._executor is None:
+            self._shared_bound = multiprocessing.Value("d", 0.0)
+            self._shared_stop_flag = multiprocessing.Value("b", False)
+            if self._parallel_mode == ParallelMode.LAZY_SMP:
+                # This process runs the main search alongside the helpers.
+                process_count = self._worker_count - 1
+                shared_table_name = self._shared_transposition_table.name
+            else:
+                process_count = self._worker_count
+                shared_table_name = None
+            self._executor = ProcessPoolExecutor(
+                process_count,
+                initializer=_initialize_worker,
+                initargs=(
+                    self._transposition_table_size_mb,
+                    self._positional_score_weight,
+                    self._search_features,
+                    shared_table_name,
+                    self._shared_bound,
+                    self._shared_stop_flag,
+                ),
+            )
+        self._shared_stop_flag.value = False
+
+    def _search_root_in_parallel(
+        self, color: Color, depth: int, moves: list[int], board: Board
+    ) -> tuple[float, int, tuple[int, ...] | None]:
+        """Search the first root move here and the rest in the worker processes,
+        which share the best score so far to narrow each other's windows.
+        Return the best score, best move and its principal variation, if it was
+        found by a worker."""
+        # The first move is usually the best, so searching it alone first gives
+        # the workers a good bound to start from.
+        first_move = moves[0]
+        board.make_packed_move(first_move)
+        best_score = self._search_move(
+            color, depth, 1, _MIN_SCORE, _MAX_SCORE, board, True
+        )
+        board.undo_packed_move(first_move)
+        if self._is_stopped:
+            return best_score, first_move, None
+
+        self._shared_bound.value = best_score
+        self._shared_stop_flag.value = False
+        bitboards = board._bitboards.copy()
+        futures = [
+            self._executor.submit(_search_root_move, bitboards, color, depth, move)
+            for move in moves[1:]
+        ]
+
+        timeout = None
+        if self._time_limit is not None and self._iterations:
+            timeout = max(
+                0.0,
+                self._time_limit - (time.perf_counter() - self._limit_start_time),
+            )
+        _, pending_futures = wait(futures, timeout)
+        if pending_futures:
+            self._shared_stop_flag.value = True
+            self._is_stopped = True
+            wait(pending_futures)
+
+        best_move = first_move
+        principal_variation = None
+        for future in futures:
+            result = future.result()
+            self._nodes += result.nodes
+            self._quiescence_nodes += result.quiescence_nodes
+            if result.is_stopped or not result.is_exact:
+                continue
+
+            if result.score > best_score:
+                best_score = result.score
+                best_move = result.move
+                principal_variation = result.principal_variation
+
+        if not self._is_stopped:
+            self._transposition_table.store(
+                board.get_position_key(color),
+                depth,
+                Bound.EXACT,
+                best_score,
+                best_move,
             )
-            board.undo_move(move)
-            scores.append(score)
-        return scores
+        return best_score, best_move, principal_variation
 
-    def _minimax(
-        self, color: Color, depth: int, alpha: float, beta: float, board: Board
+    def _check_limits(self) -> None:
+        """Stop the search if it ran out of nodes or time. The first iteration
+        always completes so there is a move to play, and a pondering search has
+        no limits until its move is played."""
+        nodes = self._nodes + self._quiescence_nodes
+        if (
+            self._shared_stop_flag is not None
+            and nodes % _TIME_CHECK_INTERVAL == 0
+            and self._shared_stop_flag.value
+        ):
+            self._is_stopped = True
+            return
+
+        if self._is_pondering or not self._iterations:
+            return
+
+        if self._node_limit is not None and nodes >= self._node_limit:
+            self._is_stopped = True
+        elif (
+            self._time_limit is not None
+            and nodes % _TIME_CHECK_INTERVAL == 0
+            and time.perf_counter() - self._limit_start_time >= self._time_limit
+        ):
+            self._is_stopped = True
+
+    def _get_principal_variation(
+        self, color: Color, depth: int, board: Board
+    ) -> tuple[int, ...]:
+        """Return the best line found, following best moves in the transposition
+        table."""
+        principal_variation = []
+        for _ in range(depth):
+            entry = self._uncounted_transposition_table.probe(
+                board.get_position_key(color)
+            )
+            if entry is None or entry[3] is None:
+                break
+
+            move = entry[3]
+            if move not in Rules.generate_legal_moves(color, board):
+                break
+
+            board.make_packed_move(move)
+            principal_variation.append(move)
+            color = color.opposite
+
+        for move in reversed(principal_variation):
+            board.undo_packed_move(move)
+        return tuple(principal_variation)
+
+    def _negamax(
+        self,
+        color: Color,
+        depth: int,
+        ply: int,
+        alpha: float,
+        beta: float,
+        board: Board,
+        allows_null_move: bool = True,
     ) -> float:
+        """Return the score of the position for the color to move, exact if it
+        is between alpha and beta and otherwise a bound on that side."""
+        if (
+            self._tablebase is not None
+            and board.get_mask().bit_count() <= self._tablebase.max_piece_count
+        ):
+            entry = self._tablebase.probe(color, board)
+            if entry is not None:
+                return _get_tablebase_score(*entry)
+
         if depth == 0:
-            return Engine.evaluate(board)
+            return self._quiescence(color, alpha, beta, board)
 
-        if Rules.is_in_checkmate(color, board):
-            return _MIN_SCORE if color == Color.WHITE else _MAX_SCORE
-        elif Rules.is_in_stalemate(color, board):
+        self._nodes += 1
+        self._check_limits()
+        if self._is_stopped:
             return 0
 
-        board_hash = hash(board)
-        if board_hash in self._cache:
-            cached_depth, cached_score = self._cache[board_hash]
-            if cached_depth >= depth:
-                return cached_score
-        else:
-            self._cache[board_hash] = (
-                depth,
-                _MIN_SCORE if color == Color.WHITE else _MAX_SCORE,
+        key = board.get_position_key(color)
+        hash_move = None
+        entry = self._transposition_table.probe(key)
+        if entry is not None:
+            entry_depth, entry_bound, entry_score, entry_move = entry
+            if entry_depth >= depth and (
+                entry_bound == Bound.EXACT
+                or (entry_bound == Bound.LOWER and entry_score >= beta)
+                or (entry_bound == Bound.UPPER and entry_score <= alpha)
+            ):
+                return entry_score
+            if entry_move is not None and self._fits_board(entry_move, board):
+                hash_move = entry_move
+
+        is_in_check = bool(self._search_features) and Rules.is_in_check(color, board)
+        if (
+            self._uses_null_move_pruning
+            and allows_null_move
+            and depth >= _NULL_MOVE_MIN_DEPTH
+            and not is_in_check
+            and self._has_pieces(color, board)
+        ):
+            # If passing still fails high, a real move almost surely would too.
+            # Without pieces, passing may be better than any move (zugzwang).
+            null_move_score = -self._negamax(
+                color.opposite,
+                depth - 1 - _NULL_MOVE_REDUCTION,
+                ply + 1,
+                -beta,
+                -beta + _NULL_WINDOW,
+                board,
+                False,
             )
+            if self._is_stopped:
+                return 0
+            if null_move_score >= beta:
+                return beta
 
-        moves = Rules.generate_legal_moves(color, board)
-        best_score = _MIN_SCORE if color == Color.WHITE else _MAX_SCORE
-        for move in moves:
-            board.make_move(move)
-            if Rules.can_promote(move):
-                board._set_piece(Queen(move.color), move.to_square_mask)
-            current_score = self._minimax(color.opposite, depth - 1, alpha, beta, board)
-            board.undo_move(move)
-
-            if color == Color.WHITE:
-                best_score = max(best_score, current_score)
-                alpha = max(alpha, best_score)
-            else:
-                best_score = min(best_score, current_score)
-                beta = min(beta, best_score)
+        # Near the horizon, a quiet move is futile if even the evaluation plus a
+        # margin cannot reach alpha. That margin is the score a pruned move is
+        # assumed to reach, so a fail low never stores a lower upper bound.
+        futility_score = None
+        if self._uses_futility_pruning and depth == 1 and not is_in_check:
+            futility_score = self._evaluate(color, board) + _FUTILITY_MARGIN
+        is_futile = futility_score is not None and futility_score <= alpha
+        reduces_late_moves = (
+            self._uses_late_move_reductions
+            and depth >= _LATE_MOVE_MIN_DEPTH
+            and not is_in_check
+        )
 
+        original_alpha = alpha
+        best_score = _MIN_SCORE
+        best_move = None
+        for index, move in enumerate(
+            self._move_picker.generate_moves(color, board, ply, hash_move)
+        ):
+            board.make_packed_move(move)
+            reduction = 0
+            if (
+                best_move is not None
+                and (is_futile or (reduces_late_moves and index >= _LATE_MOVE_INDEX))
+                and self._is_quiet_move(move, color, board)
+            ):
+                if is_futile:
+                    board.undo_packed_move(move)
+                    best_score = max(best_score, futility_score)
+                    continue
+                reduction = _LATE_MOVE_REDUCTION
+            current_score = self._search_move(
+                color, depth, ply + 1, alpha, beta, board, best_move is None, reduction
+            )
+            board.undo_packed_move(move)
+
+            if self._is_stopped:
+                return 0
+
+            if best_move is None or current_score > best_score:
+                best_score = current_score
+                best_move = move
+            alpha = max(alpha, best_score)
             if alpha >= beta:
+                self._move_picker.record_cutoff(move, depth, ply)
                 break
 
-        self._cache[board_hash] = depth, best_score
+        if best_move is None:
+            if Rules.is_in_check(color, board):
+                return _MIN_SCORE
+            return 0
+
+        self._transposition_table.store(
+            key,
+            depth,
+            _get_bound(best_score, original_alpha, beta),
+            best_score,
+            best_move,
+        )
+        return best_score
+
+    def _quiescence(
+        self, color: Color, alpha: float, beta: float, board: Board
+    ) -> float:
+        """Return the score of the position for the color to move once it is
+        quiet, only searching captures so the evaluation is not taken in the
+        middle of an exchange."""
+        self._quiescence_nodes += 1
+        self._check_limits()
+        if self._is_stopped:
+            return 0
+
+        # Not capturing is always an option, so the static evaluation is a bound.
+        stand_pat_score = self._evaluate(color, board)
+        if stand_pat_score >= beta:
+            return stand_pat_score
+        alpha = max(alpha, stand_pat_score)
+
+        best_score = stand_pat_score
+        for move in MovePicker.generate_capture_moves(color, board):
+            if self._is_futile_capture(move, stand_pat_score, alpha):
+                continue
+
+            board.make_packed_move(move)
+            score = -self._quiescence(color.opposite, -beta, -alpha, board)
+            board.undo_packed_move(move)
+
+            if self._is_stopped:
+                return 0
+
+            best_score = max(best_score, score)
+            alpha = max(alpha, best_score)
+            if alpha >= beta:
+                break
         return best_score
 
-    # Sorting moves didn't improve performance due to lazy loading tradeoff.
-    def _sort_moves(self, moves: list[Move]) -> list[Move]:
-        """Return the moves in LVA-MVV order."""
-        return sorted(moves, key=self._compare_move)
+    def _evaluate(self, color: Color, board: Board) -> float:
+        """Return the static evaluation for the color to move."""
+        score = Engine.evaluate(board, self._positional_score_weight)
+        return score if color == Color.WHITE else -score
+
+    @staticmethod
+    def _has_pieces(color: Color, board: Board) -> bool:
+        """Return whether the color has pieces other than pawns and its king."""
+        return any(board.get_bitboards(color)[KNIGHT_INDEX:KING_INDEX])
+
+    @staticmethod
+    def _is_quiet_move(move: int, color: Color, board: Board) -> bool:
+        """Return whether the move, already made, is not a capture, promotion
+        or check, so skipping or reducing it is unlikely to miss a tactic."""
+        return (
+            not is_capture(move)
+            and not is_promotion(move)
+            and not Rules.is_in_check(color.opposite, board)
+        )
+
+    @staticmethod
+    def _is_futile_capture(move: int, stand_pat_score: float, alpha: float) -> bool:
+        """Return whether the capture cannot raise the score to alpha even with
+        a margin on top of the material it wins (delta pruning)."""
+        material_gain = PIECES[get_captured_piece_index(move)].VALUE + _DELTA_MARGIN
+        if is_promotion(move):
+            material_gain += Queen.VALUE - Pawn.VALUE
+        return stand_pat_score + material_gain <= alpha
+
+    @staticmethod
+    def _fits_board(move: int, board: Board) -> bool:
+        """Return whether the moved and captured pieces of the move are where it
+        expects them, guarding against hash moves from colliding keys."""
+        return board._mailbox[get_from_square_shift(move)] == get_moved_piece_index(
+            move
+        ) and board._mailbox[get_to_square_shift(move)] == get_captured_piece_index(
+            move
+        )
+
+
+def _get_bound(score: float, alpha: float, beta: float) -> Bound:
+    """Return what a score searched with the window is known to be."""
+    if score <= alpha:
+        return Bound.UPPER
+    if score >= beta:
+        return Bound.LOWER
+    return Bound.EXACT
+
+
+def _get_tablebase_score(result: Wdl, distance: int) -> float:
+    """Return the score of a tablebase result for the color to move."""
+    if result == Wdl.DRAW:
+        return 0
+    score = TABLEBASE_WIN_SCORE - distance
+    return score if result == Wdl.WIN else -score
+
+
+def _initialize_worker(
+    transposition_table_size_mb: int,
+    positional_score_weight: float,
+    search_features: frozenset[SearchFeature],
+    shared_table_name: str | None,
+    shared_bound,
+    shared_stop_flag,
+) -> None:
+    global _worker_bot
+    _worker_bot = Bot(
+        0,
+        transposition_table_size_mb=transposition_table_size_mb,
+        positional_score_weight=positional_score_weight,
+        search_features=search_features,
+    )
+    if shared_table_name is not None:
+        _worker_bot._transposition_table = SharedTranspositionTable(
+            transposition_table_size_mb, shared_table_name
+        )
+        _worker_bot._uncounted_transposition_table = _worker_bot._transposition_table
+    _worker_bot._shared_bound = shared_bound
+    _worker_bot._shared_stop_flag = shared_stop_flag
+
+
+def _search_as_helper(
+    bitboards: list[int], color: Color, depth: int, depth_offset: int
+) -> None:
+    """Search the position in a helper process until the main search stops it,
+    starting and ending the given number of plies deeper."""
+    bot = _worker_bot
+    bot._reset_search()
+    bot._depth = depth + depth_offset
+    board = Board()
+    board._set_bitboards(bitboards)
+    moves = list(Rules.generate_legal_moves(color, board))
+    bot._search_iteratively(color, moves, board, first_depth=1 + depth_offset)
+
+
+def _search_root_move(
+    bitboards: list[int], color: Color, depth: int, move: int
+) -> _RootMoveResult:
+    """Search a root move in a worker process, starting from the best score the
+    other root moves have reached so far."""
+    bot = _worker_bot
+    bot._nodes = 0
+    bot._quiescence_nodes = 0
+    bot._is_stopped = False
+    board = Board()
+    board._set_bitboards(bitboards)
+
+    alpha = bot._shared_bound.value
+    board.make_packed_move(move)
+    score = bot._search_move(color, depth, 1, alpha, _MAX_SCORE, board, False)
+    principal_variation = (move,) + bot._get_principal_variation(
+        color.opposite, depth - 1, board
+    )
 
-    def _compare_move(self, move: Move) -> tuple[int, int]:
-        from_piece_value = getattr(move.from_piece, "VALUE", 0)
-        to_piece_value = getattr(move.to_piece, "VALUE", 0)
-        return from_piece_value, -to_piece_value
+    # A score at or below the shared bound is only an upper bound, so the move
+    # cannot be better than one already searched.
+    is_exact = score > alpha
+    if is_exact and not bot._is_stopped:
+        with bot._shared_bound.get_lock():
+            bot._shared_bound.value = max(bot._shared_bound.value, score)
+    return _RootMoveResult(
+        move,
+        score,
+        is_exact,
+        bot._nodes,
+        bot._quiescence_nodes,
+        principal_variation,
+        bot._is_stopped,
+    )
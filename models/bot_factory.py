@@ -1,7 +1,21 @@
 from models.bot import Bot
+from models.opening_book import OpeningBook
+from models.tablebase import Tablebase
 
 
 class BotFactory:
-    @staticmethod
-    def get_bot(depth: int) -> Bot:
-        return Bot(depth)
+    def __init__(
+        self,
+        opening_book: OpeningBook | None = None,
+        tablebase: Tablebase | None = None,
+    ) -> None:
+        self._opening_book = opening_book
+        self._tablebase = tablebase
+
+    def get_bot(self, depth: int, time_limit: float | None = None) -> Bot:
+        return Bot(
+            depth,
+            time_limit,
+            opening_book=self._opening_book,
+            tablebase=self._tablebase,
+        )
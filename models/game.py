@@ -5,10 +5,19 @@ from models.move import Move
 
 
 class Game:
-    def __init__(self, board: Board) -> None:
+    def __init__(self, board: Board, current_color: Color = Color.WHITE) -> None:
         self._board = board
-        self._current_color = Color.WHITE
+        self._current_color = current_color
         self.status = GameStatus.ACTIVE
 
+    @classmethod
+    def from_fen(cls, fen: str) -> Game:
+        """Return a game continuing from a FEN string, with its color to move."""
+        board, color = Board.from_fen(fen)
+        return cls(board, color)
+
+    def to_fen(self) -> str:
+        return self._board.to_fen(self._current_color)
+
     def make_move(self, move: Move) -> None:
         self._board.make_move(move)
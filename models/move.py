@@ -14,6 +14,15 @@ class Move:
     to_piece: Piece | None
     color: Color
 
+    def __str__(self) -> str:
+        """Return the move in "rcrc" format (row/column → row/column)."""
+        from_coordinate = Coordinate.from_mask(self.from_square_mask)
+        to_coordinate = Coordinate.from_mask(self.to_square_mask)
+        return (
+            f"{from_coordinate.row_index}{from_coordinate.column_index}"
+            f"{to_coordinate.row_index}{to_coordinate.column_index}"
+        )
+
     @classmethod
     def from_coordinates(
         cls,
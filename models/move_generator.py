@@ -1,12 +1,31 @@
-from typing import Generator
-
+from typing import Callable, Generator
+
+from constants.board_constants import FIRST_ROW_MASK, FULL_MASK, LAST_ROW_MASK
+from constants.piece_constants import (
+    BISHOP_INDEX,
+    COLOR_PIECE_TYPE_COUNT,
+    KING_INDEX,
+    KNIGHT_INDEX,
+    NO_PIECE_INDEX,
+    PAWN_INDEX,
+    QUEEN_INDEX,
+    ROOK_INDEX,
+)
 from enums.color import Color
+from models.attack_tables import (
+    BETWEEN_MASKS,
+    BLACK_PAWN_ATTACK_MASKS,
+    KING_ATTACK_MASKS,
+    KNIGHT_ATTACK_MASKS,
+    WHITE_PAWN_ATTACK_MASKS,
+    get_bishop_attacks_mask,
+    get_queen_attacks_mask,
+    get_rook_attacks_mask,
+)
 from models.board import Board
-from models.coordinate import Coordinate
-from models.move import Move
-from models.piece import Pawn
-from utils.bit_utils import intersects, signed_shift
-from utils.board_utils import enumerate_mask, is_diagonal, is_orthogonal
+from utils.bit_utils import get_shift, signed_shift
+from utils.board_utils import enumerate_mask
+from utils.move_utils import pack_move
 
 UP_MASK = 0b00000000_11111111_11111111_11111111_11111111_11111111_11111111_11111111
 DOWN_MASK = 0b11111111_11111111_11111111_11111111_11111111_11111111_11111111_00000000
@@ -28,24 +47,6 @@ UP_RIGHT_SHIFT = 9
 DOWN_LEFT_SHIFT = -9
 DOWN_RIGHT_SHIFT = -7
 
-UP2_LEFT_MASK = signed_shift(UP_LEFT_MASK, DOWN_SHIFT)
-UP2_RIGHT_MASK = signed_shift(UP_RIGHT_MASK, DOWN_SHIFT)
-DOWN2_LEFT_MASK = DOWN_LEFT_MASK & signed_shift(DOWN_LEFT_MASK, UP_SHIFT)
-DOWN2_RIGHT_MASK = DOWN_RIGHT_MASK & signed_shift(DOWN_RIGHT_MASK, UP_SHIFT)
-LEFT2_UP_MASK = UP_LEFT_MASK & signed_shift(UP_LEFT_MASK, RIGHT_SHIFT)
-LEFT2_DOWN_MASK = DOWN_LEFT_MASK & signed_shift(DOWN_LEFT_MASK, RIGHT_SHIFT)
-RIGHT2_UP_MASK = UP_RIGHT_MASK & signed_shift(UP_RIGHT_MASK, LEFT_SHIFT)
-RIGHT2_DOWN_MASK = DOWN_RIGHT_MASK & signed_shift(DOWN_RIGHT_MASK, LEFT_SHIFT)
-
-UP2_LEFT_SHIFT = 15
-UP2_RIGHT_SHIFT = 17
-DOWN2_LEFT_SHIFT = -17
-DOWN2_RIGHT_SHIFT = -15
-LEFT2_UP_SHIFT = 6
-LEFT2_DOWN_SHIFT = -10
-RIGHT2_UP_SHIFT = 10
-KNIGHT_RIGHT2_DOWN_SHIFT = -6
-
 PAWN_CAPTURE_UP_TRANSFORMS = [
     (UP_LEFT_MASK, UP_LEFT_SHIFT),
     (UP_RIGHT_MASK, UP_RIGHT_SHIFT),
@@ -56,38 +57,6 @@ PAWN_CAPTURE_DOWN_TRANSFORMS = [
 ]
 PAWN_MOVE_UP_TRANSFORMS = [(UP_MASK, UP_SHIFT)]
 PAWN_MOVE_DOWN_TRANSFORMS = [(DOWN_MASK, DOWN_SHIFT)]
-ORTHOGONAL_TRANSFORMS = [
-    (UP_MASK, UP_SHIFT),
-    (DOWN_MASK, DOWN_SHIFT),
-    (LEFT_MASK, LEFT_SHIFT),
-    (RIGHT_MASK, RIGHT_SHIFT),
-]
-DIAGONAL_TRANSFORMS = [
-    (UP_LEFT_MASK, UP_LEFT_SHIFT),
-    (UP_RIGHT_MASK, UP_RIGHT_SHIFT),
-    (DOWN_LEFT_MASK, DOWN_LEFT_SHIFT),
-    (DOWN_RIGHT_MASK, DOWN_RIGHT_SHIFT),
-]
-KNIGHT_TRANSFORMS = [
-    (UP2_LEFT_MASK, UP2_LEFT_SHIFT),
-    (UP2_RIGHT_MASK, UP2_RIGHT_SHIFT),
-    (DOWN2_LEFT_MASK, DOWN2_LEFT_SHIFT),
-    (DOWN2_RIGHT_MASK, DOWN2_RIGHT_SHIFT),
-    (LEFT2_UP_MASK, LEFT2_UP_SHIFT),
-    (LEFT2_DOWN_MASK, LEFT2_DOWN_SHIFT),
-    (RIGHT2_UP_MASK, RIGHT2_UP_SHIFT),
-    (RIGHT2_DOWN_MASK, KNIGHT_RIGHT2_DOWN_SHIFT),
-]
-KING_TRANSFORMS = [
-    (UP_MASK, UP_SHIFT),
-    (DOWN_MASK, DOWN_SHIFT),
-    (LEFT_MASK, LEFT_SHIFT),
-    (RIGHT_MASK, RIGHT_SHIFT),
-    (UP_LEFT_MASK, UP_LEFT_SHIFT),
-    (UP_RIGHT_MASK, UP_RIGHT_SHIFT),
-    (DOWN_LEFT_MASK, DOWN_LEFT_SHIFT),
-    (DOWN_RIGHT_MASK, DOWN_RIGHT_SHIFT),
-]
 
 
 class MoveGenerator:
@@ -97,46 +66,37 @@ class MoveGenerator:
     ) -> int:
         """Return a mask of all pieces of the color attacking the target square."""
         if color == Color.WHITE:
-            pawn_transforms = PAWN_CAPTURE_DOWN_TRANSFORMS
-            pawn_bitboard = board._white_pawn_bitboard
-            knight_bitboard = board._white_knight_bitboard
-            bishop_bitboard = board._white_bishop_bitboard
-            rook_bitboard = board._white_rook_bitboard
-            queen_bitboard = board._white_queen_bitboard
-            king_bitboard = board._white_king_bitboard
+            pawn_attack_masks = BLACK_PAWN_ATTACK_MASKS
         else:
-            pawn_transforms = PAWN_CAPTURE_UP_TRANSFORMS
-            pawn_bitboard = board._black_pawn_bitboard
-            knight_bitboard = board._black_knight_bitboard
-            bishop_bitboard = board._black_bishop_bitboard
-            rook_bitboard = board._black_rook_bitboard
-            queen_bitboard = board._black_queen_bitboard
-            king_bitboard = board._black_king_bitboard
+            pawn_attack_masks = WHITE_PAWN_ATTACK_MASKS
+
+        (
+            pawn_bitboard,
+            knight_bitboard,
+            bishop_bitboard,
+            rook_bitboard,
+            queen_bitboard,
+            king_bitboard,
+        ) = board.get_bitboards(color)
+
+        if target_square_mask == 0:
+            return 0
 
         attacker_squares_mask = 0
 
         if board.is_occupied(target_square_mask, color.opposite):
             attacker_squares_mask |= cls._calculate_pattern_attacker_squares_mask(
-                target_square_mask, pawn_bitboard, pawn_transforms
+                target_square_mask, pawn_bitboard, pawn_attack_masks
             )
 
         attacker_squares_mask |= cls._calculate_pattern_attacker_squares_mask(
-            target_square_mask, knight_bitboard, KNIGHT_TRANSFORMS
+            target_square_mask, knight_bitboard, KNIGHT_ATTACK_MASKS
         )
         attacker_squares_mask |= cls._calculate_straight_attacker_squares_mask(
-            target_square_mask,
-            [bishop_bitboard, queen_bitboard],
-            DIAGONAL_TRANSFORMS,
-            board,
-        )
-        attacker_squares_mask |= cls._calculate_straight_attacker_squares_mask(
-            target_square_mask,
-            [rook_bitboard, queen_bitboard],
-            ORTHOGONAL_TRANSFORMS,
-            board,
+            target_square_mask, bishop_bitboard, rook_bitboard, queen_bitboard, board
         )
         attacker_squares_mask |= cls._calculate_pattern_attacker_squares_mask(
-            target_square_mask, king_bitboard, KING_TRANSFORMS
+            target_square_mask, king_bitboard, KING_ATTACK_MASKS
         )
         return attacker_squares_mask
 
@@ -147,38 +107,31 @@ class MoveGenerator:
         """Return a bitboard of all non-king pieces of the color that can move to
         the empty target square."""
         if color == Color.WHITE:
-            pawn_transforms = PAWN_MOVE_DOWN_TRANSFORMS
-            pawn_bitboard = board._white_pawn_bitboard
-            knight_bitboard = board._white_knight_bitboard
-            bishop_bitboard = board._white_bishop_bitboard
-            rook_bitboard = board._white_rook_bitboard
-            queen_bitboard = board._white_queen_bitboard
+            pawn_move_shift = UP_SHIFT
         else:
-            pawn_transforms = PAWN_MOVE_UP_TRANSFORMS
-            pawn_bitboard = board._black_pawn_bitboard
-            knight_bitboard = board._black_knight_bitboard
-            bishop_bitboard = board._black_bishop_bitboard
-            rook_bitboard = board._black_rook_bitboard
-            queen_bitboard = board._black_queen_bitboard
+            pawn_move_shift = DOWN_SHIFT
+
+        (
+            pawn_bitboard,
+            knight_bitboard,
+            bishop_bitboard,
+            rook_bitboard,
+            queen_bitboard,
+            _,
+        ) = board.get_bitboards(color)
+
+        if target_square_mask == 0:
+            return 0
 
         attacker_squares_mask = 0
-        attacker_squares_mask |= cls._calculate_pattern_attacker_squares_mask(
-            target_square_mask, pawn_bitboard, pawn_transforms
+        attacker_squares_mask |= pawn_bitboard & signed_shift(
+            target_square_mask, -pawn_move_shift
         )
         attacker_squares_mask |= cls._calculate_pattern_attacker_squares_mask(
-            target_square_mask, knight_bitboard, KNIGHT_TRANSFORMS
-        )
-        attacker_squares_mask |= cls._calculate_straight_attacker_squares_mask(
-            target_square_mask,
-            [bishop_bitboard, queen_bitboard],
-            DIAGONAL_TRANSFORMS,
-            board,
+            target_square_mask, knight_bitboard, KNIGHT_ATTACK_MASKS
         )
         attacker_squares_mask |= cls._calculate_straight_attacker_squares_mask(
-            target_square_mask,
-            [rook_bitboard, queen_bitboard],
-            ORTHOGONAL_TRANSFORMS,
-            board,
+            target_square_mask, bishop_bitboard, rook_bitboard, queen_bitboard, board
         )
         return attacker_squares_mask
 
@@ -188,13 +141,7 @@ class MoveGenerator:
     ) -> int:
         """Return a mask of all squares surrounding the given square that are not
         occupied by the color."""
-        escape_squares_mask = 0
-        for transform_mask, transform_shift in KING_TRANSFORMS:
-            if intersects(square_mask, transform_mask):
-                escape_square_mask = signed_shift(square_mask, transform_shift)
-                if not board.is_occupied(escape_square_mask, color):
-                    escape_squares_mask |= escape_square_mask
-        return escape_squares_mask
+        return KING_ATTACK_MASKS[get_shift(square_mask)] & ~board.get_mask(color)
 
     @classmethod
     def calculate_intermediate_squares_mask(
@@ -202,216 +149,245 @@ class MoveGenerator:
     ) -> int:
         """Return a mask of all squares between two squares in a orthogonal or diagonal
         line."""
-        from_coordinate = Coordinate.from_mask(from_square_mask)
-        to_coordinate = Coordinate.from_mask(to_square_mask)
-        row_delta = to_coordinate.row_index - from_coordinate.row_index
-        column_delta = to_coordinate.column_index - from_coordinate.column_index
-
-        if not (
-            is_orthogonal(row_delta, column_delta)
-            or is_diagonal(row_delta, column_delta)
-        ):
-            return 0
+        return BETWEEN_MASKS[get_shift(from_square_mask)][get_shift(to_square_mask)]
 
-        if row_delta == 0:
-            row_shift = 0
-        elif row_delta > 0:
-            row_shift = UP_SHIFT
-        elif row_delta < 0:
-            row_shift = DOWN_SHIFT
-
-        if column_delta == 0:
-            column_shift = 0
-        elif column_delta > 0:
-            column_shift = RIGHT_SHIFT
-        elif column_delta < 0:
-            column_shift = LEFT_SHIFT
-
-        intermediate_squares_mask = 0
-        intermediate_square_mask = signed_shift(
-            signed_shift(from_square_mask, row_shift), column_shift
-        )
-        while intermediate_square_mask != to_square_mask:
-            intermediate_squares_mask |= intermediate_square_mask
-            intermediate_square_mask = signed_shift(
-                signed_shift(intermediate_square_mask, row_shift), column_shift
+    @classmethod
+    def calculate_attacked_squares_mask(
+        cls, color: Color, board: Board, board_mask: int | None = None
+    ) -> int:
+        """Return a mask of all squares attacked by the color. Sliders see through
+        any piece missing from the board mask, which defaults to all pieces."""
+        if color == Color.WHITE:
+            pawn_capture_transforms = PAWN_CAPTURE_UP_TRANSFORMS
+        else:
+            pawn_capture_transforms = PAWN_CAPTURE_DOWN_TRANSFORMS
+
+        (
+            pawn_bitboard,
+            knight_bitboard,
+            bishop_bitboard,
+            rook_bitboard,
+            queen_bitboard,
+            king_bitboard,
+        ) = board.get_bitboards(color)
+
+        if board_mask is None:
+            board_mask = board.get_mask()
+
+        attacked_squares_mask = 0
+        for transform_mask, transform_shift in pawn_capture_transforms:
+            attacked_squares_mask |= signed_shift(
+                pawn_bitboard & transform_mask, transform_shift
+            )
+        for square_mask in enumerate_mask(knight_bitboard):
+            attacked_squares_mask |= KNIGHT_ATTACK_MASKS[get_shift(square_mask)]
+        for square_mask in enumerate_mask(bishop_bitboard | queen_bitboard):
+            attacked_squares_mask |= get_bishop_attacks_mask(
+                get_shift(square_mask), board_mask
             )
-        return intermediate_squares_mask
+        for square_mask in enumerate_mask(rook_bitboard | queen_bitboard):
+            attacked_squares_mask |= get_rook_attacks_mask(
+                get_shift(square_mask), board_mask
+            )
+        for square_mask in enumerate_mask(king_bitboard):
+            attacked_squares_mask |= KING_ATTACK_MASKS[get_shift(square_mask)]
+        return attacked_squares_mask
 
     @classmethod
-    def generate_candidate_moves(cls, color: Color, board: Board) -> Generator[Move]:
+    def generate_candidate_moves(
+        cls, color: Color, board: Board, target_squares_mask: int = FULL_MASK
+    ) -> Generator[int]:
+        """Generate all pseudo-legal moves of the color to the target squares as
+        packed moves, e.g. only captures when the target squares are the
+        opponent's pieces."""
         if color == Color.WHITE:
             pawn_move_transforms = PAWN_MOVE_UP_TRANSFORMS
             pawn_capture_transforms = PAWN_CAPTURE_UP_TRANSFORMS
-            pawn_bitboard = board._white_pawn_bitboard
-            knight_bitboard = board._white_knight_bitboard
-            bishop_bitboard = board._white_bishop_bitboard
-            rook_bitboard = board._white_rook_bitboard
-            queen_bitboard = board._white_queen_bitboard
-            king_bitboard = board._white_king_bitboard
         else:
             pawn_move_transforms = PAWN_MOVE_DOWN_TRANSFORMS
             pawn_capture_transforms = PAWN_CAPTURE_DOWN_TRANSFORMS
-            pawn_bitboard = board._black_pawn_bitboard
-            knight_bitboard = board._black_knight_bitboard
-            bishop_bitboard = board._black_bishop_bitboard
-            rook_bitboard = board._black_rook_bitboard
-            queen_bitboard = board._black_queen_bitboard
-            king_bitboard = board._black_king_bitboard
+
+        (
+            pawn_bitboard,
+            knight_bitboard,
+            bishop_bitboard,
+            rook_bitboard,
+            queen_bitboard,
+            king_bitboard,
+        ) = board.get_bitboards(color)
+
+        target_squares_mask &= ~board.get_mask(color)
+        piece_index_offset = _get_piece_index_offset(color)
 
         yield from cls._generate_pawn_candidate_moves(
             pawn_bitboard,
             pawn_move_transforms,
             pawn_capture_transforms,
+            target_squares_mask,
             color,
             board,
         )
         yield from cls._generate_pattern_candidate_moves(
-            knight_bitboard, KNIGHT_TRANSFORMS, color, board
+            knight_bitboard,
+            KNIGHT_ATTACK_MASKS,
+            target_squares_mask,
+            piece_index_offset + KNIGHT_INDEX,
+            board,
         )
         yield from cls._generate_straight_candidate_moves(
-            bishop_bitboard, DIAGONAL_TRANSFORMS, color, board
+            bishop_bitboard,
+            get_bishop_attacks_mask,
+            target_squares_mask,
+            piece_index_offset + BISHOP_INDEX,
+            board,
         )
         yield from cls._generate_straight_candidate_moves(
-            rook_bitboard, ORTHOGONAL_TRANSFORMS, color, board
+            rook_bitboard,
+            get_rook_attacks_mask,
+            target_squares_mask,
+            piece_index_offset + ROOK_INDEX,
+            board,
         )
         yield from cls._generate_straight_candidate_moves(
             queen_bitboard,
-            DIAGONAL_TRANSFORMS + ORTHOGONAL_TRANSFORMS,
-            color,
+            get_queen_attacks_mask,
+            target_squares_mask,
+            piece_index_offset + QUEEN_INDEX,
             board,
         )
         yield from cls._generate_pattern_candidate_moves(
-            king_bitboard, KING_TRANSFORMS, color, board
+            king_bitboard,
+            KING_ATTACK_MASKS,
+            target_squares_mask,
+            piece_index_offset + KING_INDEX,
+            board,
         )
 
     @staticmethod
     def _calculate_pattern_attacker_squares_mask(
-        target_square_mask: int,
-        piece_bitboard: int,
-        piece_transforms: list[tuple[int, int]],
+        target_square_mask: int, piece_bitboard: int, piece_attack_masks: list[int]
     ) -> int:
-        piece_attacker_squares_mask = 0
-        for transform_mask, transform_shift in piece_transforms:
-            if intersects(target_square_mask, transform_mask):
-                piece_square_mask = signed_shift(target_square_mask, transform_shift)
-                if intersects(piece_bitboard, piece_square_mask):
-                    piece_attacker_squares_mask |= piece_square_mask
-        return piece_attacker_squares_mask
+        """Return a mask of the pieces on the bitboard attacking the target square.
+        The attack masks must be symmetric, i.e. a piece attacks the target
+        square if and only if the target square's mask contains the piece."""
+        return piece_attack_masks[get_shift(target_square_mask)] & piece_bitboard
 
     @staticmethod
     def _calculate_straight_attacker_squares_mask(
         target_square_mask: int,
-        piece_bitboards: list[int],
-        piece_transforms: list[tuple[int, int]],
+        bishop_bitboard: int,
+        rook_bitboard: int,
+        queen_bitboard: int,
         board: Board,
     ) -> int:
-        piece_attacker_squares_mask = 0
-        for transform_mask, transform_shift in piece_transforms:
-            piece_square_mask = target_square_mask
-            while intersects(piece_square_mask, transform_mask):
-                piece_square_mask = signed_shift(piece_square_mask, transform_shift)
-                if any(
-                    [
-                        intersects(piece_bitboard, piece_square_mask)
-                        for piece_bitboard in piece_bitboards
-                    ]
-                ):
-                    piece_attacker_squares_mask |= piece_square_mask
-
-                if board.is_occupied(piece_square_mask):
-                    break
-        return piece_attacker_squares_mask
+        target_square_shift = get_shift(target_square_mask)
+        board_mask = board.get_mask()
+        diagonal_attacks_mask = get_bishop_attacks_mask(target_square_shift, board_mask)
+        orthogonal_attacks_mask = get_rook_attacks_mask(target_square_shift, board_mask)
+        return (diagonal_attacks_mask & (bishop_bitboard | queen_bitboard)) | (
+            orthogonal_attacks_mask & (rook_bitboard | queen_bitboard)
+        )
 
     @staticmethod
     def _generate_pawn_candidate_moves(
         pawn_bitboard: int,
         pawn_move_transforms: list[tuple[int, int]],
         pawn_capture_transforms: list[tuple[int, int]],
+        target_squares_mask: int,
         color: Color,
         board: Board,
-    ) -> Generator[Move]:
-        for from_square_mask in enumerate_mask(pawn_bitboard):
-            for transform_mask, transform_shift in pawn_move_transforms:
-                if intersects(from_square_mask, transform_mask):
-                    to_square_mask = signed_shift(from_square_mask, transform_shift)
-                    if not board.is_occupied(to_square_mask):
-                        move = Move(
-                            from_square_mask, to_square_mask, Pawn(color), None, color
-                        )
-                        yield move
-
-        for from_square_mask in enumerate_mask(pawn_bitboard):
-            for transform_mask, transform_shift in pawn_capture_transforms:
-                if intersects(from_square_mask, transform_mask):
-                    to_square_mask = signed_shift(from_square_mask, transform_shift)
-                    if board.is_occupied(to_square_mask, color.opposite):
-                        to_piece = board._get_piece(to_square_mask)
-                        move = Move(
-                            from_square_mask,
-                            to_square_mask,
-                            Pawn(color),
-                            to_piece,
-                            color,
-                        )
-                        yield move
+    ) -> Generator[int]:
+        """Generate pawn moves set-wise by shifting the whole pawn bitboard once
+        per transform. Pawns reaching the final row promote to a queen."""
+        piece_index_offset = _get_piece_index_offset(color)
+        pawn_index = piece_index_offset + PAWN_INDEX
+        queen_index = piece_index_offset + QUEEN_INDEX
+        final_row_mask = LAST_ROW_MASK if color == Color.WHITE else FIRST_ROW_MASK
+        empty_mask = ~board.get_mask() & target_squares_mask
+        opponent_mask = board.get_mask(color.opposite) & target_squares_mask
+        mailbox = board._mailbox
+
+        for transform_mask, transform_shift in pawn_move_transforms:
+            to_squares_mask = (
+                signed_shift(pawn_bitboard & transform_mask, transform_shift)
+                & empty_mask
+            )
+            for to_square_mask in enumerate_mask(to_squares_mask):
+                to_square_shift = get_shift(to_square_mask)
+                promotion_index = (
+                    queen_index if to_square_mask & final_row_mask else NO_PIECE_INDEX
+                )
+                yield pack_move(
+                    to_square_shift - transform_shift,
+                    to_square_shift,
+                    pawn_index,
+                    NO_PIECE_INDEX,
+                    promotion_index,
+                )
+
+        for transform_mask, transform_shift in pawn_capture_transforms:
+            to_squares_mask = (
+                signed_shift(pawn_bitboard & transform_mask, transform_shift)
+                & opponent_mask
+            )
+            for to_square_mask in enumerate_mask(to_squares_mask):
+                to_square_shift = get_shift(to_square_mask)
+                promotion_index = (
+                    queen_index if to_square_mask & final_row_mask else NO_PIECE_INDEX
+                )
+                yield pack_move(
+                    to_square_shift - transform_shift,
+                    to_square_shift,
+                    pawn_index,
+                    mailbox[to_square_shift],
+                    promotion_index,
+                )
 
-    @classmethod
+    @staticmethod
     def _generate_pattern_candidate_moves(
-        cls,
         piece_bitboard: int,
-        piece_transforms: list[tuple[int, int]],
-        color: Color,
+        piece_attack_masks: list[int],
+        target_squares_mask: int,
+        piece_index: int,
         board: Board,
-    ) -> Generator[Move]:
+    ) -> Generator[int]:
+        mailbox = board._mailbox
         for from_square_mask in enumerate_mask(piece_bitboard):
-            from_piece = board._get_piece(from_square_mask)
-            for transform_mask, transform_shift in piece_transforms:
-                if intersects(from_square_mask, transform_mask):
-                    to_square_mask = signed_shift(from_square_mask, transform_shift)
-                    if not board.is_occupied(to_square_mask, color):
-                        to_piece = board._get_piece(to_square_mask)
-                        move = Move(
-                            from_square_mask,
-                            to_square_mask,
-                            from_piece,
-                            to_piece,
-                            color,
-                        )
-                        yield move
+            from_square_shift = get_shift(from_square_mask)
+            attacks_mask = piece_attack_masks[from_square_shift]
+            for to_square_mask in enumerate_mask(attacks_mask & target_squares_mask):
+                to_square_shift = get_shift(to_square_mask)
+                yield pack_move(
+                    from_square_shift,
+                    to_square_shift,
+                    piece_index,
+                    mailbox[to_square_shift],
+                )
 
-    @classmethod
+    @staticmethod
     def _generate_straight_candidate_moves(
-        cls,
         piece_bitboard: int,
-        piece_transforms: list[tuple[int, int]],
-        color: Color,
+        get_attacks_mask: Callable[[int, int], int],
+        target_squares_mask: int,
+        piece_index: int,
         board: Board,
-    ) -> Generator[Move]:
+    ) -> Generator[int]:
+        board_mask = board.get_mask()
+        mailbox = board._mailbox
         for from_square_mask in enumerate_mask(piece_bitboard):
-            from_piece = board._get_piece(from_square_mask)
-            for transform_mask, transform_shift in piece_transforms:
-                current_square_mask = from_square_mask
-                while intersects(current_square_mask, transform_mask):
-                    to_square_mask = signed_shift(current_square_mask, transform_shift)
-                    to_piece = board._get_piece(to_square_mask)
-                    capturing_ally_piece = (
-                        to_piece is not None and color == to_piece.color
-                    )
-                    if capturing_ally_piece:
-                        break
-
-                    move = Move(
-                        from_square_mask,
-                        to_square_mask,
-                        from_piece,
-                        to_piece,
-                        color,
-                    )
-                    yield move
-
-                    capturing_opponent_piece = to_piece is not None
-                    if capturing_opponent_piece:
-                        break
-
-                    current_square_mask = to_square_mask
+            from_square_shift = get_shift(from_square_mask)
+            attacks_mask = get_attacks_mask(from_square_shift, board_mask)
+            for to_square_mask in enumerate_mask(attacks_mask & target_squares_mask):
+                to_square_shift = get_shift(to_square_mask)
+                yield pack_move(
+                    from_square_shift,
+                    to_square_shift,
+                    piece_index,
+                    mailbox[to_square_shift],
+                )
+
+
+def _get_piece_index_offset(color: Color) -> int:
+    """Return the index of the color's pawn in PIECES; the other piece types of
+    the color follow it."""
+    return 0 if color == Color.WHITE else COLOR_PIECE_TYPE_COUNT
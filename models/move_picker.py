@@ -0,0 +1,139 @@
+from typing import Generator
+
+from constants.board_constants import BOARD_LEN, FULL_MASK
+from enums.color import Color
+from models.board import Board
+from models.move_generator import MoveGenerator
+from models.piece import PIECES
+from models.rules import Rules
+from utils.bit_utils import intersects
+from utils.move_utils import (
+    SQUARES_MASK,
+    decode_move,
+    get_captured_piece_index,
+    get_from_square_shift,
+    get_move_color,
+    get_moved_piece_index,
+    get_to_square_shift,
+    is_capture,
+)
+
+_KILLER_MOVE_COUNT = 2
+
+_PIECE_VALUES = tuple(piece.VALUE for piece in PIECES)
+
+
+class MovePicker:
+    """Order moves for alpha-beta search in stages: the hash move, captures by
+    MVV-LVA, killer moves, quiet moves by history score, and finally captures
+    that lose material. Each stage is only generated once the previous stages
+    failed to cause a cutoff."""
+
+    def __init__(self) -> None:
+        self._killer_moves: list[list[int]] = []
+        self._history_scores = {
+            Color.WHITE: [0] * BOARD_LEN * BOARD_LEN,
+            Color.BLACK: [0] * BOARD_LEN * BOARD_LEN,
+        }
+
+    def clear(self) -> None:
+        self._killer_moves = []
+        for history_scores in self._history_scores.values():
+            history_scores[:] = [0] * len(history_scores)
+
+    def generate_moves(
+        self, color: Color, board: Board, ply: int, hash_move: int | None = None
+    ) -> Generator[int]:
+        if hash_move is not None:
+            yield hash_move
+
+        capture_moves = []
+        losing_capture_moves = []
+        defended_squares_mask = MoveGenerator.calculate_attacked_squares_mask(
+            color.opposite, board
+        )
+        for move in self.generate_capture_moves(color, board):
+            if move == hash_move:
+                continue
+            if self._is_losing_capture(move, defended_squares_mask):
+                losing_capture_moves.append(move)
+            else:
+                capture_moves.append(move)
+        yield from capture_moves
+
+        killer_moves = self._get_killer_moves(ply)
+        for move in killer_moves:
+            if move != hash_move and self._is_legal_quiet_move(move, board):
+                yield move
+
+        history_scores = self._history_scores[color]
+        quiet_moves = [
+            move
+            for move in Rules.generate_legal_moves(
+                color, board, FULL_MASK & ~board.get_mask()
+            )
+            if move != hash_move and move not in killer_moves
+        ]
+        quiet_moves.sort(key=lambda move: -history_scores[move & SQUARES_MASK])
+        yield from quiet_moves
+
+        yield from losing_capture_moves
+
+    @staticmethod
+    def generate_capture_moves(color: Color, board: Board) -> list[int]:
+        """Return the legal captures in MVV-LVA order (most valuable victim
+        first, then least valuable attacker)."""
+        capture_moves = list(
+            Rules.generate_legal_moves(color, board, board.get_mask(color.opposite))
+        )
+        capture_moves.sort(
+            key=lambda move: (
+                -_PIECE_VALUES[get_captured_piece_index(move)],
+                _PIECE_VALUES[get_moved_piece_index(move)],
+            )
+        )
+        return capture_moves
+
+    def record_cutoff(self, move: int, depth: int, ply: int) -> None:
+        """Remember a quiet move that caused a beta cutoff as a killer move and
+        raise its history score."""
+        if is_capture(move):
+            return
+
+        killer_moves = self._get_killer_moves(ply)
+        if move not in killer_moves:
+            killer_moves.insert(0, move)
+            del killer_moves[_KILLER_MOVE_COUNT:]
+
+        self._history_scores[get_move_color(move)][move & SQUARES_MASK] += (
+            depth * depth
+        )
+
+    def _get_killer_moves(self, ply: int) -> list[int]:
+        while len(self._killer_moves) <= ply:
+            self._killer_moves.append([])
+        return self._killer_moves[ply]
+
+    @staticmethod
+    def _is_losing_capture(move: int, defended_squares_mask: int) -> bool:
+        """Return whether the capture likely loses material, i.e. a more valuable
+        piece takes a defended one. This is a cheap stand-in for a full static
+        exchange evaluation."""
+        return _PIECE_VALUES[get_moved_piece_index(move)] > _PIECE_VALUES[
+            get_captured_piece_index(move)
+        ] and intersects(1 << get_to_square_shift(move), defended_squares_mask)
+
+    @staticmethod
+    def _is_legal_quiet_move(move: int, board: Board) -> bool:
+        """Return whether a killer move from another position is a legal quiet
+        move in this one."""
+        if board._mailbox[get_from_square_shift(move)] != get_moved_piece_index(move):
+            return False
+
+        if board.is_occupied(1 << get_to_square_shift(move)):
+            return False
+
+        decoded_move = decode_move(move)
+        return Rules.is_legal_move(
+            decoded_move, board
+        ) and not Rules.is_in_check_after_move(decoded_move, board)
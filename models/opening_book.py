@@ -0,0 +1,168 @@
+import mmap
+import random
+import re
+import struct
+from collections import Counter
+from typing import Iterable
+
+from enums.color import Color
+from models.board import Board
+from models.rules import Rules
+from utils.fen_utils import INITIAL_FEN
+from utils.move_utils import format_move
+
+# File layout: the magic bytes, then (key, move, weight) records sorted by key.
+# Keys are Board position keys, which depend on the seeded Zobrist keys, and
+# moves are packed moves.
+_MAGIC = b"AICBOOK1"
+_RECORD = struct.Struct("<QII")
+
+_PGN_TAG_PATTERN = re.compile(r'^\[(\w+) "(.*)"\]$')
+_PGN_MOVE_PATTERN = re.compile(r"^\d{4}$")
+_PGN_RESULTS = {"1-0", "0-1", "1/2-1/2", "*"}
+
+
+class OpeningBook:
+    """Read-only opening book in a memory-mapped file. Probing binary searches
+    the records in place, so opening a book reads nothing up front."""
+
+    def __init__(self, path: str) -> None:
+        with open(path, "rb") as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._mmap[: len(_MAGIC)] != _MAGIC:
+            self._mmap.close()
+            raise ValueError(f"Not an opening book: {path}")
+        self._record_count = (len(self._mmap) - len(_MAGIC)) // _RECORD.size
+
+    def __len__(self) -> int:
+        return self._record_count
+
+    def __enter__(self) -> OpeningBook:
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._mmap.close()
+
+    def probe(self, key: int) -> list[tuple[int, int]]:
+        """Return the moves and weights stored for the position key, most
+        played first."""
+        low = 0
+        high = self._record_count
+        while low < high:
+            middle = (low + high) // 2
+            if self._read_record(middle)[0] < key:
+                low = middle + 1
+            else:
+                high = middle
+
+        entries = []
+        for index in range(low, self._record_count):
+            record_key, move, weight = self._read_record(index)
+            if record_key != key:
+                break
+            entries.append((move, weight))
+        return entries
+
+    def choose_move(
+        self, color: Color, board: Board, randomizer: random.Random | None = None
+    ) -> int | None:
+        """Return a legal book move for the position, or None if it is not in
+        the book. Without a randomizer, the most played move is chosen;
+        otherwise moves are picked in proportion to their weights."""
+        entries = self.probe(board.get_position_key(color))
+        if not entries:
+            return None
+
+        legal_moves = set(Rules.generate_legal_moves(color, board))
+        entries = [(move, weight) for move, weight in entries if move in legal_moves]
+        if not entries:
+            return None
+        if randomizer is None:
+            return entries[0][0]
+
+        moves, weights = zip(*entries)
+        return randomizer.choices(moves, weights)[0]
+
+    def _read_record(self, index: int) -> tuple[int, int, int]:
+        return _RECORD.unpack_from(self._mmap, len(_MAGIC) + index * _RECORD.size)
+
+
+class OpeningBookBuilder:
+    """Collect the positions and moves of opening lines and write them as an
+    opening book. The weight of a move is the number of lines playing it."""
+
+    def __init__(self, max_plies: int = 16) -> None:
+        self._max_plies = max_plies
+        self._move_counts: Counter[tuple[int, int]] = Counter()
+
+    def add_line(self, moves: Iterable[str], fen: str = INITIAL_FEN) -> int:
+        """Add the moves (in "rcrc" format) played from the FEN position and
+        return how many were added. The line stops at the first move that is
+        not legal here, such as a double pawn push or castling."""
+        board, color = Board.from_fen(fen)
+        added_count = 0
+        for move_text in moves:
+            if added_count == self._max_plies:
+                break
+
+            legal_moves = {
+                format_move(move): move
+                for move in Rules.generate_legal_moves(color, board)
+            }
+            move = legal_moves.get(move_text)
+            if move is None:
+                break
+
+            self._move_counts[board.get_position_key(color), move] += 1
+            board.make_packed_move(move)
+            color = color.opposite
+            added_count += 1
+        return added_count
+
+    def add_pgn(self, text: str) -> int:
+        """Add every game of a PGN file with "rcrc" moves, like the tournament
+        runner writes, and return the number of games. Games start from their
+        FEN tag if they have one."""
+        game_count = 0
+        fen = INITIAL_FEN
+        moves = []
+        for line in text.splitlines():
+            line = line.strip()
+            tag_match = _PGN_TAG_PATTERN.match(line)
+            if tag_match is not None:
+                if tag_match.group(1) == "FEN":
+                    fen = tag_match.group(2)
+                continue
+
+            for token in line.split():
+                if _PGN_MOVE_PATTERN.match(token):
+                    moves.append(token)
+                elif token in _PGN_RESULTS:
+                    self.add_line(moves, fen)
+                    game_count += 1
+                    fen = INITIAL_FEN
+                    moves = []
+        if moves:
+            self.add_line(moves, fen)
+            game_count += 1
+        return game_count
+
+    def write(self, path: str, min_weight: int = 1) -> int:
+        """Write the book, leaving out moves played fewer than min_weight
+        times, and return the number of records written."""
+        records = sorted(
+            (
+                (key, move, weight)
+                for (key, move), weight in self._move_counts.items()
+                if weight >= min_weight
+            ),
+            key=lambda record: (record[0], -record[2], record[1]),
+        )
+        with open(path, "wb") as file:
+            file.write(_MAGIC)
+            for record in records:
+                file.write(_RECORD.pack(*record))
+        return len(records)
@@ -0,0 +1,129 @@
+import time
+from dataclasses import dataclass, field
+from typing import Callable
+
+from enums.color import Color
+from models.board import Board
+from models.coordinate import Coordinate
+from models.piece import Bishop, King, Knight, Pawn, Queen, Rook
+from models.rules import Rules
+from utils.move_utils import format_move
+
+
+def _set_up_initial(board: Board) -> None:
+    board.set_up_pieces()
+
+
+def _set_up_pinned_sliders(board: Board) -> None:
+    board.set_piece(King(Color.WHITE), Coordinate(0, 4))
+    board.set_piece(Rook(Color.WHITE), Coordinate(1, 4))
+    board.set_piece(Bishop(Color.WHITE), Coordinate(1, 3))
+    board.set_piece(Queen(Color.WHITE), Coordinate(2, 6))
+    board.set_piece(Knight(Color.WHITE), Coordinate(0, 6))
+    board.set_piece(Rook(Color.BLACK), Coordinate(6, 4))
+    board.set_piece(Bishop(Color.BLACK), Coordinate(4, 0))
+    board.set_piece(Queen(Color.BLACK), Coordinate(3, 7))
+    board.set_piece(King(Color.BLACK), Coordinate(7, 0))
+
+
+def _set_up_double_check(board: Board) -> None:
+    board.set_piece(King(Color.WHITE), Coordinate(3, 3))
+    board.set_piece(Rook(Color.WHITE), Coordinate(0, 0))
+    board.set_piece(Queen(Color.WHITE), Coordinate(0, 7))
+    board.set_piece(Pawn(Color.WHITE), Coordinate(2, 2))
+    board.set_piece(Rook(Color.BLACK), Coordinate(3, 7))
+    board.set_piece(Knight(Color.BLACK), Coordinate(5, 4))
+    board.set_piece(Bishop(Color.BLACK), Coordinate(6, 6))
+    board.set_piece(King(Color.BLACK), Coordinate(7, 7))
+
+
+def _set_up_promotion(board: Board) -> None:
+    board.set_piece(King(Color.WHITE), Coordinate(0, 0))
+    board.set_piece(Pawn(Color.WHITE), Coordinate(6, 1))
+    board.set_piece(Pawn(Color.WHITE), Coordinate(5, 6))
+    board.set_piece(Knight(Color.WHITE), Coordinate(2, 2))
+    board.set_piece(Pawn(Color.BLACK), Coordinate(1, 6))
+    board.set_piece(Pawn(Color.BLACK), Coordinate(2, 0))
+    board.set_piece(Rook(Color.BLACK), Coordinate(7, 2))
+    board.set_piece(King(Color.BLACK), Coordinate(7, 7))
+
+
+# Standard positions, all with white to move.
+PERFT_POSITIONS: dict[str, Callable[[Board], None]] = {
+    "initial": _set_up_initial,
+    "pinned_sliders": _set_up_pinned_sliders,
+    "double_check": _set_up_double_check,
+    "promotion": _set_up_promotion,
+}
+
+
+@dataclass(slots=True)
+class PerftResult:
+    position: str
+    depth: int
+    nodes: int
+    seconds: float
+    divide: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def nodes_per_second(self) -> int:
+        return round(self.nodes / self.seconds) if self.seconds > 0 else 0
+
+    def to_dict(self) -> dict:
+        return {
+            "position": self.position,
+            "depth": self.depth,
+            "nodes": self.nodes,
+            "seconds": self.seconds,
+            "nps": self.nodes_per_second,
+            "divide": self.divide,
+        }
+
+
+class Perft:
+    @classmethod
+    def count_nodes(cls, color: Color, depth: int, board: Board) -> int:
+        """Return the number of leaf nodes of the legal move tree at the depth.
+        Promotions are always to a queen, matching the bot."""
+        if depth == 0:
+            return 1
+
+        moves = Rules.generate_legal_moves(color, board)
+        if depth == 1:
+            return sum(1 for _ in moves)
+
+        node_count = 0
+        for move in moves:
+            board.make_packed_move(move)
+            node_count += cls.count_nodes(color.opposite, depth - 1, board)
+            board.undo_packed_move(move)
+        return node_count
+
+    @classmethod
+    def divide(cls, color: Color, depth: int, board: Board) -> dict[str, int]:
+        """Return the leaf node count below each root move, keyed by the move in
+        "rcrc" format."""
+        node_counts = {}
+        for move in list(Rules.generate_legal_moves(color, board)):
+            board.make_packed_move(move)
+            node_counts[format_move(move)] = cls.count_nodes(
+                color.opposite, depth - 1, board
+            )
+            board.undo_packed_move(move)
+        return node_counts
+
+    @classmethod
+    def run(cls, position: str, depth: int, divide: bool = False) -> PerftResult:
+        """Run perft on a standard position and time it."""
+        board = Board()
+        PERFT_POSITIONS[position](board)
+
+        start_time = time.perf_counter()
+        if divide:
+            node_counts = cls.divide(Color.WHITE, depth, board)
+            node_count = sum(node_counts.values())
+        else:
+            node_counts = {}
+            node_count = cls.count_nodes(Color.WHITE, depth, board)
+        seconds = time.perf_counter() - start_time
+        return PerftResult(position, depth, node_count, seconds, node_counts)
@@ -33,3 +33,22 @@ class Queen(Piece):
 
 class King(Piece):
     VALUE: ClassVar[int] = 1000
+
+
+# Pieces in bitboard order: white pawn through king, then black. The board and
+# packed moves refer to pieces by their index in this tuple.
+PIECES = (
+    Pawn(Color.WHITE),
+    Knight(Color.WHITE),
+    Bishop(Color.WHITE),
+    Rook(Color.WHITE),
+    Queen(Color.WHITE),
+    King(Color.WHITE),
+    Pawn(Color.BLACK),
+    Knight(Color.BLACK),
+    Bishop(Color.BLACK),
+    Rook(Color.BLACK),
+    Queen(Color.BLACK),
+    King(Color.BLACK),
+)
+PIECE_INDEXES = {piece: piece_index for piece_index, piece in enumerate(PIECES)}
@@ -1,13 +1,21 @@
 from typing import Generator
 
+from constants.board_constants import FULL_MASK
+from constants.piece_constants import BISHOP_INDEX, KING_INDEX, QUEEN_INDEX, ROOK_INDEX
 from enums.color import Color
+from models.attack_tables import (
+    BETWEEN_MASKS,
+    get_bishop_attacks_mask,
+    get_rook_attacks_mask,
+)
 from models.board import Board
 from models.coordinate import Coordinate
 from models.move import Move
 from models.move_generator import MoveGenerator
 from models.piece import Bishop, King, Knight, Pawn, Queen, Rook
-from utils.bit_utils import intersects
-from utils.board_utils import is_diagonal, is_orthogonal
+from utils.bit_utils import get_shift, intersects
+from utils.board_utils import enumerate_mask, is_diagonal, is_orthogonal
+from utils.move_utils import get_from_square_shift, get_to_square_shift, pack_move
 
 LEGAL_KNIGHT_MOVE_PATTERNS = [
     (1, 2),
@@ -39,11 +47,7 @@ class Rules:
 
     @classmethod
     def is_in_check(cls, color: Color, board: Board) -> bool:
-        king_square = (
-            board._white_king_bitboard
-            if color is Color.WHITE
-            else board._black_king_bitboard
-        )
+        king_square = board.get_bitboards(color)[KING_INDEX]
         return (
             MoveGenerator.calculate_attacker_squares_mask(
                 king_square, color.opposite, board
@@ -166,16 +170,113 @@ class Rules:
         column_delta = from_coordinate.column_index - to_coordinate.column_index
         return (row_delta, column_delta) in LEGAL_KING_MOVE_PATTERNS
 
-    @staticmethod
-    def generate_legal_moves(color: Color, board: Board) -> Generator[Move]:
-        candidate_moves = MoveGenerator.generate_candidate_moves(color, board)
-        for move in candidate_moves:
-            board.make_move(move)
-            is_in_check = Rules.is_in_check(color, board)
-            board.undo_move(move)
-            if not is_in_check:
+    @classmethod
+    def generate_legal_moves(
+        cls, color: Color, board: Board, target_squares_mask: int = FULL_MASK
+    ) -> Generator[int]:
+        """Generate all legal moves of the color to the target squares as packed
+        moves. The check and pin masks are computed once per position, so
+        candidates are filtered with mask tests instead of being played on the
+        board."""
+        king_square_mask = board.get_bitboards(color)[KING_INDEX]
+        if king_square_mask == 0:
+            yield from MoveGenerator.generate_candidate_moves(
+                color, board, target_squares_mask
+            )
+            return
+
+        # The king is removed so sliders attack the squares behind it.
+        attacked_squares_mask = MoveGenerator.calculate_attacked_squares_mask(
+            color.opposite, board, board.get_mask() & ~king_square_mask
+        )
+        checker_squares_mask = MoveGenerator.calculate_attacker_squares_mask(
+            king_square_mask, color.opposite, board
+        )
+        king_square_shift = get_shift(king_square_mask)
+
+        if checker_squares_mask.bit_count() > 1:
+            king_index = board._mailbox[king_square_shift]
+            escape_squares_mask = MoveGenerator.calculate_escape_squares_mask(
+                king_square_mask, color, board
+            )
+            for to_square_mask in enumerate_mask(
+                escape_squares_mask & ~attacked_squares_mask & target_squares_mask
+            ):
+                to_square_shift = get_shift(to_square_mask)
+                yield pack_move(
+                    king_square_shift,
+                    to_square_shift,
+                    king_index,
+                    board._mailbox[to_square_shift],
+                )
+            return
+
+        if checker_squares_mask == 0:
+            check_mask = FULL_MASK
+        else:
+            check_mask = (
+                checker_squares_mask
+                | MoveGenerator.calculate_intermediate_squares_mask(
+                    king_square_mask, checker_squares_mask
+                )
+            )
+        pin_masks = cls._calculate_pin_masks(king_square_mask, color, board)
+
+        for move in MoveGenerator.generate_candidate_moves(
+            color, board, target_squares_mask
+        ):
+            from_square_shift = get_from_square_shift(move)
+            to_square_mask = 1 << get_to_square_shift(move)
+            if from_square_shift == king_square_shift:
+                if not intersects(to_square_mask, attacked_squares_mask):
+                    yield move
+                continue
+
+            if not intersects(to_square_mask, check_mask):
+                continue
+
+            pin_mask = pin_masks.get(1 << from_square_shift)
+            if pin_mask is None or intersects(to_square_mask, pin_mask):
                 yield move
 
+    @staticmethod
+    def _calculate_pin_masks(
+        king_square_mask: int, color: Color, board: Board
+    ) -> dict[int, int]:
+        """Return a mapping from each pinned piece of the color to the squares it
+        can move to without exposing the king."""
+        opponent_bitboards = board.get_bitboards(color.opposite)
+        opponent_bishop_bitboard = opponent_bitboards[BISHOP_INDEX]
+        opponent_rook_bitboard = opponent_bitboards[ROOK_INDEX]
+        opponent_queen_bitboard = opponent_bitboards[QUEEN_INDEX]
+
+        king_square_shift = get_shift(king_square_mask)
+        board_mask = board.get_mask()
+        ally_mask = board.get_mask(color)
+        opponent_mask = board.get_mask(color.opposite)
+
+        # Ally pieces are transparent here, so these sliders see the king
+        # through at most the pieces that might be pinned.
+        sniper_squares_mask = (
+            get_bishop_attacks_mask(king_square_shift, opponent_mask)
+            & (opponent_bishop_bitboard | opponent_queen_bitboard)
+        ) | (
+            get_rook_attacks_mask(king_square_shift, opponent_mask)
+            & (opponent_rook_bitboard | opponent_queen_bitboard)
+        )
+
+        pin_masks = {}
+        for sniper_square_mask in enumerate_mask(sniper_squares_mask):
+            between_mask = BETWEEN_MASKS[king_square_shift][
+                get_shift(sniper_square_mask)
+            ]
+            blocker_squares_mask = between_mask & board_mask
+            if blocker_squares_mask.bit_count() == 1 and intersects(
+                blocker_squares_mask, ally_mask
+            ):
+                pin_masks[blocker_squares_mask] = between_mask | sniper_square_mask
+        return pin_masks
+
     @classmethod
     def is_in_checkmate(cls, color: Color, board: Board) -> bool:
         has_no_legal_moves = next(cls.generate_legal_moves(color, board), None) is None
@@ -0,0 +1,100 @@
+import time
+from dataclasses import dataclass, field
+
+from enums.color import Color
+from enums.parallel_mode import ParallelMode
+from models.board import Board
+from models.bot import Bot
+from models.perft import PERFT_POSITIONS
+from utils.move_utils import format_move
+
+
+@dataclass(slots=True)
+class SearchBenchmarkResult:
+    position: str
+    depth: int
+    worker_count: int
+    nodes: int
+    seconds: float
+    best_move: str
+    parallel_mode: ParallelMode = ParallelMode.ROOT_SPLIT
+    depth_seconds: list[float] = field(default_factory=list)
+    speedup: float = 1.0
+    stats: dict | None = None
+
+    @property
+    def nodes_per_second(self) -> int:
+        return round(self.nodes / self.seconds) if self.seconds > 0 else 0
+
+    def to_dict(self) -> dict:
+        return {
+            "position": self.position,
+            "depth": self.depth,
+            "workers": self.worker_count,
+            "mode": self.parallel_mode.name.lower(),
+            "nodes": self.nodes,
+            "seconds": self.seconds,
+            "nps": self.nodes_per_second,
+            "best_move": self.best_move,
+            "depth_seconds": self.depth_seconds,
+            "speedup": self.speedup,
+            "stats": self.stats,
+        }
+
+
+class SearchBenchmark:
+    @staticmethod
+    def run(
+        position: str,
+        depth: int,
+        worker_counts: list[int],
+        parallel_mode: ParallelMode = ParallelMode.ROOT_SPLIT,
+        collects_stats: bool = False,
+    ) -> list[SearchBenchmarkResult]:
+        """Search a standard position to the depth once per worker count and
+        report the speedup of each against the first count, along with the
+        time to reach each depth and, if collected, the search statistics."""
+        results = []
+        for worker_count in worker_counts:
+            board = Board()
+            PERFT_POSITIONS[position](board)
+            bot = Bot(
+                depth,
+                worker_count=worker_count,
+                parallel_mode=parallel_mode,
+                collects_stats=collects_stats,
+            )
+            try:
+                # Start the worker processes before the clock does, then forget
+                # what the warm-up search found.
+                bot._depth = 1
+                bot.calculate_best_move(Color.WHITE, board)
+                bot._depth = depth
+                bot._transposition_table.clear()
+
+                start_time = time.perf_counter()
+                best_move = bot.calculate_best_move(Color.WHITE, board)
+                seconds = time.perf_counter() - start_time
+            finally:
+                bot.close()
+
+            iteration = bot.iterations[-1]
+            results.append(
+                SearchBenchmarkResult(
+                    position,
+                    depth,
+                    worker_count,
+                    iteration.nodes + iteration.quiescence_nodes,
+                    seconds,
+                    format_move(best_move),
+                    parallel_mode,
+                    [iteration.seconds for iteration in bot.iterations],
+                    stats=None if bot.stats is None else bot.stats.to_dict(),
+                )
+            )
+
+        baseline_seconds = results[0].seconds
+        for result in results:
+            if result.seconds > 0:
+                result.speedup = baseline_seconds / result.seconds
+        return results
@@ -0,0 +1,11 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class SearchIteration:
+    depth: int
+    score: float
+    nodes: int
+    quiescence_nodes: int
+    seconds: float
+    principal_variation: tuple[int, ...]
@@ -0,0 +1,146 @@
+import json
+from dataclasses import dataclass, field
+from typing import Generator
+
+from enums.bound import Bound
+from enums.color import Color
+from models.board import Board
+from models.move_picker import MovePicker
+from models.search_iteration import SearchIteration
+from models.transposition_table import TranspositionTable
+
+
+@dataclass(slots=True)
+class SearchStats:
+    """Counters of one search. Nodes include quiescence nodes, and every
+    quiescence node is a leaf evaluation."""
+
+    nodes: int = 0
+    leaf_evaluations: int = 0
+    beta_cutoffs: int = 0
+    first_move_cutoffs: int = 0
+    transposition_table_probes: int = 0
+    transposition_table_hits: int = 0
+    transposition_table_stores: int = 0
+    # Nodes searched by each completed iteration, starting at depth 1.
+    iteration_nodes: list[int] = field(default_factory=list)
+
+    @property
+    def first_move_cutoff_rate(self) -> float:
+        """Return the fraction of beta cutoffs caused by the first move searched,
+        a measure of move ordering quality."""
+        if self.beta_cutoffs == 0:
+            return 0.0
+        return self.first_move_cutoffs / self.beta_cutoffs
+
+    @property
+    def transposition_table_hit_rate(self) -> float:
+        if self.transposition_table_probes == 0:
+            return 0.0
+        return self.transposition_table_hits / self.transposition_table_probes
+
+    @property
+    def branching_factors(self) -> list[float]:
+        """Return the effective branching factor of every iteration after the
+        first: its nodes divided by those of the previous iteration."""
+        return [
+            nodes / previous_nodes if previous_nodes else 0.0
+            for previous_nodes, nodes in zip(
+                self.iteration_nodes, self.iteration_nodes[1:]
+            )
+        ]
+
+    def reset(self) -> None:
+        self.nodes = 0
+        self.leaf_evaluations = 0
+        self.beta_cutoffs = 0
+        self.first_move_cutoffs = 0
+        self.transposition_table_probes = 0
+        self.transposition_table_hits = 0
+        self.transposition_table_stores = 0
+        self.iteration_nodes = []
+
+    def record_iterations(self, iterations: list[SearchIteration]) -> None:
+        """Record the nodes of each completed iteration, which are counted from
+        the start of the search."""
+        previous_nodes = 0
+        for iteration in iterations:
+            nodes = iteration.nodes + iteration.quiescence_nodes
+            self.iteration_nodes.append(nodes - previous_nodes)
+            previous_nodes = nodes
+
+    def to_dict(self) -> dict:
+        return {
+            "nodes": self.nodes,
+            "leaf_evaluations": self.leaf_evaluations,
+            "beta_cutoffs": self.beta_cutoffs,
+            "first_move_cutoffs": self.first_move_cutoffs,
+            "first_move_cutoff_rate": self.first_move_cutoff_rate,
+            "tt_probes": self.transposition_table_probes,
+            "tt_hits": self.transposition_table_hits,
+            "tt_stores": self.transposition_table_stores,
+            "tt_hit_rate": self.transposition_table_hit_rate,
+            "iteration_nodes": self.iteration_nodes,
+            "branching_factors": self.branching_factors,
+        }
+
+    def to_json(self) -> str:
+        return json.dumps(self.to_dict())
+
+
+class CountingTranspositionTable:
+    """Transposition table wrapper that counts probes, hits and stores. The bot
+    only swaps it in when collecting statistics, so the plain search pays
+    nothing for them."""
+
+    def __init__(
+        self, transposition_table: TranspositionTable, stats: SearchStats
+    ) -> None:
+        self._transposition_table = transposition_table
+        self._stats = stats
+
+    def new_search(self) -> None:
+        self._transposition_table.new_search()
+
+    def clear(self) -> None:
+        self._transposition_table.clear()
+
+    def probe(self, key: int) -> tuple[int, Bound, float, int | None] | None:
+        entry = self._transposition_table.probe(key)
+        self._stats.transposition_table_probes += 1
+        if entry is not None:
+            self._stats.transposition_table_hits += 1
+        return entry
+
+    def store(
+        self, key: int, depth: int, bound: Bound, score: float, move: int | None
+    ) -> None:
+        self._stats.transposition_table_stores += 1
+        self._transposition_table.store(key, depth, bound, score, move)
+
+
+class CountingMovePicker(MovePicker):
+    """Move picker that counts beta cutoffs and how many of them came from the
+    first move searched."""
+
+    def __init__(self, stats: SearchStats) -> None:
+        super().__init__()
+        self._stats = stats
+        # Moves yielded so far at each ply of the current line.
+        self._move_counts: list[int] = []
+
+    def generate_moves(
+        self, color: Color, board: Board, ply: int, hash_move: int | None = None
+    ) -> Generator[int]:
+        while len(self._move_counts) <= ply:
+            self._move_counts.append(0)
+        self._move_counts[ply] = 0
+        for move in super().generate_moves(color, board, ply, hash_move):
+            self._move_counts[ply] += 1
+            yield move
+
+    def record_cutoff(self, move: int, depth: int, ply: int) -> None:
+        self._stats.beta_cutoffs += 1
+        if self._move_counts[ply] == 1:
+            self._stats.first_move_cutoffs += 1
+        super().record_cutoff(move, depth, ply)
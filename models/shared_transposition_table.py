@@ -0,0 +1,69 @@
+from multiprocessing.shared_memory import SharedMemory
+
+from constants.bot_constants import TRANSPOSITION_TABLE_SIZE_MB
+from models.transposition_table import TranspositionTable
+
+# The shared memory starts with one word holding the current generation, so
+# every process ages entries the same way.
+_HEADER_BYTES = 8
+
+
+class SharedTranspositionTable(TranspositionTable):
+    """Transposition table in shared memory, so processes searching in parallel
+    can read each other's results. There are no locks; entries torn by
+    concurrent writes fail their checksum and read as missing.
+
+    The process that creates the table owns the memory and frees it on close.
+    Other processes attach to it by name. Only the owner starts new searches;
+    attached tables follow its generation, so helpers never see each other's
+    fresh entries as old ones."""
+
+    def __init__(
+        self, size_mb: int = TRANSPOSITION_TABLE_SIZE_MB, name: str | None = None
+    ) -> None:
+        self._shared_memory: SharedMemory | None = None
+        self._is_owner = name is None
+        self._attach_name = name
+        super().__init__(size_mb)
+        self._generation = self._header[0]
+
+    @property
+    def name(self) -> str:
+        return self._shared_memory.name
+
+    def new_search(self) -> None:
+        """Age the existing entries if this table owns the memory; otherwise
+        pick up the generation of the owner's current search."""
+        if self._is_owner:
+            super().new_search()
+            self._header[0] = self._generation
+        else:
+            self._generation = self._header[0]
+
+    def clear(self) -> None:
+        super().clear()
+        self._header[0] = self._generation
+
+    def close(self) -> None:
+        """Detach from the shared memory, freeing it if this table created it."""
+        if self._shared_memory is None:
+            return
+
+        for view in (self._words, self._scores, self._buffer, self._header):
+            view.release()
+        self._shared_memory.close()
+        if self._is_owner:
+            self._shared_memory.unlink()
+        self._shared_memory = None
+
+    def _allocate(self, byte_count: int) -> memoryview:
+        if self._is_owner:
+            self._shared_memory = SharedMemory(
+                create=True, size=_HEADER_BYTES + byte_count
+            )
+        else:
+            # Only the owner unlinks the memory, so attaching processes must not
+            # register it with their resource tracker.
+            self._shared_memory = SharedMemory(self._attach_name, track=False)
+        self._header = self._shared_memory.buf[:_HEADER_BYTES].cast("Q")
+        return self._shared_memory.buf[_HEADER_BYTES : _HEADER_BYTES + byte_count]
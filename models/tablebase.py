@@ -0,0 +1,454 @@
+import mmap
+import os
+from array import array
+from dataclasses import dataclass
+
+from constants.board_constants import BOARD_LEN, BOARD_SIZE
+from constants.piece_constants import (
+    COLOR_PIECE_TYPE_COUNT,
+    PAWN_INDEX,
+    PIECE_TYPE_COUNT,
+)
+from enums.color import Color
+from enums.wdl import Wdl
+from models.board import Board
+from models.rules import Rules
+from utils.move_utils import (
+    format_move,
+    get_from_square_shift,
+    get_to_square_shift,
+    is_capture,
+    is_promotion,
+)
+
+# File layout: the magic bytes, then one byte per position index. 0 is a draw
+# (or a position that cannot occur); anything else is 1 + the plies to mate,
+# which are odd when the side to move wins and even when it loses.
+_MAGIC = b"AICTB001"
+FILE_EXTENSION = ".tb"
+
+MAX_PIECE_COUNT = 4
+# Longest distance to mate, in plies, that a table can store.
+MAX_DISTANCE = 254
+
+# Piece letters in piece type order (see piece_constants), and the order of the
+# pieces after the king in a material signature such as "KRKP".
+_PIECE_LETTERS = "PNBRQK"
+_SIGNATURE_LETTERS = "QRBNP"
+
+# XOR with a square shift to mirror it vertically.
+_FLIP_ROWS = BOARD_LEN - BOARD_SIZE
+
+
+def _transform_square(square: int, transform: int) -> int:
+    """Return the square mirrored by the transform, whose bits mirror the
+    columns, mirror the rows and swap rows with columns, in that order."""
+    row_index, column_index = divmod(square, BOARD_SIZE)
+    if transform & 1:
+        column_index = BOARD_SIZE - 1 - column_index
+    if transform & 2:
+        row_index = BOARD_SIZE - 1 - row_index
+    if transform & 4:
+        row_index, column_index = column_index, row_index
+    return row_index * BOARD_SIZE + column_index
+
+
+def _get_king_transform(square: int, has_pawns: bool) -> int:
+    """Return the transform that moves the white king to the queenside, and
+    without pawns also to the a1-d1-d4 triangle."""
+    row_index, column_index = divmod(square, BOARD_SIZE)
+    half_size = BOARD_SIZE // 2
+    transform = int(column_index >= half_size)
+    if has_pawns:
+        return transform
+
+    transform |= int(row_index >= half_size) << 1
+    transformed_square = _transform_square(square, transform)
+    if transformed_square // BOARD_SIZE > transformed_square % BOARD_SIZE:
+        transform |= 4
+    return transform
+
+
+_SQUARE_TRANSFORMS = [
+    [_transform_square(square, transform) for square in range(BOARD_LEN)]
+    for transform in range(8)
+]
+
+
+@dataclass(frozen=True, slots=True)
+class _TableLayout:
+    """How the positions of a material set are indexed. Pieces are listed
+    white king first, then the other white pieces, then the black king and
+    pieces. The white king only takes the squares left by symmetry."""
+
+    signature: str
+    piece_indexes: tuple[int, ...]
+    king_transforms: tuple[int, ...]
+    king_squares: tuple[int, ...]
+    king_square_indexes: dict[int, int]
+
+    @property
+    def size(self) -> int:
+        other_piece_count = len(self.piece_indexes) - 1
+        return len(self.king_squares) * BOARD_LEN**other_piece_count * 2
+
+    def get_index(self, squares: list[int], color_index: int) -> int:
+        king_square = squares[0]
+        square_transform = _SQUARE_TRANSFORMS[self.king_transforms[king_square]]
+        index = self.king_square_indexes[square_transform[king_square]]
+        for square in squares[1:]:
+            index = index * BOARD_LEN + square_transform[square]
+        return index * 2 + color_index
+
+    def get_squares(self, index: int) -> tuple[list[int], int]:
+        """Return the piece squares and color index of the index."""
+        index, color_index = divmod(index, 2)
+        squares = []
+        for _ in range(len(self.piece_indexes) - 1):
+            index, square = divmod(index, BOARD_LEN)
+            squares.append(square)
+        squares.append(self.king_squares[index])
+        squares.reverse()
+        return squares, color_index
+
+
+_layouts: dict[str, _TableLayout] = {}
+
+
+def _get_layout(signature: str) -> _TableLayout:
+    layout = _layouts.get(signature)
+    if layout is not None:
+        return layout
+
+    black_offset = signature.find("K", 1)
+    white_material = signature[:black_offset]
+    black_material = signature[black_offset:]
+    if (
+        black_offset == -1
+        or len(signature) > MAX_PIECE_COUNT
+        or signature == "KK"
+        or _normalize_material(white_material) != white_material
+        or _normalize_material(black_material) != black_material
+    ):
+        raise ValueError(f"Invalid material signature: {signature}")
+
+    piece_indexes = tuple(
+        _PIECE_LETTERS.index(letter) for letter in white_material
+    ) + tuple(
+        _PIECE_LETTERS.index(letter) + COLOR_PIECE_TYPE_COUNT
+        for letter in black_material
+    )
+    has_pawns = "P" in signature
+    king_transforms = tuple(
+        _get_king_transform(square, has_pawns) for square in range(BOARD_LEN)
+    )
+    king_squares = tuple(
+        square
+        for square in range(BOARD_LEN)
+        if _SQUARE_TRANSFORMS[king_transforms[square]][square] == square
+    )
+    layout = _TableLayout(
+        signature,
+        piece_indexes,
+        king_transforms,
+        king_squares,
+        {square: index for index, square in enumerate(king_squares)},
+    )
+    _layouts[signature] = layout
+    return layout
+
+
+def _normalize_material(material: str) -> str:
+    """Return the material with its pieces in signature order, or an empty
+    string if it is not a king and valid pieces."""
+    if material[:1] != "K" or any(
+        letter not in _SIGNATURE_LETTERS for letter in material[1:]
+    ):
+        return ""
+    return "K" + "".join(sorted(material[1:], key=_SIGNATURE_LETTERS.index))
+
+
+def _get_material(bitboards: list[int]) -> str:
+    """Return the material signature of one color's bitboards."""
+    return "K" + "".join(
+        letter * bitboards[_PIECE_LETTERS.index(letter)].bit_count()
+        for letter in _SIGNATURE_LETTERS
+    )
+
+
+def _get_piece_squares(layout: _TableLayout, bitboards: list[int]) -> list[int]:
+    """Return the squares of the layout's pieces on the bitboards."""
+    bitboards = list(bitboards)
+    squares = []
+    for piece_index in layout.piece_indexes:
+        bitboard = bitboards[piece_index]
+        square_mask = bitboard & -bitboard
+        bitboards[piece_index] = bitboard ^ square_mask
+        squares.append(square_mask.bit_length() - 1)
+    return squares
+
+
+def _decode_value(value: int) -> tuple[Wdl, int]:
+    if value == 0:
+        return Wdl.DRAW, 0
+    distance = value - 1
+    return (Wdl.WIN if distance % 2 else Wdl.LOSS), distance
+
+
+class Tablebase:
+    """Endgame tables of material sets with up to MAX_PIECE_COUNT pieces, such
+    as KQK or KRKP. Tables are memory-mapped, so probing reads one byte."""
+
+    def __init__(self, directory: str | None = None) -> None:
+        """Open the tables (".tb" files named by their material signature) in
+        the directory, if given."""
+        self._tables: dict[str, tuple[_TableLayout, memoryview | bytearray]] = {}
+        self._mmaps: list[mmap.mmap] = []
+        if directory is None:
+            return
+
+        for file_name in sorted(os.listdir(directory)):
+            signature, extension = os.path.splitext(file_name)
+            if extension == FILE_EXTENSION:
+                self._open_table(signature, os.path.join(directory, file_name))
+
+    def __enter__(self) -> Tablebase:
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+    @property
+    def signatures(self) -> list[str]:
+        return list(self._tables)
+
+    @property
+    def max_piece_count(self) -> int:
+        """Return the piece count of the largest material set, below which the
+        search should probe."""
+        return max((len(signature) for signature in self._tables), default=0)
+
+    def close(self) -> None:
+        for _, values in self._tables.values():
+            if isinstance(values, memoryview):
+                values.release()
+        self._tables.clear()
+        for table_mmap in self._mmaps:
+            table_mmap.close()
+        self._mmaps.clear()
+
+    def add_table(self, signature: str, values: bytearray) -> None:
+        """Add a table generated by TablebaseGenerator."""
+        layout = _get_layout(signature)
+        if len(values) != layout.size:
+            raise ValueError(f"Wrong table size for {signature}.")
+        self._tables[signature] = (layout, values)
+
+    def probe(self, color: Color, board: Board) -> tuple[Wdl, int] | None:
+        """Return the result for the color to move and the plies to mate (0 for
+        draws), or None if no table covers the material. Tables are stored with
+        the first side of the signature as white, so other positions are
+        mirrored vertically with colors swapped."""
+        white_bitboards = board.get_bitboards(Color.WHITE)
+        black_bitboards = board.get_bitboards(Color.BLACK)
+        white_material = _get_material(white_bitboards)
+        black_material = _get_material(black_bitboards)
+
+        table = self._tables.get(white_material + black_material)
+        if table is not None:
+            layout, values = table
+            squares = _get_piece_squares(layout, white_bitboards + black_bitboards)
+            color_index = 0 if color == Color.WHITE else 1
+        else:
+            table = self._tables.get(black_material + white_material)
+            if table is None:
+                if white_material == black_material == "K":
+                    return Wdl.DRAW, 0
+                return None
+
+            layout, values = table
+            squares = [
+                square ^ _FLIP_ROWS
+                for square in _get_piece_squares(
+                    layout, black_bitboards + white_bitboards
+                )
+            ]
+            color_index = 1 if color == Color.WHITE else 0
+        return _decode_value(values[layout.get_index(squares, color_index)])
+
+    def choose_move(self, color: Color, board: Board) -> int | None:
+        """Return the move that mates fastest, keeps the draw or loses slowest,
+        or None if the position or any position after it is not covered."""
+        if self.probe(color, board) is None:
+            return None
+
+        best_move = None
+        best_rank = None
+        for move in Rules.generate_legal_moves(color, board):
+            board.make_packed_move(move)
+            entry = self.probe(color.opposite, board)
+            board.undo_packed_move(move)
+            if entry is None:
+                return None
+
+            result, distance = entry
+            if result == Wdl.LOSS:
+                rank = (0, distance)
+            elif result == Wdl.DRAW:
+                rank = (1, 0)
+            else:
+                rank = (2, -distance)
+            if best_rank is None or rank < best_rank:
+                best_rank = rank
+                best_move = move
+        return best_move
+
+    def _open_table(self, signature: str, path: str) -> None:
+        layout = _get_layout(signature)
+        with open(path, "rb") as file:
+            table_mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        if (
+            table_mmap[: len(_MAGIC)] != _MAGIC
+            or len(table_mmap) != len(_MAGIC) + layout.size
+        ):
+            table_mmap.close()
+            raise ValueError(f"Not a {signature} table: {path}")
+
+        self._mmaps.append(table_mmap)
+        self._tables[signature] = (layout, memoryview(table_mmap)[len(_MAGIC) :])
+
+
+class TablebaseGenerator:
+    @staticmethod
+    def generate(signature: str, tablebase: Tablebase) -> bytearray:
+        """Solve every position of the material set by retrograde analysis and
+        return its table. Captures and promotions leave the set, so their
+        results come from the tablebase, which needs the tables they reach."""
+        layout = _get_layout(signature)
+        size = layout.size
+        values = bytearray(size)
+        # Moves per position not yet known to lose for the side to move, and
+        # the longest of the opponent wins among those known.
+        unresolved_counts = array("H", bytes(2 * size))
+        longest_win_distances = bytearray(size)
+        # Positions to resolve at each distance to mate. Even distances are
+        # losses for the side to move, odd ones wins.
+        buckets: list[list[int]] = [[] for _ in range(MAX_DISTANCE + 1)]
+        # Positions reached by moves within the set, grouped by position.
+        child_offsets = array("I", bytes(4 * (size + 1)))
+        children = array("I")
+
+        board = Board()
+        for index in range(size):
+            child_offsets[index] = len(children)
+            squares, color_index = layout.get_squares(index)
+            if not TablebaseGenerator._is_valid(layout, squares):
+                continue
+
+            bitboards = [0] * PIECE_TYPE_COUNT
+            for piece_index, square in zip(layout.piece_indexes, squares):
+                bitboards[piece_index] |= 1 << square
+            board._set_bitboards(bitboards)
+            color = Color.WHITE if color_index == 0 else Color.BLACK
+            if Rules.is_in_check(color.opposite, board):
+                continue
+
+            move_count = 0
+            for move in Rules.generate_legal_moves(color, board):
+                move_count += 1
+                if is_capture(move) or is_promotion(move):
+                    board.make_packed_move(move)
+                    entry = tablebase.probe(color.opposite, board)
+                    board.undo_packed_move(move)
+                    if entry is None:
+                        raise ValueError(
+                            f"{signature} needs the table reached by "
+                            f"{format_move(move)} in {board.to_fen(color)}."
+                        )
+
+                    result, distance = entry
+                    if result == Wdl.WIN:
+                        longest_win_distances[index] = max(
+                            longest_win_distances[index], distance
+                        )
+                        continue
+                    if result == Wdl.LOSS:
+                        buckets[distance + 1].append(index)
+                    unresolved_counts[index] += 1
+                    continue
+
+                child_squares = list(squares)
+                child_squares[squares.index(get_from_square_shift(move))] = (
+                    get_to_square_shift(move)
+                )
+                children.append(layout.get_index(child_squares, 1 - color_index))
+                unresolved_counts[index] += 1
+
+            if move_count == 0:
+                if Rules.is_in_check(color, board):
+                    buckets[0].append(index)
+            elif unresolved_counts[index] == 0:
+                buckets[longest_win_distances[index] + 1].append(index)
+
+        child_offsets[size] = len(children)
+
+        # Group the parents of every position together.
+        parent_offsets = array("I", bytes(4 * (size + 1)))
+        for child in children:
+            parent_offsets[child + 1] += 1
+        for index in range(size):
+            parent_offsets[index + 1] += parent_offsets[index]
+        parents = array("I", bytes(4 * len(children)))
+        next_offsets = parent_offsets[:-1]
+        for parent in range(size):
+            for child in children[child_offsets[parent] : child_offsets[parent + 1]]:
+                parents[next_offsets[child]] = parent
+                next_offsets[child] += 1
+        del child_offsets, children, next_offsets
+
+        # Resolve positions in order of distance, so wins take the fastest mate
+        # and losses the slowest.
+        for distance, bucket in enumerate(buckets):
+            for index in bucket:
+                if values[index]:
+                    continue
+
+                values[index] = distance + 1
+                for parent in parents[
+                    parent_offsets[index] : parent_offsets[index + 1]
+                ]:
+                    if values[parent]:
+                        continue
+                    if distance % 2 == 0:
+                        parent_distance = distance + 1
+                    else:
+                        unresolved_counts[parent] -= 1
+                        longest_win_distances[parent] = max(
+                            longest_win_distances[parent], distance
+                        )
+                        if unresolved_counts[parent]:
+                            continue
+                        parent_distance = longest_win_distances[parent] + 1
+                    if parent_distance > MAX_DISTANCE:
+                        raise ValueError(f"{signature} mates are too long to store.")
+                    buckets[parent_distance].append(parent)
+        return values
+
+    @staticmethod
+    def write(path: str, values: bytearray) -> None:
+        with open(path, "wb") as file:
+            file.write(_MAGIC)
+            file.write(values)
+
+    @staticmethod
+    def _is_valid(layout: _TableLayout, squares: list[int]) -> bool:
+        """Return whether no pieces share a square and no pawn is on the first
+        or last row."""
+        if len(set(squares)) != len(squares):
+            return False
+        for piece_index, square in zip(layout.piece_indexes, squares):
+            row_index = square // BOARD_SIZE
+            is_pawn = piece_index % COLOR_PIECE_TYPE_COUNT == PAWN_INDEX
+            if is_pawn and row_index in (0, BOARD_SIZE - 1):
+                return False
+        return True
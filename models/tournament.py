@@ -0,0 +1,365 @@
+import math
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+
+from constants.engine_constants import POSITIONAL_SCORE_WEIGHT
+from enums.color import Color
+from enums.game_status import GameStatus
+from enums.search_feature import SearchFeature
+from models.board import Board
+from models.bot import Bot
+from models.rules import Rules
+from utils.fen_utils import INITIAL_FEN
+from utils.move_utils import format_move
+
+# A game is drawn once the same position occurs this many times.
+_REPETITION_COUNT = 3
+
+# Two-sided 95% confidence interval of a normal distribution.
+_CONFIDENCE_Z_SCORE = 1.96
+
+_TERMINATIONS = {
+    GameStatus.CHECKMATE: "checkmate",
+    GameStatus.STALEMATE: "stalemate",
+    GameStatus.REPETITION: "threefold repetition",
+    GameStatus.MOVE_LIMIT: "move limit",
+}
+
+
+@dataclass(frozen=True, slots=True)
+class BotConfig:
+    """Settings of one side of a match."""
+
+    name: str
+    depth: int
+    time_limit: float | None = None
+    node_limit: int | None = None
+    positional_score_weight: float = POSITIONAL_SCORE_WEIGHT
+    search_features: frozenset[SearchFeature] = frozenset()
+
+    def create_bot(self) -> Bot:
+        return Bot(
+            self.depth,
+            self.time_limit,
+            self.node_limit,
+            positional_score_weight=self.positional_score_weight,
+            search_features=self.search_features,
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class MoveRecord:
+    move: int
+    seconds: float
+    nodes: int
+    # Depth of the last completed iteration, or 0 if the move was not searched.
+    depth: int = 0
+
+
+@dataclass(slots=True)
+class GameRecord:
+    round_number: int
+    white: str
+    black: str
+    opening_fen: str
+    first_color: Color
+    moves: list[MoveRecord] = field(default_factory=list)
+    status: GameStatus = GameStatus.ACTIVE
+    winner: Color | None = None
+
+    @property
+    def result(self) -> str:
+        if self.winner == Color.WHITE:
+            return "1-0"
+        if self.winner == Color.BLACK:
+            return "0-1"
+        return "1/2-1/2"
+
+    def get_moves(self, color: Color) -> list[MoveRecord]:
+        """Return the moves played by the color."""
+        start_index = 0 if color == self.first_color else 1
+        return self.moves[start_index::2]
+
+    def to_pgn(self) -> str:
+        """Return the game in PGN layout. Moves are in the engine's "rcrc"
+        format since there is no algebraic notation."""
+        tags = [
+            ("Event", "Self-play"),
+            ("Round", str(self.round_number)),
+            ("White", self.white),
+            ("Black", self.black),
+            ("FEN", self.opening_fen),
+            ("Result", self.result),
+            ("Termination", _TERMINATIONS.get(self.status, "unterminated")),
+        ]
+        lines = [f'[{name} "{value}"]' for name, value in tags]
+
+        move_texts = []
+        for index, move_record in enumerate(self.moves):
+            # Count plies as if white always moved first.
+            ply = index + (0 if self.first_color == Color.WHITE else 1)
+            move_number = ply // 2 + 1
+            if ply % 2 == 0:
+                move_texts.append(f"{move_number}.")
+            elif index == 0:
+                move_texts.append(f"{move_number}...")
+            move_texts.append(format_move(move_record.move))
+        move_texts.append(self.result)
+        return "\n".join(lines) + "\n\n" + " ".join(move_texts) + "\n"
+
+
+@dataclass(slots=True)
+class TournamentResult:
+    """Results of a match, counted from the first configuration's side."""
+
+    first_name: str
+    second_name: str
+    games: list[GameRecord]
+
+    @property
+    def wins(self) -> int:
+        return sum(1 for game in self.games if self._get_points(game) == 1)
+
+    @property
+    def draws(self) -> int:
+        return sum(1 for game in self.games if self._get_points(game) == 0.5)
+
+    @property
+    def losses(self) -> int:
+        return sum(1 for game in self.games if self._get_points(game) == 0)
+
+    @property
+    def score(self) -> float:
+        """Return the fraction of points the first configuration scored."""
+        if not self.games:
+            return 0.5
+        return (self.wins + self.draws / 2) / len(self.games)
+
+    def get_elo_difference(self) -> tuple[float, float]:
+        """Return the Elo difference of the first configuration over the second
+        and the margin of its 95% confidence interval."""
+        game_count = len(self.games)
+        score = self.score
+        elo_difference = _get_elo_difference(score)
+        # Without games, or with every game won or lost, the results say
+        # nothing about the size of the difference.
+        if game_count == 0 or score in (0, 1):
+            return elo_difference, math.inf
+
+        variance = (
+            sum((self._get_points(game) - score) ** 2 for game in self.games)
+            / game_count
+        )
+        score_margin = _CONFIDENCE_Z_SCORE * math.sqrt(variance / game_count)
+        elo_margin = (
+            _get_elo_difference(score + score_margin)
+            - _get_elo_difference(score - score_margin)
+        ) / 2
+        return elo_difference, elo_margin
+
+    def get_average_seconds_per_move(self, name: str) -> float:
+        move_records = self._get_move_records(name)
+        if not move_records:
+            return 0.0
+        return sum(record.seconds for record in move_records) / len(move_records)
+
+    def get_average_nodes_per_move(self, name: str) -> float:
+        move_records = self._get_move_records(name)
+        if not move_records:
+            return 0.0
+        return sum(record.nodes for record in move_records) / len(move_records)
+
+    def get_average_depth_per_move(self, name: str) -> float:
+        """Return the average depth completed per move, which compares how deep
+        settings search in the same time."""
+        move_records = self._get_move_records(name)
+        if not move_records:
+            return 0.0
+        return sum(record.depth for record in move_records) / len(move_records)
+
+    def to_dict(self) -> dict:
+        """Return the result as a JSON-safe dict. Infinite Elo values, which
+        JSON cannot represent, are None."""
+        elo_difference, elo_margin = self.get_elo_difference()
+        return {
+            "first": self.first_name,
+            "second": self.second_name,
+            "games": len(self.games),
+            "wins": self.wins,
+            "draws": self.draws,
+            "losses": self.losses,
+            "score": self.score,
+            "elo": _get_finite_or_none(elo_difference),
+            "elo_margin": _get_finite_or_none(elo_margin),
+            "seconds_per_move": {
+                name: self.get_average_seconds_per_move(name)
+                for name in (self.first_name, self.second_name)
+            },
+            "nodes_per_move": {
+                name: self.get_average_nodes_per_move(name)
+                for name in (self.first_name, self.second_name)
+            },
+            "depth_per_move": {
+                name: self.get_average_depth_per_move(name)
+                for name in (self.first_name, self.second_name)
+            },
+        }
+
+    def _get_points(self, game: GameRecord) -> float:
+        if game.winner is None:
+            return 0.5
+        first_color = Color.WHITE if game.white == self.first_name else Color.BLACK
+        return 1 if game.winner == first_color else 0
+
+    def _get_move_records(self, name: str) -> list[MoveRecord]:
+        move_records = []
+        for game in self.games:
+            if game.white == name:
+                move_records += game.get_moves(Color.WHITE)
+            if game.black == name:
+                move_records += game.get_moves(Color.BLACK)
+        return move_records
+
+
+class Tournament:
+    def __init__(
+        self,
+        first_config: BotConfig,
+        second_config: BotConfig,
+        game_count: int,
+        worker_count: int = 1,
+        openings: list[str] | None = None,
+        opening_plies: int = 4,
+        max_plies: int = 200,
+        seed: int = 0,
+    ) -> None:
+        """Create a match of game_count games between two configurations. Each
+        opening is played twice with colors swapped. Without a list of opening
+        FENs, openings are random legal moves from the initial position."""
+        if first_config.name == second_config.name:
+            raise ValueError("Configurations need different names.")
+
+        self._first_config = first_config
+        self._second_config = second_config
+        self._game_count = game_count
+        self._worker_count = worker_count
+        opening_count = (game_count + 1) // 2
+        self._openings = openings or self.generate_openings(
+            opening_count, opening_plies, seed
+        )
+        self._max_plies = max_plies
+
+    def run(self) -> TournamentResult:
+        """Play all games, across worker processes if there are several, and
+        return the results in round order."""
+        rounds = range(1, self._game_count + 1)
+        game_args = [self._get_game_args(round_number) for round_number in rounds]
+        if self._worker_count == 1:
+            games = [self.play_game(*args) for args in game_args]
+        else:
+            with ProcessPoolExecutor(self._worker_count) as executor:
+                games = list(executor.map(self.play_game, *zip(*game_args)))
+        return TournamentResult(
+            self._first_config.name, self._second_config.name, games
+        )
+
+    @staticmethod
+    def play_game(
+        round_number: int,
+        white_config: BotConfig,
+        black_config: BotConfig,
+        opening_fen: str,
+        max_plies: int,
+    ) -> GameRecord:
+        """Play one game between two configurations from the opening, until
+        checkmate, stalemate, threefold repetition or the move limit."""
+        board, color = Board.from_fen(opening_fen)
+        bots = {
+            Color.WHITE: white_config.create_bot(),
+            Color.BLACK: black_config.create_bot(),
+        }
+        game = GameRecord(
+            round_number, white_config.name, black_config.name, opening_fen, color
+        )
+        position_counts = {board.get_position_key(color): 1}
+        while True:
+            if Rules.is_in_checkmate(color, board):
+                game.status = GameStatus.CHECKMATE
+                game.winner = color.opposite
+                break
+            if Rules.is_in_stalemate(color, board):
+                game.status = GameStatus.STALEMATE
+                break
+            if len(game.moves) >= max_plies:
+                game.status = GameStatus.MOVE_LIMIT
+                break
+
+            bot = bots[color]
+            start_time = time.perf_counter()
+            move = bot.calculate_best_move(color, board)
+            seconds = time.perf_counter() - start_time
+            board.make_packed_move(move)
+            depth = bot.iterations[-1].depth if bot.iterations else 0
+            game.moves.append(MoveRecord(move, seconds, bot.node_count, depth))
+            color = color.opposite
+
+            position_key = board.get_position_key(color)
+            position_counts[position_key] = position_counts.get(position_key, 0) + 1
+            if position_counts[position_key] >= _REPETITION_COUNT:
+                game.status = GameStatus.REPETITION
+                break
+        return game
+
+    @staticmethod
+    def generate_openings(count: int, plies: int, seed: int = 0) -> list[str]:
+        """Return distinct FENs reached by random legal moves from the initial
+        position. Fewer are returned if there are not enough distinct ones."""
+        randomizer = random.Random(seed)
+        openings = []
+        seen_openings = set()
+        for _ in range(count * 100):
+            if len(openings) == count:
+                break
+
+            board, color = Board.from_fen(INITIAL_FEN)
+            for _ in range(plies):
+                moves = list(Rules.generate_legal_moves(color, board))
+                if not moves:
+                    break
+                board.make_packed_move(randomizer.choice(moves))
+                color = color.opposite
+
+            opening = board.to_fen(color)
+            is_playable = (
+                next(Rules.generate_legal_moves(color, board), None) is not None
+            )
+            if is_playable and opening not in seen_openings:
+                seen_openings.add(opening)
+                openings.append(opening)
+        return openings
+
+    def _get_game_args(
+        self, round_number: int
+    ) -> tuple[int, BotConfig, BotConfig, str, int]:
+        # Consecutive rounds share an opening with colors swapped.
+        opening_fen = self._openings[(round_number - 1) // 2 % len(self._openings)]
+        if round_number % 2 == 1:
+            white_config, black_config = self._first_config, self._second_config
+        else:
+            white_config, black_config = self._second_config, self._first_config
+        return round_number, white_config, black_config, opening_fen, self._max_plies
+
+
+def _get_finite_or_none(value: float) -> float | None:
+    return value if math.isfinite(value) else None
+
+
+def _get_elo_difference(score: float) -> float:
+    """Return the Elo difference that gives the expected score."""
+    if score <= 0:
+        return -math.inf
+    if score >= 1:
+        return math.inf
+    return 400 * math.log10(score / (1 - score))
@@ -0,0 +1,122 @@
+from constants.bot_constants import TRANSPOSITION_TABLE_SIZE_MB
+from enums.bound import Bound
+
+# Each entry is three 64-bit words: a checksum, the packed data and the score.
+# The checksum is the key XORed with the other two words, so an entry torn by
+# concurrent writers no longer matches its key and is ignored.
+_ENTRY_WORDS = 3
+_WORD_BYTES = 8
+_CHECKSUM_OFFSET = 0
+_DATA_OFFSET = 1
+_SCORE_OFFSET = 2
+
+# Each bucket holds a depth-preferred entry followed by an always-replace entry.
+_BUCKET_ENTRIES = 2
+_BUCKET_WORDS = _BUCKET_ENTRIES * _ENTRY_WORDS
+
+# Data word layout: depth (8 bits), bound (8 bits), move + 1 (32 bits, 0 means
+# no move), generation (8 bits).
+_DEPTH_MASK = 0xFF
+_BOUND_SHIFT = 8
+_BOUND_MASK = 0xFF
+_MOVE_SHIFT = 16
+_MOVE_MASK = 0xFFFF_FFFF
+_GENERATION_SHIFT = 48
+_GENERATION_MASK = 0xFF
+
+_BOUNDS = {bound.value: bound for bound in Bound}
+
+# Scratch word to read the bits of a score as it was loaded from the table.
+_score_buffer = memoryview(bytearray(_WORD_BYTES))
+_score_as_float = _score_buffer.cast("d")
+_score_as_word = _score_buffer.cast("Q")
+
+
+class TranspositionTable:
+    """Fixed-capacity cache of search results keyed by position key.
+
+    Entries live in one flat buffer viewed both as unsigned 64-bit words and
+    as doubles, so the table never grows past its configured size. Entries
+    are validated with a checksum instead of locks, so the buffer can be
+    shared between processes."""
+
+    def __init__(self, size_mb: int = TRANSPOSITION_TABLE_SIZE_MB) -> None:
+        entry_count = size_mb * 1024 * 1024 // (_ENTRY_WORDS * _WORD_BYTES)
+        self._bucket_count = max(1, entry_count // _BUCKET_ENTRIES)
+        self._buffer = self._allocate(self._bucket_count * _BUCKET_WORDS * _WORD_BYTES)
+        self._words = self._buffer.cast("Q")
+        self._scores = self._buffer.cast("d")
+        self._generation = 0
+
+    @property
+    def capacity(self) -> int:
+        return self._bucket_count * _BUCKET_ENTRIES
+
+    def new_search(self) -> None:
+        """Age the existing entries so they are replaced before fresh ones."""
+        self._generation = (self._generation + 1) & _GENERATION_MASK
+
+    def clear(self) -> None:
+        self._buffer[:] = bytes(len(self._buffer))
+        self._generation = 0
+
+    def probe(self, key: int) -> tuple[int, Bound, float, int | None] | None:
+        """Return the depth, bound, score and best move stored for the key, or
+        None if the key is not in the table."""
+        words = self._words
+        bucket_index = (key % self._bucket_count) * _BUCKET_WORDS
+        for entry_index in (bucket_index, bucket_index + _ENTRY_WORDS):
+            data = words[entry_index + _DATA_OFFSET]
+            if data == 0:
+                continue
+
+            # Each word is read once so the checksum covers exactly the values
+            # returned.
+            score = self._scores[entry_index + _SCORE_OFFSET]
+            _score_as_float[0] = score
+            if words[entry_index + _CHECKSUM_OFFSET] ^ data ^ _score_as_word[0] == key:
+                move = (data >> _MOVE_SHIFT) & _MOVE_MASK
+                return (
+                    data & _DEPTH_MASK,
+                    _BOUNDS[(data >> _BOUND_SHIFT) & _BOUND_MASK],
+                    score,
+                    move - 1 if move else None,
+                )
+        return None
+
+    def store(
+        self, key: int, depth: int, bound: Bound, score: float, move: int | None
+    ) -> None:
+        """Store a search result. The depth-preferred entry is only replaced by
+        the same position, a deeper search or an entry from an older search;
+        everything else goes to the always-replace entry."""
+        words = self._words
+        entry_index = (key % self._bucket_count) * _BUCKET_WORDS
+        data = words[entry_index + _DATA_OFFSET]
+        is_replaceable = (
+            data == 0
+            or words[entry_index + _CHECKSUM_OFFSET]
+            ^ data
+            ^ words[entry_index + _SCORE_OFFSET]
+            == key
+            or depth >= data & _DEPTH_MASK
+            or (data >> _GENERATION_SHIFT) & _GENERATION_MASK != self._generation
+        )
+        if not is_replaceable:
+            entry_index += _ENTRY_WORDS
+
+        data = (
+            depth
+            | bound.value << _BOUND_SHIFT
+            | (0 if move is None else move + 1) << _MOVE_SHIFT
+            | self._generation << _GENERATION_SHIFT
+        )
+        words[entry_index + _DATA_OFFSET] = data
+        self._scores[entry_index + _SCORE_OFFSET] = score
+        words[entry_index + _CHECKSUM_OFFSET] = (
+            key ^ data ^ words[entry_index + _SCORE_OFFSET]
+        )
+
+    def _allocate(self, byte_count: int) -> memoryview:
+        """Return a zeroed buffer of the size to hold the entries."""
+        return memoryview(bytearray(byte_count))
@@ -0,0 +1,45 @@
+import argparse
+import json
+
+from models.perft import PERFT_POSITIONS, Perft
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Count legal move tree nodes to measure move generation speed."
+    )
+    parser.add_argument("depth", type=int, help="search depth in plies")
+    parser.add_argument(
+        "-p",
+        "--position",
+        choices=list(PERFT_POSITIONS),
+        action="append",
+        help="position to run (repeatable, default: all)",
+    )
+    parser.add_argument(
+        "-d", "--divide", action="store_true", help="show counts per root move"
+    )
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    args = parser.parse_args()
+
+    results = [
+        Perft.run(position, args.depth, args.divide)
+        for position in args.position or PERFT_POSITIONS
+    ]
+
+    if args.json:
+        print(json.dumps([result.to_dict() for result in results], indent=2))
+        return
+
+    for result in results:
+        print(f"{result.position} (depth {result.depth})")
+        for move, node_count in result.divide.items():
+            print(f"  {move}: {node_count}")
+        print(
+            f"  nodes: {result.nodes}, time: {result.seconds:.3f}s, "
+            f"nps: {result.nodes_per_second}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+import argparse
+import os
+import time
+
+from enums.wdl import Wdl
+from models.board import Board
+from models.tablebase import FILE_EXTENSION, Tablebase, TablebaseGenerator
+from utils.move_utils import format_move
+
+_DEFAULT_SIGNATURES = ["KQK", "KRK", "KPK"]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Generate endgame tables or look up a position in them."
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    generate_parser = subparsers.add_parser(
+        "generate", help="generate tables into a directory"
+    )
+    generate_parser.add_argument("directory", help="directory of the tables")
+    generate_parser.add_argument(
+        "signatures",
+        nargs="*",
+        default=_DEFAULT_SIGNATURES,
+        help="material sets in generation order, such as KQK or KRKP "
+        f"(default: {' '.join(_DEFAULT_SIGNATURES)})",
+    )
+
+    probe_parser = subparsers.add_parser("probe", help="look up a FEN")
+    probe_parser.add_argument("directory", help="directory of the tables")
+    probe_parser.add_argument("fen", help="position to look up")
+    args = parser.parse_args()
+
+    if args.command == "generate":
+        os.makedirs(args.directory, exist_ok=True)
+        with Tablebase(args.directory) as tablebase:
+            for signature in args.signatures:
+                start_time = time.perf_counter()
+                values = TablebaseGenerator.generate(signature, tablebase)
+                TablebaseGenerator.write(
+                    os.path.join(args.directory, signature + FILE_EXTENSION), values
+                )
+                tablebase.add_table(signature, values)
+                print(
+                    f"{signature}: {len(values)} positions in "
+                    f"{time.perf_counter() - start_time:.1f}s"
+                )
+        return
+
+    board, color = Board.from_fen(args.fen)
+    with Tablebase(args.directory) as tablebase:
+        entry = tablebase.probe(color, board)
+        if entry is None:
+            print("not in tablebase")
+            return
+
+        result, distance = entry
+        if result == Wdl.DRAW:
+            print("draw")
+        else:
+            print(f"{result.name.lower()}, {distance} plies to mate")
+        move = tablebase.choose_move(color, board)
+        if move is not None:
+            print(f"best move: {format_move(move)}")
+
+
+if __name__ == "__main__":
+    main()
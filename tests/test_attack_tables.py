@@ -0,0 +1,67 @@
+from models.attack_tables import (
+    BLACK_PAWN_ATTACK_MASKS,
+    KING_ATTACK_MASKS,
+    KNIGHT_ATTACK_MASKS,
+    WHITE_PAWN_ATTACK_MASKS,
+    get_bishop_attacks_mask,
+    get_queen_attacks_mask,
+    get_rook_attacks_mask,
+)
+from utils.board_utils import get_mask
+
+
+def test_get_rook_attacks_mask() -> None:
+    square_shift = 3 * 8 + 3
+    expected_mask = 0
+    for index in range(8):
+        if index != 3:
+            expected_mask |= get_mask(3, index) | get_mask(index, 3)
+    assert get_rook_attacks_mask(square_shift, 0) == expected_mask
+
+    occupancy_mask = get_mask(5, 3) | get_mask(3, 1) | get_mask(6, 6)
+    expected_mask = (
+        get_mask(4, 3)
+        | get_mask(5, 3)
+        | get_mask(2, 3)
+        | get_mask(1, 3)
+        | get_mask(0, 3)
+        | get_mask(3, 2)
+        | get_mask(3, 1)
+        | get_mask(3, 4)
+        | get_mask(3, 5)
+        | get_mask(3, 6)
+        | get_mask(3, 7)
+    )
+    assert get_rook_attacks_mask(square_shift, occupancy_mask) == expected_mask
+
+
+def test_get_bishop_attacks_mask() -> None:
+    assert get_bishop_attacks_mask(0, 0) == sum(get_mask(i, i) for i in range(1, 8))
+
+    occupancy_mask = get_mask(2, 2) | get_mask(7, 7)
+    assert get_bishop_attacks_mask(0, occupancy_mask) == get_mask(1, 1) | get_mask(2, 2)
+
+
+def test_get_queen_attacks_mask() -> None:
+    occupancy_mask = get_mask(1, 1) | get_mask(0, 1) | get_mask(1, 0)
+    assert get_queen_attacks_mask(0, occupancy_mask) == occupancy_mask
+
+
+def test_knight_attack_masks() -> None:
+    assert KNIGHT_ATTACK_MASKS[0] == get_mask(1, 2) | get_mask(2, 1)
+    assert KNIGHT_ATTACK_MASKS[3 * 8 + 3].bit_count() == 8
+    assert KNIGHT_ATTACK_MASKS[7 * 8 + 7] == get_mask(6, 5) | get_mask(5, 6)
+
+
+def test_king_attack_masks() -> None:
+    assert KING_ATTACK_MASKS[0] == get_mask(0, 1) | get_mask(1, 0) | get_mask(1, 1)
+    assert KING_ATTACK_MASKS[3 * 8 + 3].bit_count() == 8
+    assert KING_ATTACK_MASKS[7].bit_count() == 3
+
+
+def test_pawn_attack_masks() -> None:
+    assert WHITE_PAWN_ATTACK_MASKS[1 * 8 + 0] == get_mask(2, 1)
+    assert WHITE_PAWN_ATTACK_MASKS[1 * 8 + 3] == get_mask(2, 2) | get_mask(2, 4)
+    assert WHITE_PAWN_ATTACK_MASKS[7 * 8 + 3] == 0
+    assert BLACK_PAWN_ATTACK_MASKS[6 * 8 + 7] == get_mask(5, 6)
+    assert BLACK_PAWN_ATTACK_MASKS[0 * 8 + 3] == 0
@@ -0,0 +1,56 @@
+from constants.bot_constants import CHECKMATE_SCORE
+from models.batch_analyzer import BatchAnalyzer
+
+_FENS = [
+    "7k/6pp/8/8/R7/8/8/K7 w - - 0 1",
+    "",
+    "R6k/6pp/8/8/8/8/8/K7 b - - 1 1",
+    "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1",
+]
+_MALFORMED_FENS = [_FENS[0], "not a fen", _FENS[2]]
+
+
+def test_analyze_in_order() -> None:
+    analyses = list(BatchAnalyzer(3).analyze(_FENS))
+    assert [analysis.index for analysis in analyses] == [0, 2, 3]
+
+    mate_in_one, checkmate, initial = analyses
+    assert mate_in_one.best_move == "3070"
+    assert mate_in_one.score == CHECKMATE_SCORE
+    assert checkmate.best_move is None
+    assert checkmate.score == CHECKMATE_SCORE
+    assert initial.depth == 3
+    assert initial.nodes > 0
+
+
+def test_analyze_with_workers() -> None:
+    batch_analyzer = BatchAnalyzer(2, worker_count=2, max_pending=1)
+    ordered_analyses = list(batch_analyzer.analyze(_FENS))
+    assert [analysis.index for analysis in ordered_analyses] == [0, 2, 3]
+
+    batch_analyzer = BatchAnalyzer(2, worker_count=2, is_ordered=False)
+    unordered_analyses = list(batch_analyzer.analyze(_FENS))
+    assert sorted(
+        (analysis.index, analysis.best_move) for analysis in unordered_analyses
+    ) == [(analysis.index, analysis.best_move) for analysis in ordered_analyses]
+
+
+def test_analyze_skips_past_malformed_fen() -> None:
+    analyses = list(BatchAnalyzer(2).analyze(_MALFORMED_FENS))
+    assert [analysis.index for analysis in analyses] == [0, 1, 2]
+    assert [analysis.error is None for analysis in analyses] == [True, False, True]
+    assert analyses[1].best_move is None
+    assert analyses[1].to_dict()["error"] == analyses[1].error
+
+
+def test_analyze_with_workers_skips_past_malformed_fen() -> None:
+    for is_ordered in (True, False):
+        batch_analyzer = BatchAnalyzer(
+            2, worker_count=2, is_ordered=is_ordered, max_pending=1
+        )
+        analyses = sorted(
+            batch_analyzer.analyze(_MALFORMED_FENS),
+            key=lambda analysis: analysis.index,
+        )
+        assert [analysis.error is None for analysis in analyses] == [True, False, True]
+        assert analyses[0].best_move == "3070"
@@ -0,0 +1,46 @@
+import random
+
+import pytest
+
+from enums.color import Color
+from models.board import Board
+from models.engine import Engine
+from models.perft import PERFT_POSITIONS
+from models.rules import Rules
+
+np = pytest.importorskip("numpy")
+from models.batch_evaluator import BatchEvaluator
+
+
+def _generate_boards() -> list[Board]:
+    """Return the standard positions and positions reached by random play from
+    them, so every piece type and both king tables are covered."""
+    randomizer = random.Random(0)
+    boards = []
+    for set_up in PERFT_POSITIONS.values():
+        board = Board()
+        set_up(board)
+        color = Color.WHITE
+        for _ in range(40):
+            boards.append(board)
+            moves = list(Rules.generate_legal_moves(color, board))
+            if not moves:
+                break
+            board = Board()
+            board._set_bitboards(boards[-1]._bitboards)
+            board.make_packed_move(randomizer.choice(moves))
+            color = color.opposite
+    return boards
+
+
+def test_evaluate_matches_engine() -> None:
+    boards = _generate_boards()
+    scores = BatchEvaluator.evaluate(BatchEvaluator.get_bitboard_array(boards))
+    assert scores.dtype == np.float64
+    assert scores.tolist() == [Engine.evaluate(board) for board in boards]
+
+
+def test_evaluate_empty_batch() -> None:
+    bitboards = BatchEvaluator.get_bitboard_array([])
+    assert bitboards.shape == (0, 12)
+    assert BatchEvaluator.evaluate(bitboards).shape == (0,)
@@ -0,0 +1,120 @@
+import random
+
+import pytest
+
+from enums.color import Color
+from models.board import Board
+from models.coordinate import Coordinate
+from models.piece import King, Pawn, Piece, Queen, Rook
+from models.rules import Rules
+
+
+@pytest.fixture
+def board() -> Board:
+    return Board(debug=True)
+
+
+def test_hash_matches_full_recompute(board: Board) -> None:
+    assert board.zobrist_key == 0
+
+    board.set_up_pieces()
+    assert board.zobrist_key == board._calculate_zobrist_hash()
+
+    board.set_piece(Queen(Color.WHITE), Coordinate(4, 4))
+    board.set_piece(Rook(Color.BLACK), Coordinate(4, 4))
+    board.set_piece(None, Coordinate(0, 0))
+    assert board.zobrist_key == board._calculate_zobrist_hash()
+
+
+def test_hash_restored_after_undo(board: Board) -> None:
+    board.set_up_pieces()
+    rng = random.Random(0)
+    color = Color.WHITE
+    played_moves = []
+    for _ in range(40):
+        moves = list(Rules.generate_legal_moves(color, board))
+        if not moves:
+            break
+        move = rng.choice(moves)
+        board.make_packed_move(move)
+        assert board.zobrist_key == board._calculate_zobrist_hash()
+        played_moves.append((move, board.zobrist_key))
+        color = color.opposite
+
+    initial_board = Board()
+    initial_board.set_up_pieces()
+    for move, move_hash in reversed(played_moves):
+        assert board.zobrist_key == move_hash
+        board.undo_packed_move(move)
+    assert board.zobrist_key == initial_board.zobrist_key
+
+
+def test_hash_depends_on_placement(board: Board) -> None:
+    board.set_piece(King(Color.WHITE), Coordinate(0, 0))
+    board.set_piece(Pawn(Color.WHITE), Coordinate(1, 0))
+    first_hash = hash(board)
+
+    board.set_piece(None, Coordinate(1, 0))
+    board.set_piece(Pawn(Color.WHITE), Coordinate(1, 1))
+    assert hash(board) != first_hash
+
+    board.set_piece(None, Coordinate(1, 1))
+    board.set_piece(Pawn(Color.WHITE), Coordinate(1, 0))
+    assert hash(board) == first_hash
+
+
+def test_occupancy_matches_bitboards(board: Board) -> None:
+    board.set_up_pieces()
+    rng = random.Random(1)
+    color = Color.WHITE
+    for _ in range(40):
+        moves = list(Rules.generate_legal_moves(color, board))
+        if not moves:
+            break
+        board.make_packed_move(rng.choice(moves))
+        color = color.opposite
+
+        white_mask = 0
+        black_mask = 0
+        for square_shift in range(Board.LEN):
+            piece = board._get_piece(1 << square_shift)
+            if piece is None:
+                continue
+            assert board.get_bitboard(piece) & (1 << square_shift)
+            if piece.color == Color.WHITE:
+                white_mask |= 1 << square_shift
+            else:
+                black_mask |= 1 << square_shift
+        assert board.get_mask(Color.WHITE) == white_mask
+        assert board.get_mask(Color.BLACK) == black_mask
+        assert board.get_mask() == white_mask | black_mask
+
+
+def test_set_piece_rejects_invalid_piece(board: Board) -> None:
+    with pytest.raises(ValueError):
+        board.set_piece(Piece(Color.WHITE), Coordinate(0, 0))
+
+
+def test_fen_round_trip() -> None:
+    fen = "r3k2r/pp1q1ppp/2n1b3/3pP3/8/2N2N2/PPP2PPP/R2QK2R b - - 0 1"
+    board, color = Board.from_fen(fen, debug=True)
+    assert color == Color.BLACK
+    assert board.to_fen(color) == fen
+    assert board.get_piece(Coordinate(6, 3)) == Queen(Color.BLACK)
+    assert board.get_piece(Coordinate(4, 4)) == Pawn(Color.WHITE)
+
+    # Every derived field matches a board built square by square.
+    expected_board = Board()
+    for row_index in range(Board.SIZE):
+        for column_index in range(Board.SIZE):
+            coordinate = Coordinate(row_index, column_index)
+            expected_board.set_piece(board.get_piece(coordinate), coordinate)
+    for field in Board.__slots__[:-1]:
+        assert getattr(board, field) == getattr(expected_board, field)
+
+
+def test_fen_of_initial_position(board: Board) -> None:
+    board.set_up_pieces()
+    assert board.to_fen(Color.WHITE) == (
+        "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w - - 0 1"
+    )
@@ -0,0 +1,234 @@
+import json
+
+import pytest
+
+from constants.bot_constants import CHECKMATE_SCORE
+from enums.bound import Bound
+from enums.color import Color
+from enums.parallel_mode import ParallelMode
+from enums.search_feature import SearchFeature
+from models.board import Board
+from models.bot import _FUTILITY_MARGIN, Bot
+from models.coordinate import Coordinate
+from models.move import Move
+from models.piece import King, Knight, Pawn, Queen, Rook
+from models.rules import Rules
+from utils.move_utils import encode_move, is_capture
+
+
+@pytest.fixture
+def board() -> Board:
+    return Board()
+
+
+def test_calculate_best_move_mate_in_one(board: Board) -> None:
+    board.set_piece(King(Color.BLACK), Coordinate(7, 7))
+    board.set_piece(Pawn(Color.BLACK), Coordinate(6, 6))
+    board.set_piece(Pawn(Color.BLACK), Coordinate(6, 7))
+    board.set_piece(King(Color.WHITE), Coordinate(0, 0))
+    board.set_piece(Rook(Color.WHITE), Coordinate(3, 0))
+    mating_move = Move.from_coordinates(
+        Coordinate(3, 0), Coordinate(7, 0), Rook(Color.WHITE), None, Color.WHITE
+    )
+    assert Bot(3).calculate_best_move(Color.WHITE, board) == encode_move(mating_move)
+
+
+def test_calculate_best_move_capture(board: Board) -> None:
+    board.set_piece(King(Color.WHITE), Coordinate(0, 0))
+    board.set_piece(Knight(Color.WHITE), Coordinate(2, 2))
+    board.set_piece(King(Color.BLACK), Coordinate(7, 7))
+    board.set_piece(Queen(Color.BLACK), Coordinate(4, 3))
+    capturing_move = Move.from_coordinates(
+        Coordinate(2, 2),
+        Coordinate(4, 3),
+        Knight(Color.WHITE),
+        Queen(Color.BLACK),
+        Color.WHITE,
+    )
+    assert Bot(2).calculate_best_move(Color.WHITE, board) == encode_move(
+        capturing_move
+    )
+
+
+def test_calculate_best_move_iterations(board: Board) -> None:
+    board.set_up_pieces()
+    bot = Bot(3)
+    best_move = bot.calculate_best_move(Color.WHITE, board)
+    assert [iteration.depth for iteration in bot.iterations] == [1, 2, 3]
+    assert bot.iterations[-1].principal_variation[0] == best_move
+    assert len(bot.iterations[-1].principal_variation) == 3
+
+    node_counts = [iteration.nodes for iteration in bot.iterations]
+    assert node_counts == sorted(node_counts)
+
+
+def test_calculate_best_move_node_limit(board: Board) -> None:
+    board.set_up_pieces()
+    bot = Bot(5, node_limit=100)
+    bot.calculate_best_move(Color.WHITE, board)
+    assert 1 <= len(bot.iterations) < 5
+
+
+def test_calculate_best_move_avoids_defended_capture(board: Board) -> None:
+    board.set_piece(King(Color.WHITE), Coordinate(0, 0))
+    board.set_piece(Queen(Color.WHITE), Coordinate(2, 3))
+    board.set_piece(King(Color.BLACK), Coordinate(7, 7))
+    board.set_piece(Pawn(Color.BLACK), Coordinate(5, 3))
+    board.set_piece(Pawn(Color.BLACK), Coordinate(6, 4))
+    bot = Bot(1)
+    best_move = bot.calculate_best_move(Color.WHITE, board)
+    assert not is_capture(best_move)
+    assert bot.iterations[-1].quiescence_nodes > 0
+
+
+@pytest.mark.parametrize("search_feature", list(SearchFeature))
+def test_calculate_best_move_with_search_feature(
+    board: Board, search_feature: SearchFeature
+) -> None:
+    board.set_piece(King(Color.BLACK), Coordinate(7, 7))
+    board.set_piece(Pawn(Color.BLACK), Coordinate(6, 6))
+    board.set_piece(Pawn(Color.BLACK), Coordinate(6, 7))
+    board.set_piece(King(Color.WHITE), Coordinate(0, 0))
+    board.set_piece(Rook(Color.WHITE), Coordinate(3, 0))
+    mating_move = Move.from_coordinates(
+        Coordinate(3, 0), Coordinate(7, 0), Rook(Color.WHITE), None, Color.WHITE
+    )
+    bot = Bot(4, search_features=frozenset({search_feature}))
+    assert bot.calculate_best_move(Color.WHITE, board) == encode_move(mating_move)
+
+
+def test_search_features_reduce_nodes(board: Board) -> None:
+    board.set_up_pieces()
+    full_width_bot = Bot(5)
+    full_width_bot.calculate_best_move(Color.WHITE, board)
+    selective_bot = Bot(5, search_features=frozenset(SearchFeature))
+    best_move = selective_bot.calculate_best_move(Color.WHITE, board)
+    assert selective_bot.node_count < full_width_bot.node_count
+    assert best_move in Rules.generate_legal_moves(Color.WHITE, board)
+
+
+def test_futility_pruning_fail_low_bound(board: Board) -> None:
+    board.set_up_pieces()
+    bot = Bot(1, search_features=frozenset({SearchFeature.FUTILITY_PRUNING}))
+    futility_score = bot._evaluate(Color.WHITE, board) + _FUTILITY_MARGIN
+    alpha = futility_score + 1
+    score = bot._negamax(Color.WHITE, 1, 0, alpha, alpha + 1, board)
+
+    # The pruned moves could reach the futility score, so the stored upper
+    # bound must not be below it.
+    _, bound, stored_score, _ = bot._transposition_table.probe(
+        board.get_position_key(Color.WHITE)
+    )
+    assert bound == Bound.UPPER
+    assert score == stored_score >= futility_score
+
+
+def test_aspiration_window_widens(board: Board) -> None:
+    board.set_up_pieces()
+    moves = list(Rules.generate_legal_moves(Color.BLACK, board))
+    score, _ = Bot(3)._search_root(
+        Color.BLACK, 3, moves, board, -CHECKMATE_SCORE, CHECKMATE_SCORE
+    )
+    # A window far off the real score fails until it is widened to include it.
+    for previous_score in (score - 10, score + 10):
+        bot = Bot(3)
+        assert (
+            bot._search_root_with_aspiration(
+                Color.BLACK, 3, list(moves), board, previous_score
+            )[0]
+            == score
+        )
+
+
+def test_calculate_best_move_in_parallel(board: Board) -> None:
+    board.set_piece(King(Color.BLACK), Coordinate(7, 7))
+    board.set_piece(Pawn(Color.BLACK), Coordinate(6, 6))
+    board.set_piece(Pawn(Color.BLACK), Coordinate(6, 7))
+    board.set_piece(King(Color.WHITE), Coordinate(0, 0))
+    board.set_piece(Rook(Color.WHITE), Coordinate(3, 0))
+    mating_move = Move.from_coordinates(
+        Coordinate(3, 0), Coordinate(7, 0), Rook(Color.WHITE), None, Color.WHITE
+    )
+    bot = Bot(3, worker_count=2)
+    try:
+        assert bot.calculate_best_move(Color.WHITE, board) == encode_move(
+            mating_move
+        )
+
+        board.set_up_pieces()
+        bot.calculate_best_move(Color.BLACK, board)
+        serial_bot = Bot(3)
+        serial_bot.calculate_best_move(Color.BLACK, board)
+        assert bot.iterations[-1].score == serial_bot.iterations[-1].score
+        assert bot.iterations[-1].principal_variation[0] in Rules.generate_legal_moves(
+            Color.BLACK, board
+        )
+    finally:
+        bot.close()
+
+
+def test_calculate_best_move_with_lazy_smp(board: Board) -> None:
+    board.set_up_pieces()
+    bot = Bot(3, worker_count=2, parallel_mode=ParallelMode.LAZY_SMP)
+    try:
+        best_move = bot.calculate_best_move(Color.WHITE, board)
+        assert [iteration.depth for iteration in bot.iterations] == [1, 2, 3]
+        assert best_move in Rules.generate_legal_moves(Color.WHITE, board)
+    finally:
+        bot.close()
+
+
+def test_calculate_best_move_stats(board: Board) -> None:
+    board.set_up_pieces()
+    assert Bot(2).stats is None
+
+    bot = Bot(4, collects_stats=True)
+    bot.calculate_best_move(Color.WHITE, board)
+    stats = bot.stats
+    assert stats.nodes == bot.node_count
+    assert sum(stats.iteration_nodes) == stats.nodes
+    assert len(stats.branching_factors) == 3
+    assert 0 < stats.first_move_cutoffs <= stats.beta_cutoffs
+    assert 0 < stats.transposition_table_hits <= stats.transposition_table_probes
+    assert stats.transposition_table_stores > 0
+    assert json.loads(stats.to_json())["nodes"] == stats.nodes
+
+    # Following the principal variation is not part of the search.
+    transposition_table_probes = stats.transposition_table_probes
+    bot._get_principal_variation(Color.WHITE, 4, board)
+    assert stats.transposition_table_probes == transposition_table_probes
+
+    # Statistics are per search.
+    bot.calculate_best_move(Color.BLACK, board)
+    assert bot.stats.nodes == bot.node_count
+
+
+def test_pondering_hit(board: Board) -> None:
+    board.set_up_pieces()
+    bot = Bot(3)
+    board.make_packed_move(bot.calculate_best_move(Color.WHITE, board))
+    guessed_move = bot.start_pondering(Color.BLACK, board)
+    assert guessed_move in Rules.generate_legal_moves(Color.BLACK, board)
+
+    board.make_packed_move(guessed_move)
+    best_move = bot.calculate_best_move(Color.WHITE, board)
+    assert [iteration.depth for iteration in bot.iterations] == [1, 2, 3]
+    assert best_move in Rules.generate_legal_moves(Color.WHITE, board)
+
+
+def test_pondering_miss(board: Board) -> None:
+    board.set_up_pieces()
+    bot = Bot(3)
+    board.make_packed_move(bot.calculate_best_move(Color.WHITE, board))
+    guessed_move = bot.start_pondering(Color.BLACK, board)
+    other_move = next(
+        move
+        for move in Rules.generate_legal_moves(Color.BLACK, board)
+        if move != guessed_move
+    )
+
+    board.make_packed_move(other_move)
+    best_move = bot.calculate_best_move(Color.WHITE, board)
+    assert [iteration.depth for iteration in bot.iterations] == [1, 2, 3]
+    assert best_move in Rules.generate_legal_moves(Color.WHITE, board)
+    bot.close()
@@ -0,0 +1,45 @@
+import random
+
+import pytest
+
+from enums.color import Color
+from models.board import Board
+from models.engine import Engine
+from models.rules import Rules
+from utils.move_utils import is_capture
+
+
+@pytest.fixture
+def board() -> Board:
+    return Board(debug=True)
+
+
+def test_evaluate_initial_position(board: Board) -> None:
+    assert Engine.evaluate(board) == 0
+
+    board.set_up_pieces()
+    assert Engine.evaluate(board) == 0
+
+
+def test_evaluate_matches_full_recompute(board: Board) -> None:
+    board.set_up_pieces()
+    rng = random.Random(0)
+    color = Color.WHITE
+    played_moves = []
+    for _ in range(200):
+        moves = list(Rules.generate_legal_moves(color, board))
+        if not moves:
+            break
+        # Prefer captures so the game reaches an endgame without queens.
+        captures = [move for move in moves if is_capture(move)]
+        move = rng.choice(captures or moves)
+        board.make_packed_move(move)
+        # In debug mode, evaluate checks the scores against a full recompute.
+        played_moves.append((move, Engine.evaluate(board)))
+        color = color.opposite
+    assert Engine._is_in_endgame(board)
+
+    for move, score in reversed(played_moves):
+        assert Engine.evaluate(board) == score
+        board.undo_packed_move(move)
+    assert Engine.evaluate(board) == 0
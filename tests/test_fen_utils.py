@@ -0,0 +1,44 @@
+import pytest
+
+from enums.color import Color
+from models.board import Board
+from utils.fen_utils import format_fen, parse_fen
+
+
+def test_parse_fen_initial_position() -> None:
+    board = Board()
+    board.set_up_pieces()
+    bitboards, color = parse_fen(
+        "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1"
+    )
+    assert bitboards == board._bitboards
+    assert color == Color.WHITE
+
+
+def test_parse_fen_side_to_move() -> None:
+    bitboards, color = parse_fen("7k/8/8/8/8/8/8/K7 b")
+    assert color == Color.BLACK
+    assert bitboards[5] == 1
+    assert bitboards[11] == 1 << 63
+
+
+@pytest.mark.parametrize(
+    "fen",
+    [
+        "",
+        "8/8/8/8/8/8/8 w",
+        "8/8/8/8/8/8/8/9 w",
+        "8/8/8/8/8/8/8/7x w",
+        "8/8/8/8/8/8/8/8 x",
+    ],
+)
+def test_parse_fen_invalid(fen: str) -> None:
+    with pytest.raises(ValueError):
+        parse_fen(fen)
+
+
+def test_format_fen_empty_squares() -> None:
+    mailbox = [12] * 64
+    mailbox[0] = 5
+    mailbox[63] = 11
+    assert format_fen(mailbox, Color.BLACK) == "7k/8/8/8/8/8/8/K7 b - - 0 1"
@@ -6,6 +6,7 @@ from models.coordinate import Coordinate
 from models.move import Move
 from models.move_generator import MoveGenerator
 from models.piece import Bishop, King, Knight, Pawn, Queen, Rook
+from utils.move_utils import decode_move
 
 
 @pytest.fixture
@@ -34,9 +35,9 @@ def test_generate_candidate_moves(board: Board) -> None:
         Move.from_coordinates(Coordinate(0, 6), Coordinate(2, 7), Knight(Color.WHITE), None, Color.WHITE),
     ]
     # fmt: on
-    assert set(MoveGenerator.generate_candidate_moves(Color.WHITE, board)) == set(
-        legal_moves
-    )
+    assert set(
+        map(decode_move, MoveGenerator.generate_candidate_moves(Color.WHITE, board))
+    ) == set(legal_moves)
 
     board.set_piece(None, Coordinate(1, 0))
     board.set_piece(None, Coordinate(1, 1))
@@ -105,6 +106,6 @@ def test_generate_candidate_moves(board: Board) -> None:
         Move.from_coordinates(Coordinate(0, 4), Coordinate(1, 5), King(Color.WHITE), None, Color.WHITE),
     ]
     # fmt: on
-    assert set(MoveGenerator.generate_candidate_moves(Color.WHITE, board)) == set(
-        legal_moves
-    )
+    assert set(
+        map(decode_move, MoveGenerator.generate_candidate_moves(Color.WHITE, board))
+    ) == set(legal_moves)
@@ -0,0 +1,60 @@
+import pytest
+
+from enums.color import Color
+from models.board import Board
+from models.coordinate import Coordinate
+from models.move import Move
+from models.move_picker import MovePicker
+from models.piece import Bishop, King, Knight, Pawn, Queen, Rook
+from models.rules import Rules
+from utils.move_utils import decode_move, encode_move
+
+
+@pytest.fixture
+def board() -> Board:
+    board = Board()
+    board.set_piece(King(Color.WHITE), Coordinate(0, 0))
+    board.set_piece(Rook(Color.WHITE), Coordinate(3, 0))
+    board.set_piece(Knight(Color.WHITE), Coordinate(3, 3))
+    board.set_piece(King(Color.BLACK), Coordinate(7, 7))
+    board.set_piece(Queen(Color.BLACK), Coordinate(5, 4))
+    board.set_piece(Bishop(Color.BLACK), Coordinate(4, 1))
+    board.set_piece(Pawn(Color.BLACK), Coordinate(6, 0))
+    board.set_piece(Knight(Color.BLACK), Coordinate(7, 2))
+    return board
+
+
+def test_generate_moves_yields_each_legal_move_once(board: Board) -> None:
+    move_picker = MovePicker()
+    moves = list(move_picker.generate_moves(Color.WHITE, board, 0))
+    assert len(moves) == len(set(moves))
+    assert set(moves) == set(Rules.generate_legal_moves(Color.WHITE, board))
+
+
+def test_generate_moves_order(board: Board) -> None:
+    move_picker = MovePicker()
+    hash_move = encode_move(
+        Move.from_coordinates(
+            Coordinate(3, 0), Coordinate(3, 1), Rook(Color.WHITE), None, Color.WHITE
+        )
+    )
+    killer_move = encode_move(
+        Move.from_coordinates(
+            Coordinate(3, 0), Coordinate(2, 0), Rook(Color.WHITE), None, Color.WHITE
+        )
+    )
+    move_picker.record_cutoff(killer_move, 3, 1)
+
+    moves = [
+        decode_move(move)
+        for move in move_picker.generate_moves(Color.WHITE, board, 1, hash_move)
+    ]
+    assert moves[0] == decode_move(hash_move)
+    # Queen first (most valuable victim), then the undefended bishop.
+    assert moves[1].to_piece == Queen(Color.BLACK)
+    assert moves[2].to_piece == Bishop(Color.BLACK)
+    assert moves[3] == decode_move(killer_move)
+    # The rook takes a pawn defended by the knight, so it is searched last.
+    assert moves[-1].to_piece == Pawn(Color.BLACK)
+    assert moves[-1].from_piece == Rook(Color.WHITE)
+    assert all(move.to_piece is None for move in moves[3:-1])
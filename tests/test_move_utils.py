@@ -0,0 +1,68 @@
+from enums.color import Color
+from models.board import Board
+from models.coordinate import Coordinate
+from models.move import Move
+from models.piece import King, Pawn, Queen, Rook
+from models.rules import Rules
+from utils.move_utils import (
+    decode_move,
+    encode_move,
+    format_move,
+    format_uci_move,
+    get_move_color,
+    get_to_square_shift,
+    is_capture,
+    is_promotion,
+)
+
+
+def test_encode_decode_round_trip() -> None:
+    move = Move.from_coordinates(
+        Coordinate(6, 1),
+        Coordinate(7, 2),
+        Pawn(Color.WHITE),
+        Rook(Color.BLACK),
+        Color.WHITE,
+    )
+    packed_move = encode_move(move, Queen(Color.WHITE))
+    assert decode_move(packed_move) == move
+    assert is_capture(packed_move)
+    assert is_promotion(packed_move)
+    assert get_move_color(packed_move) == Color.WHITE
+    assert format_move(packed_move) == str(move) == "6172"
+    assert format_uci_move(packed_move) == "b7c8q"
+
+    move = Move.from_coordinates(
+        Coordinate(7, 4), Coordinate(6, 4), King(Color.BLACK), None, Color.BLACK
+    )
+    packed_move = encode_move(move)
+    assert decode_move(packed_move) == move
+    assert not is_capture(packed_move)
+    assert not is_promotion(packed_move)
+    assert get_move_color(packed_move) == Color.BLACK
+    assert format_uci_move(packed_move) == "e8e7"
+
+
+def test_make_and_undo_packed_promotion() -> None:
+    board = Board(debug=True)
+    board.set_piece(King(Color.WHITE), Coordinate(0, 0))
+    board.set_piece(King(Color.BLACK), Coordinate(7, 7))
+    board.set_piece(Pawn(Color.WHITE), Coordinate(6, 1))
+    board.set_piece(Rook(Color.BLACK), Coordinate(7, 2))
+    zobrist_key = board.zobrist_key
+
+    promotions = [
+        move
+        for move in Rules.generate_legal_moves(Color.WHITE, board)
+        if is_promotion(move)
+    ]
+    assert sorted(map(format_move, promotions)) == ["6171", "6172"]
+
+    for move in promotions:
+        board.make_packed_move(move)
+        to_square_mask = 1 << get_to_square_shift(move)
+        assert board._get_piece(to_square_mask) == Queen(Color.WHITE)
+        assert board.zobrist_key == board._calculate_zobrist_hash()
+        board.undo_packed_move(move)
+        assert board.zobrist_key == zobrist_key
+        assert board.get_piece(Coordinate(6, 1)) == Pawn(Color.WHITE)
@@ -0,0 +1,84 @@
+import random
+
+import pytest
+
+from enums.color import Color
+from models.board import Board
+from models.bot import Bot
+from models.opening_book import OpeningBook, OpeningBookBuilder
+from utils.fen_utils import INITIAL_FEN
+from utils.move_utils import format_move
+
+
+@pytest.fixture
+def book_path(tmp_path) -> str:
+    builder = OpeningBookBuilder()
+    builder.add_line(["1424", "6454"])
+    builder.add_line(["1424", "6555"])
+    builder.add_line(["0625"])
+    path = str(tmp_path / "book.bin")
+    builder.write(path)
+    return path
+
+
+def test_probe_orders_moves_by_weight(book_path: str) -> None:
+    board, color = Board.from_fen(INITIAL_FEN)
+    with OpeningBook(book_path) as book:
+        assert len(book) == 4
+        entries = book.probe(board.get_position_key(color))
+        assert [(format_move(move), weight) for move, weight in entries] == [
+            ("1424", 2),
+            ("0625", 1),
+        ]
+        assert book.probe(0) == []
+
+
+def test_choose_move(book_path: str) -> None:
+    board, color = Board.from_fen(INITIAL_FEN)
+    with OpeningBook(book_path) as book:
+        assert format_move(book.choose_move(color, board)) == "1424"
+        move = book.choose_move(color, board, random.Random(0))
+        assert format_move(move) in {"1424", "0625"}
+
+        board.make_packed_move(book.choose_move(color, board))
+        moves = {format_move(book.probe(board.get_position_key(color.opposite))[0][0])}
+        assert moves <= {"6454", "6555"}
+
+        board, color = Board.from_fen("k7/8/8/8/8/8/8/K7 w - - 0 1")
+        assert book.choose_move(color, board) is None
+
+
+def test_add_line_stops_at_illegal_move() -> None:
+    builder = OpeningBookBuilder()
+    # No double pawn pushes in these rules.
+    assert builder.add_line(["1434", "6454"]) == 0
+    assert builder.add_line(["1424", "6454", "0625"]) == 3
+    assert OpeningBookBuilder(max_plies=2).add_line(["1424", "6454", "0625"]) == 2
+
+
+def test_add_pgn(tmp_path) -> None:
+    builder = OpeningBookBuilder()
+    pgn = (
+        '[Event "Self-play"]\n\n1. 1424 6454 2. 0625 1-0\n\n'
+        '[FEN "k7/8/8/8/8/8/8/K6R b - - 0 1"]\n\n1... 7071 *\n'
+    )
+    assert builder.add_pgn(pgn) == 2
+    path = str(tmp_path / "book.bin")
+    assert builder.write(path) == 4
+    assert builder.write(path, min_weight=2) == 0
+
+
+def test_bot_plays_book_move(book_path: str) -> None:
+    board, color = Board.from_fen(INITIAL_FEN)
+    with OpeningBook(book_path) as book:
+        bot = Bot(3, opening_book=book)
+        assert format_move(bot.calculate_best_move(color, board)) == "1424"
+        assert bot.iterations == []
+        assert bot.node_count == 0
+
+
+def test_invalid_file_raises(tmp_path) -> None:
+    path = tmp_path / "book.bin"
+    path.write_bytes(b"not a book")
+    with pytest.raises(ValueError):
+        OpeningBook(str(path))
@@ -0,0 +1,60 @@
+from typing import Generator
+
+import pytest
+
+from enums.color import Color
+from models.board import Board
+from models.move_generator import MoveGenerator
+from models.perft import PERFT_POSITIONS, Perft
+from models.rules import Rules
+from utils.move_utils import decode_move
+
+
+def _generate_reference_legal_moves(color: Color, board: Board) -> Generator[int]:
+    """Generate legal moves by playing every candidate and testing for check."""
+    for move in MoveGenerator.generate_candidate_moves(color, board):
+        if not Rules.is_in_check_after_move(decode_move(move), board):
+            yield move
+
+
+def _perft(color: Color, depth: int, board: Board) -> int:
+    """Return the number of leaf nodes at the depth, checking at every node that
+    the legal move generator agrees with the reference."""
+    moves = list(Rules.generate_legal_moves(color, board))
+    assert set(moves) == set(_generate_reference_legal_moves(color, board))
+    if depth == 1:
+        return len(moves)
+
+    node_count = 0
+    for move in moves:
+        board.make_packed_move(move)
+        node_count += _perft(color.opposite, depth - 1, board)
+        board.undo_packed_move(move)
+    return node_count
+
+
+@pytest.mark.parametrize(
+    "position, depth, node_count",
+    [
+        ("initial", 1, 12),
+        ("initial", 2, 144),
+        ("initial", 3, 2124),
+        ("pinned_sliders", 1, 15),
+        ("pinned_sliders", 2, 516),
+        ("double_check", 3, 1790),
+        ("promotion", 3, 1730),
+    ],
+)
+def test_perft(position: str, depth: int, node_count: int) -> None:
+    board = Board()
+    PERFT_POSITIONS[position](board)
+    assert _perft(Color.WHITE, depth, board) == node_count
+    assert Perft.count_nodes(Color.WHITE, depth, board) == node_count
+
+
+def test_perft_divide() -> None:
+    result = Perft.run("initial", 2, divide=True)
+    assert result.nodes == 144
+    assert len(result.divide) == 12
+    assert set(result.divide.values()) == {12}
+    assert result.to_dict()["nps"] == result.nodes_per_second
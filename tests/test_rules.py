@@ -6,6 +6,7 @@ from models.coordinate import Coordinate
 from models.move import Move
 from models.piece import Bishop, King, Knight, Pawn, Queen, Rook
 from models.rules import Rules
+from utils.move_utils import decode_move
 
 
 @pytest.fixture
@@ -344,7 +345,9 @@ def test_generate_legal_moves(board) -> None:
         Move.from_coordinates(Coordinate(0, 6), Coordinate(1, 4), Knight(Color.WHITE), Rook(Color.BLACK), Color.WHITE),
     ]
     # fmt: on
-    assert set(Rules.generate_legal_moves(Color.WHITE, board)) == set(legal_moves)
+    assert set(map(decode_move, Rules.generate_legal_moves(Color.WHITE, board))) == set(
+        legal_moves
+    )
 
 
 def test_is_in_stalemate(board) -> None:
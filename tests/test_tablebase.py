@@ -0,0 +1,115 @@
+import random
+
+import pytest
+
+from enums.color import Color
+from enums.wdl import Wdl
+from models.board import Board
+from models.bot import Bot
+from models.rules import Rules
+from models.tablebase import Tablebase, TablebaseGenerator
+
+_MATED_FEN = "k7/1Q6/1K6/8/8/8/8/8 b - - 0 1"
+
+
+@pytest.fixture(scope="module")
+def tablebase() -> Tablebase:
+    tablebase = Tablebase()
+    tablebase.add_table("KQK", TablebaseGenerator.generate("KQK", tablebase))
+    return tablebase
+
+
+def test_probe(tablebase: Tablebase) -> None:
+    board, color = Board.from_fen(_MATED_FEN)
+    assert tablebase.probe(color, board) == (Wdl.LOSS, 0)
+    # The same position with colors swapped is mirrored onto the table.
+    board, color = Board.from_fen("8/8/8/8/8/1k6/1q6/K7 w - - 0 1")
+    assert tablebase.probe(color, board) == (Wdl.LOSS, 0)
+
+    board, color = Board.from_fen("8/8/8/4k3/8/8/8/K7 w - - 0 1")
+    assert tablebase.probe(color, board) == (Wdl.DRAW, 0)
+    board, color = Board.from_fen("8/8/8/4k3/8/8/8/KR6 w - - 0 1")
+    assert tablebase.probe(color, board) is None
+
+
+def test_probe_matches_successors(tablebase: Tablebase) -> None:
+    """Every result follows from the results after each legal move."""
+    randomizer = random.Random(0)
+    checked_count = 0
+    while checked_count < 100:
+        squares = randomizer.sample(range(64), 3)
+        color = randomizer.choice(list(Color))
+        board = Board()
+        board._set_bitboards(
+            [0, 0, 0, 0, 1 << squares[1], 1 << squares[0]]
+            + [0, 0, 0, 0, 0, 1 << squares[2]]
+        )
+        if Rules.is_in_check(color.opposite, board):
+            continue
+
+        entries = []
+        for move in Rules.generate_legal_moves(color, board):
+            board.make_packed_move(move)
+            entries.append(tablebase.probe(color.opposite, board))
+            board.undo_packed_move(move)
+        losses = [distance for result, distance in entries if result == Wdl.LOSS]
+        if not entries:
+            is_mate = Rules.is_in_check(color, board)
+            expected_entry = (Wdl.LOSS, 0) if is_mate else (Wdl.DRAW, 0)
+        elif losses:
+            expected_entry = (Wdl.WIN, min(losses) + 1)
+        elif all(result == Wdl.WIN for result, _ in entries):
+            expected_entry = (Wdl.LOSS, max(distance for _, distance in entries) + 1)
+        else:
+            expected_entry = (Wdl.DRAW, 0)
+        assert tablebase.probe(color, board) == expected_entry
+        checked_count += 1
+
+
+def test_choose_move_shortens_mate(tablebase: Tablebase) -> None:
+    board, color = Board.from_fen("8/8/8/4k3/8/8/8/KQ6 w - - 0 1")
+    result, distance = tablebase.probe(color, board)
+    assert result == Wdl.WIN
+    while distance > 0:
+        board.make_packed_move(tablebase.choose_move(color, board))
+        color = color.opposite
+        result, next_distance = tablebase.probe(color, board)
+        assert next_distance == distance - 1
+        distance = next_distance
+    assert Rules.is_in_checkmate(color, board)
+
+
+def test_write_and_open(tmp_path, tablebase: Tablebase) -> None:
+    values = TablebaseGenerator.generate("KQK", tablebase)
+    TablebaseGenerator.write(str(tmp_path / "KQK.tb"), values)
+    board, color = Board.from_fen(_MATED_FEN)
+    with Tablebase(str(tmp_path)) as opened_tablebase:
+        assert opened_tablebase.signatures == ["KQK"]
+        assert opened_tablebase.max_piece_count == 3
+        assert opened_tablebase.probe(color, board) == (Wdl.LOSS, 0)
+
+    (tmp_path / "KRK.tb").write_bytes(b"not a table")
+    with pytest.raises(ValueError):
+        Tablebase(str(tmp_path))
+
+
+def test_generate_needs_smaller_tables() -> None:
+    with pytest.raises(ValueError):
+        TablebaseGenerator.generate("KQKK", Tablebase())
+    with pytest.raises(ValueError):
+        TablebaseGenerator.generate("KPK", Tablebase())
+
+
+def test_bot_uses_tablebase(tablebase: Tablebase) -> None:
+    board, color = Board.from_fen("8/8/8/4k3/8/8/8/KQ6 w - - 0 1")
+    bot = Bot(3, tablebase=tablebase)
+    assert bot.calculate_best_move(color, board) == tablebase.choose_move(color, board)
+    assert bot.iterations == []
+
+    # After the rook is taken, positions are looked up instead of searched.
+    board, color = Board.from_fen("8/8/8/3rk3/8/8/8/K2Q4 w - - 0 1")
+    searching_bot = Bot(3)
+    searching_bot.calculate_best_move(color, board)
+    probing_bot = Bot(3, tablebase=tablebase)
+    probing_bot.calculate_best_move(color, board)
+    assert probing_bot.node_count < searching_bot.node_count
@@ -0,0 +1,85 @@
+import json
+import math
+
+from enums.color import Color
+from enums.game_status import GameStatus
+from models.tournament import (
+    BotConfig,
+    GameRecord,
+    MoveRecord,
+    Tournament,
+    TournamentResult,
+)
+
+_FIRST_CONFIG = BotConfig("first", 1)
+_SECOND_CONFIG = BotConfig("second", 2)
+
+
+def test_play_game_adjudicates_checkmate() -> None:
+    game = Tournament.play_game(
+        1, _SECOND_CONFIG, _FIRST_CONFIG, "7k/6pp/8/8/R7/8/8/K7 w - - 0 1", 10
+    )
+    assert game.status == GameStatus.CHECKMATE
+    assert game.winner == Color.WHITE
+    assert game.result == "1-0"
+    assert len(game.moves) == 1
+    assert game.to_pgn().endswith("\n\n1. 3070 1-0\n")
+
+
+def test_play_game_move_limit() -> None:
+    game = Tournament.play_game(
+        1, _FIRST_CONFIG, _SECOND_CONFIG, "k7/8/8/8/8/8/8/K6R b - - 0 1", 3
+    )
+    assert game.status == GameStatus.MOVE_LIMIT
+    assert game.winner is None
+    assert [len(game.get_moves(color)) for color in Color] == [1, 2]
+    assert "\n\n1... " in game.to_pgn()
+
+
+def test_run_alternates_colors() -> None:
+    tournament = Tournament(
+        _FIRST_CONFIG, _SECOND_CONFIG, 4, opening_plies=2, max_plies=6
+    )
+    result = tournament.run()
+    assert [game.white for game in result.games] == [
+        "first",
+        "second",
+        "first",
+        "second",
+    ]
+    assert result.games[0].opening_fen == result.games[1].opening_fen
+    assert result.games[0].opening_fen != result.games[2].opening_fen
+    assert result.wins + result.draws + result.losses == 4
+    assert result.get_average_nodes_per_move("second") > 0
+    assert 0 < result.get_average_depth_per_move("second") <= 2
+
+
+def test_elo_difference() -> None:
+    games = []
+    for round_number, winner in enumerate(
+        [Color.WHITE, Color.WHITE, Color.WHITE, None], 1
+    ):
+        game = GameRecord(round_number, "first", "second", "", Color.WHITE)
+        game.moves.append(MoveRecord(0, 1.0, 10))
+        game.winner = winner
+        games.append(game)
+    result = TournamentResult("first", "second", games)
+    assert (result.wins, result.draws, result.losses) == (3, 1, 0)
+
+    elo_difference, elo_margin = result.get_elo_difference()
+    assert math.isclose(elo_difference, 400 * math.log10(7))
+    assert elo_margin > 0
+
+
+def test_elo_difference_whitewash() -> None:
+    games = []
+    for round_number in range(1, 11):
+        game = GameRecord(round_number, "first", "second", "", Color.WHITE)
+        game.winner = Color.WHITE
+        games.append(game)
+    result = TournamentResult("first", "second", games)
+    assert result.get_elo_difference() == (math.inf, math.inf)
+
+    result_dict = json.loads(json.dumps(result.to_dict(), allow_nan=False))
+    assert result_dict["elo"] is None
+    assert result_dict["elo_margin"] is None
@@ -0,0 +1,93 @@
+from enums.bound import Bound
+from models.shared_transposition_table import SharedTranspositionTable
+from models.transposition_table import TranspositionTable
+
+
+def test_store_and_probe() -> None:
+    transposition_table = TranspositionTable(1)
+    assert transposition_table.probe(12345) is None
+
+    transposition_table.store(12345, 3, Bound.LOWER, 1.5, 700)
+    assert transposition_table.probe(12345) == (3, Bound.LOWER, 1.5, 700)
+
+    transposition_table.store(12345, 2, Bound.EXACT, -0.25, None)
+    assert transposition_table.probe(12345) == (2, Bound.EXACT, -0.25, None)
+
+    transposition_table.clear()
+    assert transposition_table.probe(12345) is None
+
+
+def test_replacement_policy() -> None:
+    transposition_table = TranspositionTable(1)
+    bucket_count = transposition_table.capacity // 2
+    deep_key = 7
+    shallow_key = deep_key + bucket_count
+    newest_key = deep_key + 2 * bucket_count
+
+    transposition_table.store(deep_key, 5, Bound.EXACT, 1.0, None)
+    transposition_table.store(shallow_key, 1, Bound.EXACT, 2.0, None)
+    transposition_table.store(newest_key, 1, Bound.EXACT, 3.0, None)
+    assert transposition_table.probe(deep_key) is not None
+    assert transposition_table.probe(shallow_key) is None
+    assert transposition_table.probe(newest_key) is not None
+
+    transposition_table.new_search()
+    transposition_table.store(shallow_key, 1, Bound.EXACT, 2.0, None)
+    assert transposition_table.probe(deep_key) is None
+    assert transposition_table.probe(shallow_key) is not None
+
+
+def test_capacity_is_bounded() -> None:
+    transposition_table = TranspositionTable(1)
+    capacity = transposition_table.capacity
+    assert 0 < capacity <= 1024 * 1024 // 24
+
+    for key in range(1, 3 * capacity):
+        transposition_table.store(key, 1, Bound.EXACT, 0.0, None)
+    assert transposition_table.capacity == capacity
+
+
+def test_torn_entry_is_ignored() -> None:
+    transposition_table = TranspositionTable(1)
+    transposition_table.store(12345, 3, Bound.LOWER, 1.5, 700)
+    bucket_count = transposition_table.capacity // 2
+    entry_index = (12345 % bucket_count) * 6
+
+    # Another writer changed the score but not yet the checksum.
+    transposition_table._scores[entry_index + 2] = 2.5
+    assert transposition_table.probe(12345) is None
+
+
+def test_shared_table_is_visible_when_attached() -> None:
+    owner_table = SharedTranspositionTable(1)
+    attached_table = SharedTranspositionTable(1, owner_table.name)
+    try:
+        owner_table.store(12345, 3, Bound.LOWER, 1.5, 700)
+        assert attached_table.probe(12345) == (3, Bound.LOWER, 1.5, 700)
+
+        attached_table.store(678, 2, Bound.EXACT, -0.25, None)
+        assert owner_table.probe(678) == (2, Bound.EXACT, -0.25, None)
+    finally:
+        attached_table.close()
+        owner_table.close()
+
+
+def test_attached_table_follows_owner_generation() -> None:
+    owner_table = SharedTranspositionTable(1)
+    attached_table = SharedTranspositionTable(1, owner_table.name)
+    try:
+        bucket_count = owner_table.capacity // 2
+        deep_key = 7
+        # Helpers start a search for every task, more often than the main one.
+        owner_table.new_search()
+        for _ in range(3):
+            attached_table.new_search()
+        owner_table.store(deep_key, 5, Bound.EXACT, 1.0, None)
+
+        attached_table.store(deep_key + bucket_count, 1, Bound.EXACT, 2.0, None)
+        attached_table.store(deep_key + 2 * bucket_count, 1, Bound.EXACT, 3.0, None)
+        assert owner_table.probe(deep_key) == (5, Bound.EXACT, 1.0, None)
+        assert attached_table.probe(deep_key) == (5, Bound.EXACT, 1.0, None)
+    finally:
+        attached_table.close()
+        owner_table.close()
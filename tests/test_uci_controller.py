@@ -0,0 +1,88 @@
+import io
+import time
+
+import pytest
+
+from constants.bot_constants import TABLEBASE_WIN_SCORE
+from controllers.uci_controller import UciController
+from enums.color import Color
+from models.bot import Bot
+from models.rules import Rules
+from utils.move_utils import format_uci_move
+
+
+@pytest.fixture
+def output() -> io.StringIO:
+    return io.StringIO()
+
+
+@pytest.fixture
+def controller(output: io.StringIO) -> UciController:
+    return UciController(Bot(0), io.StringIO(), output)
+
+
+def _wait_for_search(controller: UciController) -> None:
+    controller._search_thread.join()
+
+
+def test_handshake(controller: UciController, output: io.StringIO) -> None:
+    controller.handle_command("uci")
+    controller.handle_command("isready")
+    lines = output.getvalue().splitlines()
+    assert lines[0].startswith("id name ")
+    assert lines[-2:] == ["uciok", "readyok"]
+    assert not controller.handle_command("quit")
+
+
+def test_go_depth(controller: UciController, output: io.StringIO) -> None:
+    controller.handle_command("position startpos moves b1c3 g8f6")
+    assert controller._color == Color.WHITE
+    legal_moves = set(
+        map(format_uci_move, Rules.generate_legal_moves(Color.WHITE, controller._board))
+    )
+    controller.handle_command("go depth 3")
+    _wait_for_search(controller)
+
+    lines = output.getvalue().splitlines()
+    info_lines = [line for line in lines if line.startswith("info depth")]
+    assert len(info_lines) == 3
+    assert " nodes " in info_lines[-1] and " nps " in info_lines[-1]
+    command, best_move = lines[-1].split()
+    assert command == "bestmove"
+    assert best_move in legal_moves
+    assert info_lines[-1].split(" pv ")[1].split()[0] == best_move
+
+
+def test_go_mate_score(controller: UciController, output: io.StringIO) -> None:
+    controller.handle_command("position fen 7k/6pp/8/8/R7/8/8/K7 w - - 0 1")
+    controller.handle_command("go depth 3")
+    _wait_for_search(controller)
+    lines = output.getvalue().splitlines()
+    assert " score mate 1 " in lines[-2]
+    assert lines[-1] == "bestmove a4a8"
+
+
+def test_format_tablebase_score() -> None:
+    # A win 7 plies after the end of a 2-ply principal variation is a mate in 5.
+    assert UciController._format_score(TABLEBASE_WIN_SCORE - 7, 2) == "mate 5"
+    assert UciController._format_score(-(TABLEBASE_WIN_SCORE - 6), 2) == "mate -4"
+    assert UciController._format_score(1.5, 2) == "cp 150"
+
+
+def test_go_infinite_stop(controller: UciController, output: io.StringIO) -> None:
+    controller.handle_command("position startpos")
+    controller.handle_command("go infinite")
+    time.sleep(0.1)
+    assert "bestmove" not in output.getvalue()
+
+    start_time = time.perf_counter()
+    controller.handle_command("stop")
+    assert time.perf_counter() - start_time < 1
+    assert output.getvalue().splitlines()[-1].startswith("bestmove ")
+
+
+def test_position_illegal_move(controller: UciController, output: io.StringIO) -> None:
+    # Pawns only move one square in this engine.
+    controller.handle_command("position startpos moves e2e4")
+    assert output.getvalue() == "info string Illegal move: e2e4\n"
+    assert controller._color == Color.WHITE
@@ -0,0 +1,143 @@
+import argparse
+import json
+
+from constants.engine_constants import POSITIONAL_SCORE_WEIGHT
+from enums.search_feature import SearchFeature
+from models.tournament import BotConfig, Tournament
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Play bot-vs-bot games between two settings and compare them."
+    )
+    parser.add_argument("games", type=int, help="number of games")
+    parser.add_argument("--depth", type=int, default=3, help="first bot depth")
+    parser.add_argument(
+        "--second-depth", type=int, help="second bot depth (default: --depth)"
+    )
+    parser.add_argument(
+        "--weight",
+        type=float,
+        default=POSITIONAL_SCORE_WEIGHT,
+        help="first bot positional score weight",
+    )
+    parser.add_argument(
+        "--second-weight",
+        type=float,
+        help="second bot positional score weight (default: --weight)",
+    )
+    feature_choices = [feature.name.lower() for feature in SearchFeature]
+    parser.add_argument(
+        "-f",
+        "--feature",
+        choices=feature_choices,
+        action="append",
+        default=[],
+        help="selective search feature of the first bot (repeatable)",
+    )
+    parser.add_argument(
+        "--second-feature",
+        choices=feature_choices,
+        action="append",
+        default=[],
+        help="selective search feature of the second bot (repeatable)",
+    )
+    parser.add_argument(
+        "-t", "--time-limit", type=float, help="seconds per move for both bots"
+    )
+    parser.add_argument(
+        "-n", "--node-limit", type=int, help="nodes per move for both bots"
+    )
+    parser.add_argument(
+        "-w", "--workers", type=int, default=1, help="worker processes (default: 1)"
+    )
+    parser.add_argument(
+        "--openings",
+        type=argparse.FileType("r"),
+        help="file with one opening FEN per line (default: random openings)",
+    )
+    parser.add_argument(
+        "--opening-plies",
+        type=int,
+        default=4,
+        help="random plies per generated opening (default: 4)",
+    )
+    parser.add_argument(
+        "--max-plies",
+        type=int,
+        default=200,
+        help="plies before a game is drawn (default: 200)",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="opening seed")
+    parser.add_argument(
+        "--pgn", type=argparse.FileType("w"), help="file to write the games to"
+    )
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    args = parser.parse_args()
+
+    first_config = BotConfig(
+        "first",
+        args.depth,
+        args.time_limit,
+        args.node_limit,
+        args.weight,
+        _get_search_features(args.feature),
+    )
+    second_config = BotConfig(
+        "second",
+        args.second_depth or args.depth,
+        args.time_limit,
+        args.node_limit,
+        args.weight if args.second_weight is None else args.second_weight,
+        _get_search_features(args.second_feature),
+    )
+    openings = None
+    if args.openings is not None:
+        openings = [line.strip() for line in args.openings if line.strip()]
+    tournament = Tournament(
+        first_config,
+        second_config,
+        args.games,
+        args.workers,
+        openings,
+        args.opening_plies,
+        args.max_plies,
+        args.seed,
+    )
+    result = tournament.run()
+
+    if args.pgn is not None:
+        args.pgn.write("\n".join(game.to_pgn() for game in result.games))
+
+    if args.json:
+        print(json.dumps(result.to_dict(), indent=2, allow_nan=False))
+        return
+
+    elo_difference, elo_margin = result.get_elo_difference()
+    for config in (first_config, second_config):
+        feature_names = sorted(
+            feature.name.lower() for feature in config.search_features
+        )
+        print(
+            f"{config.name}: depth {config.depth}, "
+            f"weight {config.positional_score_weight}, "
+            f"features: {', '.join(feature_names) or 'none'}"
+        )
+    print(
+        f"  W/D/L: {result.wins}/{result.draws}/{result.losses}, "
+        f"score: {result.score:.3f}, elo: {elo_difference:+.1f} ± {elo_margin:.1f}"
+    )
+    for name in (first_config.name, second_config.name):
+        print(
+            f"  {name}: {result.get_average_seconds_per_move(name):.3f}s, "
+            f"{result.get_average_nodes_per_move(name):.0f} nodes and depth "
+            f"{result.get_average_depth_per_move(name):.2f} per move"
+        )
+
+
+def _get_search_features(feature_names: list[str]) -> frozenset[SearchFeature]:
+    return frozenset(SearchFeature[name.upper()] for name in feature_names)
+
+
+if __name__ == "__main__":
+    main()
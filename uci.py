@@ -0,0 +1,62 @@
+import argparse
+import os
+
+from constants.bot_constants import (
+    OPENING_BOOK_PATH,
+    TABLEBASE_DIRECTORY,
+    TRANSPOSITION_TABLE_SIZE_MB,
+)
+from controllers.uci_controller import UciController
+from enums.search_feature import SearchFeature
+from models.bot import Bot
+from models.opening_book import OpeningBook
+from models.tablebase import Tablebase
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Run the engine over the UCI protocol on stdin and stdout."
+    )
+    parser.add_argument(
+        "--hash",
+        type=int,
+        default=TRANSPOSITION_TABLE_SIZE_MB,
+        help=f"transposition table size in MB (default: {TRANSPOSITION_TABLE_SIZE_MB})",
+    )
+    parser.add_argument(
+        "-w", "--workers", type=int, default=1, help="worker processes (default: 1)"
+    )
+    parser.add_argument(
+        "-f",
+        "--feature",
+        choices=[feature.name.lower() for feature in SearchFeature],
+        action="append",
+        default=[],
+        help="selective search feature (repeatable)",
+    )
+    args = parser.parse_args()
+
+    opening_book = None
+    if os.path.exists(OPENING_BOOK_PATH):
+        opening_book = OpeningBook(OPENING_BOOK_PATH)
+    tablebase = None
+    if os.path.isdir(TABLEBASE_DIRECTORY):
+        tablebase = Tablebase(TABLEBASE_DIRECTORY)
+    bot = Bot(
+        0,
+        transposition_table_size_mb=args.hash,
+        worker_count=args.workers,
+        opening_book=opening_book,
+        tablebase=tablebase,
+        search_features=frozenset(
+            SearchFeature[feature.upper()] for feature in args.feature
+        ),
+    )
+    try:
+        UciController(bot).run()
+    finally:
+        bot.close()
+
+
+if __name__ == "__main__":
+    main()
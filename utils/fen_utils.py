@@ -0,0 +1,78 @@
+from constants.board_constants import BOARD_SIZE
+from constants.piece_constants import PIECE_TYPE_COUNT
+from enums.color import Color
+
+# FEN piece letters in PIECES order: white pieces are upper case.
+_FEN_PIECE_LETTERS = "PNBRQKpnbrqk"
+_FEN_PIECE_INDEXES = {
+    letter: piece_index for piece_index, letter in enumerate(_FEN_PIECE_LETTERS)
+}
+_FEN_COLORS = {"w": Color.WHITE, "b": Color.BLACK}
+_FEN_COLOR_LETTERS = {color: letter for letter, color in _FEN_COLORS.items()}
+
+# Castling, en passant and move counters of every exported FEN.
+_FEN_SUFFIX = "- - 0 1"
+
+# The standard starting position.
+INITIAL_FEN = f"rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w {_FEN_SUFFIX}"
+
+
+def parse_fen(fen: str) -> tuple[list[int], Color]:
+    """Return the bitboards (in PIECES order) and the color to move of a FEN
+    string. Castling, en passant and move counters are ignored since the engine
+    does not track them."""
+    fields = fen.split()
+    if not 1 <= len(fields) <= 6:
+        raise ValueError(f"Invalid FEN: {fen!r}")
+
+    ranks = fields[0].split("/")
+    if len(ranks) != BOARD_SIZE:
+        raise ValueError(f"Invalid FEN piece placement: {fields[0]!r}")
+
+    bitboards = [0] * PIECE_TYPE_COUNT
+    for rank_index, rank in enumerate(ranks):
+        # FEN lists the ranks from black's side of the board.
+        square_shift = (BOARD_SIZE - 1 - rank_index) * BOARD_SIZE
+        rank_end_shift = square_shift + BOARD_SIZE
+        for letter in rank:
+            if letter.isdigit():
+                square_shift += int(letter)
+                continue
+
+            piece_index = _FEN_PIECE_INDEXES.get(letter)
+            if piece_index is None or square_shift >= rank_end_shift:
+                raise ValueError(f"Invalid FEN rank: {rank!r}")
+            bitboards[piece_index] |= 1 << square_shift
+            square_shift += 1
+
+        if square_shift != rank_end_shift:
+            raise ValueError(f"Invalid FEN rank: {rank!r}")
+
+    color = _FEN_COLORS.get(fields[1] if len(fields) > 1 else "w")
+    if color is None:
+        raise ValueError(f"Invalid FEN side to move: {fields[1]!r}")
+    return bitboards, color
+
+
+def format_fen(mailbox: list[int], color: Color) -> str:
+    """Return the FEN string of a board given its mailbox (the piece index on
+    every square, PIECE_TYPE_COUNT or more for empty squares) and the color to
+    move."""
+    ranks = []
+    for row_index in reversed(range(BOARD_SIZE)):
+        rank = ""
+        empty_count = 0
+        row_start_shift = row_index * BOARD_SIZE
+        for piece_index in mailbox[row_start_shift : row_start_shift + BOARD_SIZE]:
+            if piece_index >= PIECE_TYPE_COUNT:
+                empty_count += 1
+                continue
+
+            if empty_count:
+                rank += str(empty_count)
+                empty_count = 0
+            rank += _FEN_PIECE_LETTERS[piece_index]
+        if empty_count:
+            rank += str(empty_count)
+        ranks.append(rank)
+    return f"{'/'.join(ranks)} {_FEN_COLOR_LETTERS[color]} {_FEN_SUFFIX}"
@@ -0,0 +1,147 @@
+from constants.board_constants import BOARD_SIZE
+from constants.piece_constants import COLOR_PIECE_TYPE_COUNT, NO_PIECE_INDEX
+from enums.color import Color
+from models.move import Move
+from models.piece import PIECE_INDEXES, PIECES, Piece
+from utils.bit_utils import get_shift
+
+# A packed move is a single int. From the least significant bit: from square
+# (6 bits), to square (6), moved piece (4), captured piece (4), promotion piece
+# (4), then the capture and promotion flags. Pieces are indexes into PIECES and
+# missing pieces are NO_PIECE_INDEX.
+_SQUARE_BITS = 6
+_SQUARE_MASK = (1 << _SQUARE_BITS) - 1
+_PIECE_BITS = 4
+_PIECE_MASK = (1 << _PIECE_BITS) - 1
+
+_TO_SQUARE_OFFSET = _SQUARE_BITS
+_MOVED_PIECE_OFFSET = 2 * _SQUARE_BITS
+_CAPTURED_PIECE_OFFSET = _MOVED_PIECE_OFFSET + _PIECE_BITS
+_PROMOTION_PIECE_OFFSET = _CAPTURED_PIECE_OFFSET + _PIECE_BITS
+
+CAPTURE_FLAG = 1 << (_PROMOTION_PIECE_OFFSET + _PIECE_BITS)
+PROMOTION_FLAG = CAPTURE_FLAG << 1
+
+# The squares of a move, which is enough to identify it within a position.
+SQUARES_MASK = (1 << _MOVED_PIECE_OFFSET) - 1
+
+_UCI_FILES = "abcdefgh"
+# UCI promotion letters by piece index within a color.
+_UCI_PROMOTION_LETTERS = "pnbrqk"
+
+
+def pack_move(
+    from_square_shift: int,
+    to_square_shift: int,
+    moved_piece_index: int,
+    captured_piece_index: int = NO_PIECE_INDEX,
+    promotion_piece_index: int = NO_PIECE_INDEX,
+) -> int:
+    packed_move = (
+        from_square_shift
+        | to_square_shift << _TO_SQUARE_OFFSET
+        | moved_piece_index << _MOVED_PIECE_OFFSET
+        | captured_piece_index << _CAPTURED_PIECE_OFFSET
+        | promotion_piece_index << _PROMOTION_PIECE_OFFSET
+    )
+    if captured_piece_index != NO_PIECE_INDEX:
+        packed_move |= CAPTURE_FLAG
+    if promotion_piece_index != NO_PIECE_INDEX:
+        packed_move |= PROMOTION_FLAG
+    return packed_move
+
+
+def unpack_move(packed_move: int) -> tuple[int, int, int, int, int]:
+    """Return the from square, to square, moved piece, captured piece and
+    promotion piece of the move."""
+    return (
+        packed_move & _SQUARE_MASK,
+        packed_move >> _TO_SQUARE_OFFSET & _SQUARE_MASK,
+        packed_move >> _MOVED_PIECE_OFFSET & _PIECE_MASK,
+        packed_move >> _CAPTURED_PIECE_OFFSET & _PIECE_MASK,
+        packed_move >> _PROMOTION_PIECE_OFFSET & _PIECE_MASK,
+    )
+
+
+def get_from_square_shift(packed_move: int) -> int:
+    return packed_move & _SQUARE_MASK
+
+
+def get_to_square_shift(packed_move: int) -> int:
+    return packed_move >> _TO_SQUARE_OFFSET & _SQUARE_MASK
+
+
+def get_moved_piece_index(packed_move: int) -> int:
+    return packed_move >> _MOVED_PIECE_OFFSET & _PIECE_MASK
+
+
+def get_captured_piece_index(packed_move: int) -> int:
+    return packed_move >> _CAPTURED_PIECE_OFFSET & _PIECE_MASK
+
+
+def get_promotion_piece_index(packed_move: int) -> int:
+    return packed_move >> _PROMOTION_PIECE_OFFSET & _PIECE_MASK
+
+
+def get_move_color(packed_move: int) -> Color:
+    if get_moved_piece_index(packed_move) < COLOR_PIECE_TYPE_COUNT:
+        return Color.WHITE
+    return Color.BLACK
+
+
+def is_capture(packed_move: int) -> bool:
+    return packed_move & CAPTURE_FLAG != 0
+
+
+def is_promotion(packed_move: int) -> bool:
+    return packed_move & PROMOTION_FLAG != 0
+
+
+def encode_move(move: Move, promotion_piece: Piece | None = None) -> int:
+    """Return the packed form of the move. Moves must have a moving piece."""
+    return pack_move(
+        get_shift(move.from_square_mask),
+        get_shift(move.to_square_mask),
+        PIECE_INDEXES[move.from_piece],
+        NO_PIECE_INDEX if move.to_piece is None else PIECE_INDEXES[move.to_piece],
+        NO_PIECE_INDEX if promotion_piece is None else PIECE_INDEXES[promotion_piece],
+    )
+
+
+def decode_move(packed_move: int) -> Move:
+    """Return the move as a Move. The promotion piece is dropped since Move
+    does not carry one; callers promote with Rules.can_promote as usual."""
+    captured_piece_index = get_captured_piece_index(packed_move)
+    return Move(
+        1 << get_from_square_shift(packed_move),
+        1 << get_to_square_shift(packed_move),
+        PIECES[get_moved_piece_index(packed_move)],
+        (
+            None
+            if captured_piece_index == NO_PIECE_INDEX
+            else PIECES[captured_piece_index]
+        ),
+        get_move_color(packed_move),
+    )
+
+
+def format_move(packed_move: int) -> str:
+    """Return the move in "rcrc" format (row/column → row/column)."""
+    return str(decode_move(packed_move))
+
+
+def format_uci_move(packed_move: int) -> str:
+    """Return the move in UCI long algebraic notation, such as "e2e4" or
+    "b7b8q". Columns are files a to h and rows are ranks 1 to 8."""
+    from_square_shift, to_square_shift, _, _, promotion_piece_index = unpack_move(
+        packed_move
+    )
+    uci_move = ""
+    for square_shift in (from_square_shift, to_square_shift):
+        row_index, column_index = divmod(square_shift, BOARD_SIZE)
+        uci_move += f"{_UCI_FILES[column_index]}{row_index + 1}"
+    if promotion_piece_index != NO_PIECE_INDEX:
+        uci_move += _UCI_PROMOTION_LETTERS[
+            promotion_piece_index % COLOR_PIECE_TYPE_COUNT
+        ]
+    return uci_move
@@ -1,10 +1,25 @@
 from enums.color import Color
 from models.board import Board
-from utils.bit_utils import intersects
+from models.piece import Bishop, King, Knight, Pawn, Queen, Rook
 from utils.board_utils import get_mask
 
 _SCORE_BAR_PADDING = 7
 
+_PIECE_SYMBOLS = {
+    Pawn(Color.WHITE): "♙",
+    Knight(Color.WHITE): "♘",
+    Bishop(Color.WHITE): "♗",
+    Rook(Color.WHITE): "♖",
+    Queen(Color.WHITE): "♕",
+    King(Color.WHITE): "♔",
+    Pawn(Color.BLACK): "♟",
+    Knight(Color.BLACK): "♞",
+    Bishop(Color.BLACK): "♝",
+    Rook(Color.BLACK): "♜",
+    Queen(Color.BLACK): "♛",
+    King(Color.BLACK): "♚",
+}
+
 
 class BoardView:
     @staticmethod
@@ -31,33 +46,7 @@ class BoardView:
                 print(f" │ ", end="")
 
                 square_mask = get_mask(row_index, column_index)
-                if intersects(board._white_pawn_bitboard, square_mask):
-                    print(f"♙", end="")
-                elif intersects(board._white_knight_bitboard, square_mask):
-                    print(f"♘", end="")
-                elif intersects(board._white_bishop_bitboard, square_mask):
-                    print(f"♗", end="")
-                elif intersects(board._white_rook_bitboard, square_mask):
-                    print(f"♖", end="")
-                elif intersects(board._white_queen_bitboard, square_mask):
-                    print(f"♕", end="")
-                elif intersects(board._white_king_bitboard, square_mask):
-                    print(f"♔", end="")
-
-                elif intersects(board._black_pawn_bitboard, square_mask):
-                    print(f"♟", end="")
-                elif intersects(board._black_knight_bitboard, square_mask):
-                    print(f"♞", end="")
-                elif intersects(board._black_bishop_bitboard, square_mask):
-                    print(f"♝", end="")
-                elif intersects(board._black_rook_bitboard, square_mask):
-                    print(f"♜", end="")
-                elif intersects(board._black_queen_bitboard, square_mask):
-                    print(f"♛", end="")
-                elif intersects(board._black_king_bitboard, square_mask):
-                    print(f"♚", end="")
-                else:
-                    print(f" ", end="")
+                print(_PIECE_SYMBOLS.get(board._get_piece(square_mask), " "), end="")
 
             print(" │", end="")
             if score is not None:
@@ -1,4 +1,4 @@
-from constants.bot_constants import MAX_BOT_DEPTH, MIN_BOT_DEPTH
+from constants.bot_constants import BOT_TIME_LIMITS, MAX_BOT_DEPTH, MIN_BOT_DEPTH
 from enums.color import Color
 from enums.game_mode import GameMode
 from enums.promotion_piece import PromotionPiece
@@ -18,6 +18,20 @@ class GameView:
         choices = list(map(str, range(MIN_BOT_DEPTH, MAX_BOT_DEPTH + 1)))
         return int(cls._prompt_choice(message, choices))
 
+    @classmethod
+    def prompt_bot_time_limit(cls) -> float | None:
+        options = [
+            f"({index}) {time_limit}s"
+            for index, time_limit in enumerate(BOT_TIME_LIMITS, 1)
+        ]
+        options.append(f"({len(BOT_TIME_LIMITS) + 1}) no limit")
+        message = f"Choose the AI's time per move: {', '.join(options[:-1])}, or {options[-1]}."
+        choices = list(map(str, range(1, len(BOT_TIME_LIMITS) + 2)))
+        choice = int(cls._prompt_choice(message, choices))
+        if choice > len(BOT_TIME_LIMITS):
+            return None
+        return BOT_TIME_LIMITS[choice - 1]
+
     @classmethod
     def prompt_player_color(cls) -> Color:
         message = f"Choose your color: (1) white, or (2) black."
@@ -25,6 +39,12 @@ class GameView:
         choice = cls._prompt_choice(message, choices)
         return Color.WHITE if choice == "1" else Color.BLACK
 
+    @classmethod
+    def prompt_pondering(cls) -> bool:
+        message = "Let the AI think on your time? (1) yes, or (2) no."
+        choices = ["1", "2"]
+        return cls._prompt_choice(message, choices) == "1"
+
     @staticmethod
     def prompt_move() -> str:
         return input(